@@ -1,1384 +1,500 @@
 import logging
-from logging.handlers import RotatingFileHandler
 import os
+import posixpath
 import sys
-import traceback
+import random
+import time
+import bisect
+import functools
+import gzip
+import zlib
+import hashlib
 import shutil
-from flask import Flask, render_template, request, jsonify, send_file, session, send_from_directory
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import pandas as pd
+import json
+import sqlite3
+import re
+import threading
+import uuid
+from collections import OrderedDict
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from flask import Flask, Blueprint, render_template, request, jsonify, send_file, session, send_from_directory, g, Response, has_request_context
+import click
+from sqlalchemy import event, insert, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from werkzeug.security import safe_join
+from datetime import datetime, timedelta
 from io import BytesIO
-import tempfile
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from flask import Flask, render_template, request, jsonify, send_file, session, send_from_directory
-
-# LOGGING KURULUMU
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        RotatingFileHandler('kutu_dunyasi.log', maxBytes=10000000, backupCount=5),
-        logging.StreamHandler(sys.stdout)
-    ]
+import kutu_dunyasi.gunluk  # Süreç genelindeki log kuyruğu ve dosyası import edilince kurulur
+from kutu_dunyasi.veritabani import (
+    db, UretimEmri, VeriSurumu, UretimPlani, UretimPlaniSatiri, VeriAktarimi, SenkronIslemi, PLAN_ALANLARI,
+    veri_surumu_getir, veri_kimligi_getir
 )
+from kutu_dunyasi.katalog import oneri_onbellegi_metrikleri
+from urunkatologu import urun_katalogu
+
 logger = logging.getLogger(__name__)
 
+def ornekli_debug(mesaj, *args):
+    """
+    İstek içeriği gibi büyük debug kayıtları için: sadece DEBUG seviyesinde ve
+    LOG_ORNEKLEME_ORANI (0-1) olasılıkla yazılır. Varsayılan oran 0 (kapalı).
+    """
+    if logger.isEnabledFor(logging.DEBUG) and random.random() < app.config['LOG_ORNEKLEME_ORANI']:
+        logger.debug(mesaj, *args)
+
 app = Flask(__name__)
 app.secret_key = 'kutu_dunyasi_secret_key_2024'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///kutu_dunyasi_web.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['URUN_KATALOGU_DOSYASI'] = 'urun_katalog.xlsx'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
-
-db = SQLAlchemy(app)
-
-# ÜRÜN KATALOĞU YÜKLEME
-def urun_katalogunu_yukle():
-    """Excel dosyasından ürün kataloğunu yükler"""
+app.config['DISA_AKTARMA_DIZINI'] = os.path.join(app.instance_path, 'disa_aktarma')
+app.config['DISA_AKTARMA_ISCI_SAYISI'] = 2
+app.config['DISA_AKTARMA_KUYRUK_LIMITI'] = 8
+app.config['PDF_ONBELLEK_MAX_BAYT'] = 32 * 1024 * 1024
+app.config['PDF_ONBELLEK_DIZINI'] = None  # Dolu bellekten taşan PDF'ler için disk dizini (None: kapalı)
+app.config['PDF_ONBELLEK_DISK_MAX_BAYT'] = 256 * 1024 * 1024
+app.config['PDF_ISLEM_SAYISI'] = min(4, os.cpu_count() or 1)  # 0: PDF'ler istek thread'inde üretilir
+app.config['PDF_KUYRUK_LIMITI'] = 16
+app.config['PDF_ZAMAN_ASIMI'] = 60
+app.config['PDF_RETRY_AFTER'] = 5
+app.config['TOPLU_PDF_PARCA_BOYUTU'] = 25
+app.config['TOPLU_PDF_MAX_FORM'] = 500
+app.config['URETIM_PLANLARI_DIZINI'] = 'uretim_planlari'  # Sadece eski JSON planlarının içe aktarımı için
+app.config['PLAN_SAYFA_BOYUTU'] = 20
+app.config['ONERI_ONBELLEK_ADEDI'] = 512  # /urun-ara için önbellekte tutulan sorgu sayısı
+app.config['KATALOG_INDEKS_LIMITI'] = 20000  # Bundan büyük kataloglarda istemci indeksi yerine sunucuda arama
+app.config['YAVAS_SORGU_ESIGI'] = 0.1  # sn; bu süreyi aşan sorgular parametreleri ve planıyla loglanır
+app.config['SORGU_SAYISI_UYARI'] = 50  # Tek istekte bu kadar sorgu (N+1 şüphesi) uyarı olarak loglanır
+app.config['SIKISTIRMA_ESIGI'] = 1024  # Bayt; bundan küçük yanıtlar sıkıştırılmaz
+app.config['SIKISTIRMA_SEVIYESI'] = 6  # Dinamik yanıtlar için gzip seviyesi (sabit sayfalar en yüksek seviyede)
+app.config['VARLIK_MAX_AGE'] = 365 * 24 * 3600  # sn; içerik özetli statik dosya adları için (immutable)
+app.config['SENKRON_PARTI_LIMITI'] = 200  # /api/production-sync isteğindeki en fazla işlem sayısı
+app.config['SENKRON_SAKLAMA_GUNU'] = 30  # Uygulanan işlem anahtarları tekrar gönderime karşı bu kadar gün saklanır
+app.config['ESKI_VERITABANI'] = 'kutu_dunyasi_uretim.db'  # Eski masaüstü uygulamasının veritabanı (eski-veritabanini-aktar)
+app.config['AKTARIM_PARTI_BOYUTU'] = 2000  # Eski veritabanı aktarımında tek transaction'da yazılan satır
+app.config['LOG_ORNEKLEME_ORANI'] = 0.0  # İstek içeriği debug kayıtlarının örnekleme oranı (0: kapalı)
+
+# Ortam değişkenleri ayarları ezer: KUTU_DEBUG=true, KUTU_PDF_ISLEM_SAYISI=2 ...
+# (değerler JSON olarak çözülür; veritabanı motoru kurulmadan önce okunmalı)
+app.config.from_prefixed_env('KUTU')
+
+db.init_app(app)
+
+# BLUEPRINT'LER
+# Üretim sayfaları ve API'leri bu dosyadaki 'uretim' blueprint'inde; ürün
+# kataloğu API'si ve sipariş/fiyatlandırma sayfaları urunkatologu.py'deki
+# 'urun_katalogu' blueprint'inde. İkisi de dosyanın sonunda bu uygulamaya
+# bağlanır ve aynı veritabanı, katalog ve log kuyruğunu (kutu_dunyasi) paylaşır.
+uretim = Blueprint('uretim', __name__)
+
+# AĞIR MODÜLLER
+# pandas/openpyxl (katalog ve Excel), pdf_formu/reportlab (PDF) ve pypdf
+# sadece ilgili yollarda gerekiyor; modül başında değil ilk kullanımda
+# fonksiyon içinde import edilir. Gunicorn master'ı bunları fork öncesi
+# agir_modulleri_yukle() ile bir kez yükler, işçiler hazır devralır.
+def agir_modulleri_yukle():
+    """Ağır bağımlılıkları önceden yükler (ısıtma)"""
+    import pandas
+    import openpyxl
+    import pdf_formu
+    pypdf_yukle()
+
+def pypdf_yukle():
+    """Toplu PDF birleştirme için (PdfWriter, PdfReader); pypdf kurulu değilse (None, None)"""
     try:
-        # Excel dosyasını oku
-        df = pd.read_excel('urun_katalog.xlsx', sheet_name='Ürün Kataloğu')
-        
-        # Eksik değerleri temizle ve string işlemleri için hazırla
-        df['Ürün Adı*'] = df['Ürün Adı*'].astype(str).str.strip()
-        df['Bıçak Kodu*'] = df['Bıçak Kodu*'].astype(str).str.strip()
-        
-        # NaN değerleri boş string ile değiştir
-        df = df.fillna('')
-        
-        logger.info(f"Ürün kataloğu başarıyla yüklendi. Toplam {len(df)} ürün.")
-        return df
+        from pypdf import PdfWriter, PdfReader
+    except ImportError:
+        return None, None
+    return PdfWriter, PdfReader
+
+def uretim_verisi_etiketi():
+    """Üretim emri listelerinin ETag değeri (veri sürümünden türetilir)"""
+    return f"uretim-{veri_surumu_getir()}"
+
+def surumlu_yanit(yanit, etiket):
+    """Yanıta zayıf ETag ekler; istemci her kullanımda sürümü doğrular"""
+    yanit.set_etag(etiket, weak=True)
+    yanit.cache_control.no_cache = True
+    return yanit
+
+
+# İSTEK METRİKLERİ
+# Her istek için rota (URL kuralı) bazında gecikme histogramı, durum kodu
+# sayacı ve o anda işlenen istek sayısı tutulur; /metrics uç noktası bunları
+# Prometheus metin biçiminde verir. Sayaçlar süreç içindedir (gunicorn'da
+# her işçi kendi değerlerini raporlar).
+GECIKME_KOVALARI = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class RotaMetrigi:
+    """Tek bir rota + HTTP yöntemi için sayaçlar"""
+    __slots__ = ('kovalar', 'toplam_sure', 'adet', 'durumlar', 'aktif')
+    
+    def __init__(self):
+        self.kovalar = [0] * (len(GECIKME_KOVALARI) + 1)  # son kova: +Inf
+        self.toplam_sure = 0.0
+        self.adet = 0
+        self.durumlar = {}
+        self.aktif = 0
+
+_metrikler = {}
+_metrik_kilidi = threading.Lock()
+
+def _rota_metrigi(anahtar):
+    metrik = _metrikler.get(anahtar)
+    if metrik is None:
+        metrik = _metrikler.setdefault(anahtar, RotaMetrigi())
+    return metrik
+
+@app.before_request
+def metrik_baslat():
+    # Eşleşmeyen URL'ler tek etikette toplanır (etiket sayısı sınırsız büyümesin)
+    rota = request.url_rule.rule if request.url_rule else '<eslesmeyen>'
+    g.metrik_anahtari = (rota, request.method)
+    g.metrik_baslangic = time.perf_counter()
+    with _metrik_kilidi:
+        _rota_metrigi(g.metrik_anahtari).aktif += 1
+
+@app.after_request
+def metrik_durum_kaydet(response):
+    g.metrik_durum = response.status_code
+    return response
+
+@app.teardown_request
+def metrik_bitir(hata=None):
+    anahtar = g.pop('metrik_anahtari', None)
+    if anahtar is None:
+        return
+    sure = time.perf_counter() - g.pop('metrik_baslangic')
+    durum = g.pop('metrik_durum', 500)
+    kova = bisect.bisect_left(GECIKME_KOVALARI, sure)
+    with _metrik_kilidi:
+        metrik = _rota_metrigi(anahtar)
+        metrik.aktif -= 1
+        metrik.adet += 1
+        metrik.toplam_sure += sure
+        metrik.kovalar[kova] += 1
+        metrik.durumlar[durum] = metrik.durumlar.get(durum, 0) + 1
+
+def _etiket_degeri(deger):
+    return str(deger).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def istek_metrikleri_metni():
+    """İstek metriklerini Prometheus metin satırları olarak döndürür"""
+    with _metrik_kilidi:
+        anlik = [(anahtar, list(m.kovalar), m.toplam_sure, m.adet, dict(m.durumlar), m.aktif)
+                 for anahtar, m in sorted(_metrikler.items())]
+    
+    sure_satirlari = [
+        '# HELP kutu_istek_suresi_saniye Rota bazında istek işleme süresi',
+        '# TYPE kutu_istek_suresi_saniye histogram',
+    ]
+    durum_satirlari = [
+        '# HELP kutu_istek_toplam Rota ve durum koduna göre istek sayısı',
+        '# TYPE kutu_istek_toplam counter',
+    ]
+    aktif_satirlari = [
+        '# HELP kutu_aktif_istek Şu anda işlenen istek sayısı',
+        '# TYPE kutu_aktif_istek gauge',
+    ]
+    for (rota, yontem), kovalar, toplam_sure, adet, durumlar, aktif in anlik:
+        etiket = f'rota="{_etiket_degeri(rota)}",yontem="{yontem}"'
+        birikimli = 0
+        for sinir, sayi in zip(GECIKME_KOVALARI + ('+Inf',), kovalar):
+            birikimli += sayi
+            sure_satirlari.append(f'kutu_istek_suresi_saniye_bucket{{{etiket},le="{sinir}"}} {birikimli}')
+        sure_satirlari.append(f'kutu_istek_suresi_saniye_sum{{{etiket}}} {toplam_sure:.6f}')
+        sure_satirlari.append(f'kutu_istek_suresi_saniye_count{{{etiket}}} {adet}')
+        for durum, sayi in sorted(durumlar.items()):
+            durum_satirlari.append(f'kutu_istek_toplam{{{etiket},durum="{durum}"}} {sayi}')
+        aktif_satirlari.append(f'kutu_aktif_istek{{{etiket}}} {aktif}')
+    return sure_satirlari + durum_satirlari + aktif_satirlari
+
+@uretim.route('/metrics')
+def metrics():
+    """Prometheus metin biçiminde metrikler"""
+    try:
+        metin = '\n'.join(istek_metrikleri_metni() + oneri_onbellegi_metrikleri()) + '\n'
+        return Response(metin, content_type='text/plain; version=0.0.4; charset=utf-8')
     except Exception as e:
-        logger.error(f"Ürün kataloğu yükleme hatası: {e}")
-        # Boş bir DataFrame döndür
-        return pd.DataFrame(columns=['Ürün Adı*', 'Bıçak Kodu*', 'Bıçak Ebadı En (mm)*', 'Bıçak Ebadı Boy (mm)*'])
+        logger.error(f"Metrik hatası: {e}")
+        return Response('', status=500)
+
+# SQL SORGU ÖLÇÜMÜ
+# Engine olaylarıyla her istekte çalışan sorgu sayısı ve toplam veritabanı
+# süresi tutulur. Debug modunda yanıta Server-Timing başlığı eklenir.
+# Eşiği aşan sorgular parametreleri ve EXPLAIN QUERY PLAN çıktısıyla loglanır.
+@event.listens_for(Engine, 'before_cursor_execute')
+def sorgu_baslat(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('sorgu_baslangic', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def sorgu_bitir(conn, cursor, statement, parameters, context, executemany):
+    sure = time.perf_counter() - conn.info['sorgu_baslangic'].pop()
+    if has_request_context():
+        g.sql_sayisi = g.get('sql_sayisi', 0) + 1
+        g.sql_suresi = g.get('sql_suresi', 0.0) + sure
+    if sure >= app.config['YAVAS_SORGU_ESIGI']:
+        yavas_sorgu_logla(conn, statement, parameters, sure, executemany)
+
+def sorgu_plani(conn, statement, parameters):
+    """SQLite için EXPLAIN QUERY PLAN çıktısını döndürür (ayrı bir ham cursor ile)"""
+    if conn.dialect.name != 'sqlite' or not statement.lstrip().upper().startswith('SELECT'):
+        return ''
+    # Asıl sorgunun sonuçları henüz okunmadı; aynı cursor kullanılmamalı
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+        return '; '.join(str(satir[-1]) for satir in cursor.fetchall())
+    finally:
+        cursor.close()
 
-# TÜM ÜRÜN LİSTESİNİ GETİR
-def tum_urun_listesi():
-    """Tüm ürün listesini getirir"""
+def yavas_sorgu_logla(conn, statement, parameters, sure, executemany):
     try:
-        urun_katalogu = urun_katalogunu_yukle()
-        if urun_katalogu.empty:
-            return []
-        
-        # Ürün adlarını temizle ve sırala
-        urun_listesi = urun_katalogu['Ürün Adı*'].dropna().unique().tolist()
-        urun_listesi = [urun.strip() for urun in urun_listesi if urun.strip()]
-        urun_listesi.sort()
-        
-        return urun_listesi
+        plan = '' if executemany else sorgu_plani(conn, statement, parameters)
     except Exception as e:
-        logger.error(f"Ürün listesi getirme hatası: {e}")
-        return []
-
-# ÜRÜN BİLGİSİ GETİRME FONKSİYONU
-def urun_bilgisi_getir(urun_adi):
-    """
-    Ürün adına göre bıçak kodu ve ebatlarını getirir
-    """
+        plan = f'alınamadı ({e})'
+    rota = request.path if has_request_context() else '-'
+    logger.warning(f"Yavaş sorgu ({sure * 1000:.0f} ms, {rota}): {' '.join(statement.split())} "
+                   f"| parametreler: {parameters!r} | plan: {plan}")
+
+@app.after_request
+def sql_zamanlama_basligi(response):
+    sayi = g.get('sql_sayisi', 0)
+    if sayi >= app.config['SORGU_SAYISI_UYARI']:
+        logger.warning(f"Çok sayıda sorgu: {request.method} {request.path} {sayi} sorgu, "
+                       f"{g.get('sql_suresi', 0.0) * 1000:.1f} ms")
+    if app.debug:
+        response.headers.add('Server-Timing', f'db;dur={g.get("sql_suresi", 0.0) * 1000:.1f};desc="{sayi} sorgu"')
+        response.headers['X-Sorgu-Sayisi'] = str(sayi)
+    return response
+
+# YANIT SIKIŞTIRMA
+# HTML/JSON/CSS/JS yanıtları istemcinin Accept-Encoding başlığına göre
+# brotli (kuruluysa) veya gzip ile sıkıştırılır. Dinamik yanıtlar her
+# seferinde, sabit_sayfa() ile dönen sayfalar ise bir kez en yüksek seviyede
+# sıkıştırılıp önbellekten verilir. Akış (stream) yanıtları parça parça
+# sıkıştırılır. PDF/Excel gibi zaten sıkıştırılmış dosyalara dokunulmaz.
+try:
+    import brotli  # Opsiyonel; tarayıcılar br'yi sadece HTTPS üzerinde ister
+except ImportError:
+    brotli = None
+
+SIKISTIRILABILIR_TURLER = {
+    'text/html', 'text/plain', 'text/css', 'text/csv', 'text/javascript',
+    'application/javascript', 'application/json', 'image/svg+xml',
+}
+_sabit_govde_onbellegi = OrderedDict()
+_sabit_govde_kilidi = threading.Lock()
+SABIT_GOVDE_ONBELLEK_ADEDI = 32
+
+def sabit_sayfa(html):
+    """İçeriği değişmeyen sayfa yanıtı; ETag ile doğrulanır, sıkıştırılmış hali önbellekten verilir"""
+    yanit = Response(html, mimetype='text/html')
+    yanit.sabit_govde = True
+    # Aynı gövde gzip/br ile de gönderildiği için zayıf ETag kullanılır
+    yanit.set_etag(hashlib.sha1(yanit.get_data()).hexdigest()[:16], weak=True)
+    yanit.cache_control.no_cache = True
+    return yanit.make_conditional(request)
+
+def kodlama_sec():
+    """İstemcinin kabul ettiği en iyi içerik kodlamasını döndürür (yoksa None)"""
+    kabul = request.accept_encodings
+    if brotli is not None and kabul['br'] > 0:
+        return 'br'
+    if kabul['gzip'] > 0:
+        return 'gzip'
+    return None
+
+def sikistir(veri, kodlama, en_yuksek=False):
+    if kodlama == 'br':
+        return brotli.compress(veri, quality=11 if en_yuksek else 5)
+    return gzip.compress(veri, compresslevel=9 if en_yuksek else app.config['SIKISTIRMA_SEVIYESI'], mtime=0)
+
+def sabit_govde_sikistir(veri, kodlama):
+    """Aynı gövdenin sıkıştırılmış halini içerik özetiyle önbellekte tutar"""
+    anahtar = (kodlama, hashlib.sha1(veri).digest())
+    with _sabit_govde_kilidi:
+        sikistirilmis = _sabit_govde_onbellegi.get(anahtar)
+        if sikistirilmis is not None:
+            _sabit_govde_onbellegi.move_to_end(anahtar)
+            return sikistirilmis
+    sikistirilmis = sikistir(veri, kodlama, en_yuksek=True)
+    with _sabit_govde_kilidi:
+        _sabit_govde_onbellegi[anahtar] = sikistirilmis
+        while len(_sabit_govde_onbellegi) > SABIT_GOVDE_ONBELLEK_ADEDI:
+            _sabit_govde_onbellegi.popitem(last=False)
+    return sikistirilmis
+
+def akisi_sikistir(parcalar, kodlama):
+    """Akış yanıtını parça parça sıkıştırır; her parça istemciye hemen iletilebilir"""
+    if kodlama == 'br':
+        sikistirici = brotli.Compressor(quality=5)
+        for parca in parcalar:
+            cikti = sikistirici.process(parca) + sikistirici.flush()
+            if cikti:
+                yield cikti
+        yield sikistirici.finish()
+    else:
+        sikistirici = zlib.compressobj(app.config['SIKISTIRMA_SEVIYESI'], zlib.DEFLATED, 31)  # 31: gzip başlığı
+        for parca in parcalar:
+            cikti = sikistirici.compress(parca) + sikistirici.flush(zlib.Z_SYNC_FLUSH)
+            if cikti:
+                yield cikti
+        yield sikistirici.flush()
+
+@app.after_request
+def yaniti_sikistir(response):
+    if (response.status_code < 200 or response.status_code in (204, 206, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in SIKISTIRILABILIR_TURLER):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    kodlama = kodlama_sec()
+    if kodlama is None:
+        return response
+    
+    if response.is_streamed:
+        response.response = akisi_sikistir(response.iter_encoded(), kodlama)
+        response.headers.pop('Content-Length', None)
+        response.headers['Content-Encoding'] = kodlama
+        return response
+    
+    govde = response.get_data()
+    if len(govde) < app.config['SIKISTIRMA_ESIGI']:
+        return response
+    
+    if getattr(response, 'sabit_govde', False):
+        response.set_data(sabit_govde_sikistir(govde, kodlama))
+    else:
+        response.set_data(sikistir(govde, kodlama))
+    response.headers['Content-Encoding'] = kodlama
+    return response
+
+# STATİK VARLIKLAR
+# Sayfa kabuklarındaki CSS/JS dosyaları ve static/vendor altındaki Bootstrap
+# ile Font Awesome kopyaları şablonlara varlik_url() ile içerik özetli adla
+# yazılır (css/urun_takip.3f2a9c1b0d.css). Özet doğruysa dosya bir yıl
+# "immutable" önbelleğe alınır; dosya değişince adı da değiştiği için
+# tarayıcı yenisini ister. Özetsiz ya da eski özetli istekler güncel dosyayı
+# önbelleksiz (sadece doğrulamalı) alır. CSS içindeki göreli url()'ler
+# (Font Awesome yazı tipleri gibi) da özetli adlarla yeniden yazılır.
+_varlik_kayitlari = {}
+_OZETLI_AD = re.compile(r'^(?P<kok>.+)\.(?P<ozet>[0-9a-f]{10})(?P<uzanti>\.[A-Za-z0-9]+)$')
+_CSS_ADRESI = re.compile(r'url\((?P<tirnak>["\']?)(?P<adres>[^)"\'?#]+)(?P<ek>[^)"\']*)(?P=tirnak)\)')
+
+def ozetli_ad(yol, ozet):
+    kok, uzanti = posixpath.splitext(yol)
+    return f"{kok}.{ozet}{uzanti}"
+
+def css_adreslerini_ozetle(css, yol):
+    """CSS içindeki göreli url() adreslerini özetli dosya adlarıyla değiştirir"""
+    dizin = posixpath.dirname(yol)
+    def degistir(eslesme):
+        adres = eslesme['adres']
+        if adres.startswith(('/', 'data:')) or '://' in adres:
+            return eslesme.group(0)
+        try:
+            ozet = varlik_ozeti(posixpath.normpath(posixpath.join(dizin, adres)))
+        except OSError:
+            return eslesme.group(0)
+        return f"url({eslesme['tirnak']}{ozetli_ad(adres, ozet)}{eslesme['ek']}{eslesme['tirnak']})"
+    return _CSS_ADRESI.sub(degistir, css)
+
+def varlik_kaydi(yol):
+    """(mtime, özet, css içeriği) üçlüsü; dosya değişmedikçe önbellekten"""
+    tam_yol = safe_join(app.static_folder, yol)
+    if tam_yol is None:
+        raise FileNotFoundError(yol)
+    mtime = os.stat(tam_yol).st_mtime_ns
+    kayit = _varlik_kayitlari.get(yol)
+    if kayit is None or kayit[0] != mtime:
+        with open(tam_yol, 'rb') as dosya:
+            icerik = dosya.read()
+        css = None
+        if yol.endswith('.css'):
+            # Özet yeniden yazılmış içerikten alınır; yazı tipi değişirse CSS'in adı da değişir
+            css = icerik = css_adreslerini_ozetle(icerik.decode('utf-8'), yol).encode('utf-8')
+        kayit = (mtime, hashlib.sha1(icerik).hexdigest()[:10], css)
+        _varlik_kayitlari[yol] = kayit
+    return kayit
+
+def varlik_ozeti(yol):
+    """static/ altındaki dosyanın içerik özeti"""
+    return varlik_kaydi(yol)[1]
+
+@app.template_global()
+def varlik_url(yol):
+    """Statik dosyanın içerik özetli URL'si"""
+    return f"{app.static_url_path}/{ozetli_ad(yol, varlik_ozeti(yol))}"
+
+def statik_dosya(filename):
+    """Flask'ın static route'u; özetli adları çözer ve önbellek başlıklarını belirler"""
+    eslesme = _OZETLI_AD.match(filename)
+    yol = eslesme['kok'] + eslesme['uzanti'] if eslesme else filename
     try:
-        urun_katalogu = urun_katalogunu_yukle()
-        
-        if urun_katalogu.empty:
-            return None
-            
-        urun_adi_aranan = urun_adi.strip()
-        
-        # Tam eşleşme ara
-        bulunan_urun = urun_katalogu[urun_katalogu['Ürün Adı*'] == urun_adi_aranan]
-        
-        if not bulunan_urun.empty:
-            urun_bilgisi = bulunan_urun.iloc[0]
-            
-            bicak_kodu = urun_bilgisi['Bıçak Kodu*']
-            en = urun_bilgisi['Bıçak Ebadı En (mm)*']
-            boy = urun_bilgisi['Bıçak Ebadı Boy (mm)*']
-            
-            # Bıçak kodu boşsa uygun mesaj döndür
-            if pd.isna(bicak_kodu) or bicak_kodu == 'nan' or bicak_kodu == '':
-                bicak_kodu = "Bıçak Kodu Bulunamadı"
-            
-            return {
-                'bicak_kodu': bicak_kodu,
-                'en': en,
-                'boy': boy,
-                'urun_adi': urun_adi_aranan  # Tam ürün adını da döndür
-            }
+        _, ozet, css = varlik_kaydi(yol)
+    except (OSError, UnicodeDecodeError):
+        ozet = css = None
+    kalici = eslesme is not None and ozet == eslesme['ozet']
+    max_age = app.config['VARLIK_MAX_AGE'] if kalici else None
+    
+    # Gövde gzip/br ile sıkıştırılıp da gönderildiği için ETag'ler zayıftır
+    if css is not None:
+        yanit = Response(css, mimetype='text/css')
+        yanit.set_etag(ozet, weak=True)
+        if max_age:
+            yanit.cache_control.public = True
+            yanit.cache_control.max_age = max_age
         else:
-            return None
-            
-    except Exception as e:
-        logger.error(f"Ürün bilgisi getirme hatası: {e}")
-        return None
-
-# Veritabanı Modeli - Üretim Emri
-class UretimEmri(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    musteri_adi = db.Column(db.String(200), nullable=False)
-    urun_adi = db.Column(db.String(200))
-    usiparis_miktari = db.Column(db.String(50))
-    tabaka_adedi = db.Column(db.String(50))
-    kagit_cinsi = db.Column(db.String(100))
-    gramaj = db.Column(db.String(50))
-    kagit_olcusu_1 = db.Column(db.String(50))
-    kagit_olcusu_2 = db.Column(db.String(50))
-    bicak_kodu = db.Column(db.String(100))
-    bicak_olcusu_1 = db.Column(db.String(50))
-    bicak_olcusu_2 = db.Column(db.String(50))
-    renk_sayisi = db.Column(db.String(50))
-    renk_bilgisi = db.Column(db.String(100))
-    verim = db.Column(db.String(50))
-    selefon_1 = db.Column(db.String(50))
-    selefon_2 = db.Column(db.String(50))
-    varak_yaldiz = db.Column(db.String(50))
-    gofre = db.Column(db.String(50))
-    yapistirma = db.Column(db.String(50))
-    paketleme = db.Column(db.String(100))
-    siparis_durumu = db.Column(db.String(50))
-    notlar = db.Column(db.Text)
-    baski_adedi = db.Column(db.String(50))
-    selefon_adedi = db.Column(db.String(50))
-    kesim_adedi = db.Column(db.String(50))
-    karton_agirligi = db.Column(db.String(50))
-    tarih = db.Column(db.String(50))
-    olusturma_tarihi = db.Column(db.DateTime, default=datetime.now)
-
-# ANA SAYFA ŞABLONU - SADECE ÜRÜN TAKİP BUTONU
-ANA_SAYFA_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>KUTU DÜNYASI - Ana Sayfa</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        .navbar-brand { 
-            font-weight: bold; 
-            color: #dc3545 !important;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        .navbar-logo {
-            height: 35px;
-            width: auto;
-            border-radius: 4px;
-        }
-        .firma-logo {
-            max-height: 120px;
-            width: auto;
-            margin-bottom: 20px;
-            border-radius: 10px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }
-        .main-container {
-            min-height: 80vh;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-        }
-        .btn-module {
-            width: 400px;
-            height: 150px;
-            margin: 20px;
-            font-size: 1.8rem;
-            font-weight: bold;
-            border-radius: 15px;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            transition: all 0.3s ease;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        .btn-module:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-        }
-        .btn-module i {
-            font-size: 3rem;
-            margin-bottom: 10px;
-        }
-        
-        /* ÜRÜN TAKİP BUTONU - MAVİ */
-        .btn-urun-takip {
-            background: linear-gradient(135deg, #2196F3, #1976D2);
-            border: none;
-            color: white;
-        }
-        
-        /* ÜRETİM PLANLAMA BUTONU - MOR */
-        .btn-uretim-planlama {
-            background: linear-gradient(135deg, #9C27B0, #7B1FA2);
-            border: none;
-            color: white;
-        }
-        
-        .module-description {
-            font-size: 1rem;
-            opacity: 0.9;
-            margin-top: 5px;
-        }
-        .firma-bilgi { 
-            text-align: center; 
-            background: linear-gradient(135deg, #e9ecef 0%, #f8f9fa 100%);
-            padding: 25px; 
-            border-radius: 15px; 
-            margin-bottom: 40px;
-            border: 2px solid #dee2e6;
-            max-width: 600px;
-        }
-        
-        /* İki buton yan yana düzeni */
-        .modules-row {
-            display: flex;
-            flex-wrap: wrap;
-            justify-content: center;
-            gap: 30px;
-        }
-        
-        /* Mobil uyumluluk */
-        @media (max-width: 768px) {
-            .btn-module {
-                width: 90%;
-                max-width: 350px;
-                height: 130px;
-                font-size: 1.5rem;
-            }
-            .modules-row {
-                flex-direction: column;
-                align-items: center;
-            }
-            .firma-bilgi {
-                padding: 20px;
-                margin-bottom: 30px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-expand-lg navbar-dark bg-dark">
-        <div class="container">
-            <a class="navbar-brand" href="/">
-                <img src="/logo" alt="Kutu Dünyası" class="navbar-logo" onerror="this.style.display='none'">
-                <span>KUTU DÜNYASI</span>
-            </a>
-        </div>
-    </nav>
-
-    <div class="container mt-4">
-        <div class="main-container">
-            <!-- Firma Bilgisi -->
-            <div class="firma-bilgi">
-                <img src="/logo" alt="Kutu Dünyası" class="firma-logo" onerror="this.style.display='none'">
-                <h2 class="text-primary mb-3">KUTU DÜNYASI</h2>
-                <p class="mb-1 text-muted">YUNUS EMRE MAH. 296. SK. NO: 6/2</p>
-                <p class="mb-1 text-muted">ESENYURT/İSTANBUL 34510</p>
-                <p class="mb-0 text-muted">0(212) 812 36 86 - 0(532) 233 39 96</p>
-            </div>
-
-            <!-- İki Modül Butonu - YAN YANA -->
-            <div class="modules-row">
-                <div class="text-center">
-                    <button class="btn btn-module btn-urun-takip" onclick="window.location.href='/urun-takip'">
-                        <i class="fas fa-clipboard-list"></i>
-                        Ürün Takip Formu
-                        <div class="module-description">Üretim takip ve yönetim sistemi</div>
-                    </button>
-                </div>
-                
-                <div class="text-center">
-                    <button class="btn btn-module btn-uretim-planlama" onclick="window.location.href='/uretim-planlama'">
-                        <i class="fas fa-calendar-alt"></i>
-                        Üretim Planlama
-                        <div class="module-description">Excel benzeri üretim planlama tablosu</div>
-                    </button>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        // Klavye kısayolları
-        document.addEventListener('keydown', function(event) {
-            if (event.key === '1' || event.key === 'Enter') {
-                window.location.href = '/urun-takip';
-            }
-            if (event.key === '2') {
-                window.location.href = '/uretim-planlama';
-            }
-        });
-        
-        // Fare ile hover efekti
-        document.querySelectorAll('.btn-module').forEach(button => {
-            button.addEventListener('mouseenter', function() {
-                this.style.transform = 'translateY(-5px)';
-                this.style.boxShadow = '0 8px 16px rgba(0,0,0,0.2)';
-            });
-            
-            button.addEventListener('mouseleave', function() {
-                this.style.transform = 'translateY(0)';
-                this.style.boxShadow = '0 4px 8px rgba(0,0,0,0.1)';
-            });
-        });
-    </script>
-</body>
-</html>
-"""
-
-# ÜRÜN TAKİP FORM ŞABLONU
-URUN_TAKIP_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>KUTU DÜNYASI - Ürün Takip Formu</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        .navbar-brand { 
-            font-weight: bold; 
-            color: #dc3545 !important;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        .navbar-logo {
-            height: 35px;
-            width: auto;
-            border-radius: 4px;
-        }
-        .firma-logo {
-            max-height: 80px;
-            width: auto;
-            margin-bottom: 15px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
-        .btn-primary { background-color: #2196F3; border-color: #2196F3; }
-        .btn-success { background-color: #4CAF50; border-color: #4CAF50; }
-        .btn-danger { background-color: #f44336; border-color: #f44336; }
-        .btn-warning { background-color: #FF9800; border-color: #FF9800; }
-        .btn-info { background-color: #9C27B0; border-color: #9C27B0; }
-        .btn-ana-sayfa {
-            background-color: #6c757d;
-            border-color: #6c757d;
-            color: white;
-        }
-        .form-section { background: #f8f9fa; padding: 20px; border-radius: 10px; margin-bottom: 20px; }
-        .section-title { color: #2196F3; border-bottom: 2px solid #2196F3; padding-bottom: 10px; margin-bottom: 15px; }
-        .firma-bilgi { 
-            text-align: center; 
-            background: linear-gradient(135deg, #e9ecef 0%, #f8f9fa 100%);
-            padding: 20px; 
-            border-radius: 10px; 
-            margin-bottom: 20px;
-            border: 2px solid #dee2e6;
-        }
-        .btn { margin: 2px; }
-        .modal-lg { max-width: 90%; }
-        .table-hover tbody tr:hover { background-color: rgba(0,0,0,.075); }
-        .form-alt-alta .row { margin-bottom: 12px; }
-        .form-alt-alta .form-label { font-weight: bold; margin-bottom: 5px; }
-        .hesaplanan-alan { background-color: #e9ffe9 !important; font-weight: bold; }
-        .pdf-only-section { display: none; }
-        .auto-fill-section { background: #e8f4fd; border-left: 4px solid #2196F3; }
-        
-        /* Autocomplete Stilleri */
-        .autocomplete {
-            position: relative;
-            display: inline-block;
-            width: 100%;
-        }
-        .autocomplete-items {
-            position: absolute;
-            border: 1px solid #d4d4d4;
-            border-bottom: none;
-            border-top: none;
-            z-index: 99;
-            top: 100%;
-            left: 0;
-            right: 0;
-            max-height: 200px;
-            overflow-y: auto;
-        }
-        .autocomplete-items div {
-            padding: 10px;
-            cursor: pointer;
-            background-color: #fff;
-            border-bottom: 1px solid #d4d4d4;
-        }
-        .autocomplete-items div:hover {
-            background-color: #e9e9e9;
-        }
-        .autocomplete-active {
-            background-color: DodgerBlue !important;
-            color: #ffffff;
-        }
-        .urun-list-modal .modal-dialog {
-            max-width: 800px;
-        }
-        .urun-list-item {
-            cursor: pointer;
-            padding: 10px;
-            border-bottom: 1px solid #eee;
-        }
-        .urun-list-item:hover {
-            background-color: #f8f9fa;
-        }
-        .urun-list-item:last-child {
-            border-bottom: none;
-        }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-expand-lg navbar-dark bg-dark">
-        <div class="container">
-            <a class="navbar-brand" href="/">
-                <img src="/logo" alt="Kutu Dünyası" class="navbar-logo" onerror="this.style.display='none'">
-                <span>KUTU DÜNYASI</span>
-            </a>
-        </div>
-    </nav>
-
-    <div class="container mt-4">
-        <!-- Geri Dön Butonu -->
-        <div class="row mb-3">
-            <div class="col-12">
-                <button class="btn btn-ana-sayfa" onclick="window.location.href='/'">
-                    <i class="fas fa-arrow-left"></i> Ana Sayfaya Dön
-                </button>
-            </div>
-        </div>
-
-        <!-- Firma Bilgisi - Logo ile -->
-        <div class="firma-bilgi">
-            <img src="/logo" alt="Kutu Dünyası" class="firma-logo" onerror="this.style.display='none'">
-            <h4 class="text-primary">KUTU DÜNYASI</h4>
-            <p class="mb-1 text-muted">YUNUS EMRE MAH. 296. SK. NO: 6/2</p>
-            <p class="mb-1 text-muted">ESENYURT/İSTANBUL 34510</p>
-            <p class="mb-0 text-muted">0(212) 812 36 86 - 0(532) 233 39 96</p>
-        </div>
-
-        <h2 class="text-center mb-4">Ürün Takip Formu</h2>
-
-        <!-- Arama Çubuğu -->
-        <div class="row mb-3">
-            <div class="col-md-6">
-                <div class="input-group">
-                    <input type="text" id="searchInput" class="form-control" placeholder="Müşteri, Ürün veya Bıçak Kodu ara...">
-                    <button class="btn btn-outline-primary" onclick="searchRecords()">
-                        <i class="fas fa-search"></i> Ara
-                    </button>
-                </div>
-            </div>
-        </div>
-
-        <!-- Form -->
-        <form id="uretimForm" class="form-alt-alta">
-            
-            <!-- MÜŞTERİ BİLGİLERİ -->
-            <div class="form-section">
-                <h4 class="section-title">Müşteri Bilgileri</h4>
-                
-                <div class="row">
-                    <div class="col-md-6">
-                        <label class="form-label">Müşteri Adı *</label>
-                        <input type="text" class="form-control" name="musteri_adi" required>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-6">
-                        <label class="form-label">Ürün Adı</label>
-                        <div class="input-group">
-                            <input type="text" class="form-control" name="urun_adi" id="urun_adi" placeholder="Ürün adını yazın veya listeden seçin..." autocomplete="off">
-                            <button type="button" class="btn btn-outline-info" onclick="showUrunListesi()">
-                                <i class="fas fa-list"></i> Liste
-                            </button>
-                            <button type="button" class="btn btn-outline-success" onclick="urunBilgisiGetir()">
-                                <i class="fas fa-search"></i> Getir
-                            </button>
-                        </div>
-                        <small class="form-text text-muted">Ürün adını yazmaya başlayın veya liste butonundan seçin</small>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Tarih</label>
-                        <input type="text" class="form-control" name="tarih" value="{{ bugun }}">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Üretim/Sipariş Miktarı</label>
-                        <input type="text" class="form-control" name="usiparis_miktari">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Sipariş Durumu</label>
-                        <select class="form-select" name="siparis_durumu">
-                            <option value="RPT">RPT</option>
-                            <option value="YENİ">YENİ</option>
-                        </select>
-                    </div>
-                </div>
-            </div>
-
-            <!-- OTOMATİK DOLDURULACAK BILGILER -->
-            <div class="form-section auto-fill-section">
-                <h4 class="section-title"><i class="fas fa-magic"></i> Otomatik Bilgiler</h4>
-                
-                <div class="row">
-                    <div class="col-md-6">
-                        <label class="form-label">Bıçak Kodu</label>
-                        <input type="text" class="form-control" name="bicak_kodu" id="bicak_kodu" readonly style="background-color: #f8f9fa;">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-6">
-                        <label class="form-label">Bıçak Ölçüsü (mm)</label>
-                        <div class="input-group">
-                            <input type="text" class="form-control" name="bicak_olcusu_1" id="bicak_olcusu_1" placeholder="En" readonly style="background-color: #f8f9fa;">
-                            <span class="input-group-text">x</span>
-                            <input type="text" class="form-control" name="bicak_olcusu_2" id="bicak_olcusu_2" placeholder="Boy" readonly style="background-color: #f8f9fa;">
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- BASKI BİLGİLERİ -->
-            <div class="form-section">
-                <h4 class="section-title">Baskı Bilgileri</h4>
-                
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Renk Sayısı</label>
-                        <input type="text" class="form-control" name="renk_sayisi">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Renk Bilgisi</label>
-                        <input type="text" class="form-control" name="renk_bilgisi">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Verim</label>
-                        <input type="text" class="form-control" name="verim">
-                    </div>
-                </div>
-            </div>
-
-            <!-- MALZEME BİLGİLERİ -->
-            <div class="form-section">
-                <h4 class="section-title">Malzeme Bilgileri</h4>
-                
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Kağıt/Karton Cinsi</label>
-                        <select class="form-select" name="kagit_cinsi">
-                            <option value="Krome">Krome</option>
-                            <option value="Amerikan Bristol">Amerikan Bristol</option>
-                            <option value="Diğer">Diğer</option>
-                        </select>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Gramaj (gr/m²)</label>
-                        <input type="text" class="form-control" name="gramaj" id="gramaj" onchange="hesaplaAgirlik()">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-6">
-                        <label class="form-label">Kağıt Ölçüsü (mm)</label>
-                        <div class="input-group">
-                            <input type="text" class="form-control" name="kagit_olcusu_1" id="kagit_olcusu_1" placeholder="En" onchange="hesaplaAgirlik()">
-                            <span class="input-group-text">x</span>
-                            <input type="text" class="form-control" name="kagit_olcusu_2" id="kagit_olcusu_2" placeholder="Boy" onchange="hesaplaAgirlik()">
-                        </div>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Tabaka Adedi</label>
-                        <input type="text" class="form-control" name="tabaka_adedi" id="tabaka_adedi" onchange="hesaplaAgirlik()">
-                    </div>
-                </div>
-
-                <!-- HESAPLANAN AĞIRLIK -->
-                <div class="row">
-                    <div class="col-md-4">
-                        <label class="form-label">Kartonun Ağırlığı (kg)</label>
-                        <input type="text" class="form-control hesaplanan-alan" id="karton_agirligi_goster" value="Hesaplanacak" readonly>
-                        <input type="hidden" name="karton_agirligi" id="karton_agirligi">
-                        <small class="form-text text-muted">* Otomatik hesaplanır</small>
-                    </div>
-                </div>
-            </div>
-
-            <!-- FİNİSAJ BİLGİLERİ -->
-            <div class="form-section">
-                <h4 class="section-title">Finisaj Bilgileri</h4>
-                
-                <div class="row">
-                    <div class="col-md-4">
-                        <label class="form-label">Selefon</label>
-                        <div class="input-group">
-                            <select class="form-select" name="selefon_1">
-                                <option value="MAT">MAT</option>
-                                <option value="PARLAK">PARLAK</option>
-                                <option value="SEDEF">SEDEF</option>
-                                <option value="YOK">YOK</option>
-                            </select>
-                            <span class="input-group-text">x</span>
-                            <select class="form-select" name="selefon_2">
-                                <option value="SEDEF">SEDEF</option>
-                                <option value="MAT">MAT</option>
-                                <option value="PARLAK">PARLAK</option>
-                                <option value="YOK">YOK</option>
-                            </select>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-2">
-                        <label class="form-label">Varak Yaldız</label>
-                        <select class="form-select" name="varak_yaldiz">
-                            <option value="YOK">YOK</option>
-                            <option value="VAR">VAR</option>
-                        </select>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-2">
-                        <label class="form-label">Gofre</label>
-                        <select class="form-select" name="gofre">
-                            <option value="YOK">YOK</option>
-                            <option value="VAR">VAR</option>
-                        </select>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-2">
-                        <label class="form-label">Yapıştırma</label>
-                        <select class="form-select" name="yapistirma">
-                            <option value="YOK">YOK</option>
-                            <option value="VAR">VAR</option>
-                        </select>
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Paketleme</label>
-                        <input type="text" class="form-control" name="paketleme">
-                    </div>
-                </div>
-            </div>
-
-            <!-- PDF İÇİN ÜRETİM BİLGİLERİ (GİZLİ) -->
-            <div class="form-section pdf-only-section">
-                <h4 class="section-title">Üretim Bilgileri (PDF için)</h4>
-                
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Baskı Adedi</label>
-                        <input type="text" class="form-control" name="baski_adedi" placeholder="Sadece PDF'de gösterilir">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Selefon Adedi</label>
-                        <input type="text" class="form-control" name="selefon_adedi" placeholder="Sadece PDF'de gösterilir">
-                    </div>
-                </div>
-
-                <div class="row">
-                    <div class="col-md-3">
-                        <label class="form-label">Kesim Adedi</label>
-                        <input type="text" class="form-control" name="kesim_adedi" placeholder="Sadece PDF'de gösterilir">
-                    </div>
-                </div>
-            </div>
-
-            <!-- NOTLAR -->
-            <div class="form-section">
-                <h4 class="section-title">Notlar</h4>
-                <div class="row">
-                    <div class="col-12">
-                        <textarea class="form-control" name="notlar" rows="3" placeholder="Detaylı notlarınızı buraya yazabilirsiniz..."></textarea>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Butonlar -->
-            <div class="row mt-4">
-                <div class="col-12">
-                    <button type="button" class="btn btn-success" onclick="saveRecord()">
-                        <i class="fas fa-save"></i> KAYDET
-                    </button>
-                    <button type="button" class="btn btn-primary" onclick="saveRecordAsNew()">
-                        <i class="fas fa-copy"></i> FARKLI KAYDET
-                    </button>
-                    <button type="button" class="btn btn-primary" onclick="exportToExcel()">
-                        <i class="fas fa-file-excel"></i> EXCEL
-                    </button>
-                    <button type="button" class="btn btn-info" onclick="generatePDF()">
-                        <i class="fas fa-file-pdf"></i> PDF OLUŞTUR
-                    </button>
-                    <button type="button" class="btn btn-warning" onclick="printForm()">
-                        <i class="fas fa-print"></i> YAZDIR
-                    </button>
-                    <button type="button" class="btn btn-warning" onclick="showListModal()">
-                        <i class="fas fa-list"></i> LİSTELE
-                    </button>
-                    <button type="button" class="btn btn-danger" onclick="clearForm()">
-                        <i class="fas fa-broom"></i> TEMİZLE
-                    </button>
-                </div>
-            </div>
-
-            <!-- Ürün Listesi Modal -->
-            <div class="modal fade urun-list-modal" id="urunListModal" tabindex="-1" aria-labelledby="urunListModalLabel" aria-hidden="true">
-                <div class="modal-dialog modal-lg">
-                    <div class="modal-content">
-                        <div class="modal-header bg-info text-white">
-                            <h5 class="modal-title" id="urunListModalLabel">
-                                <i class="fas fa-boxes"></i> ÜRÜN LİSTESİ
-                            </h5>
-                            <button type="button" class="btn-close btn-close-white" data-bs-dismiss="modal" aria-label="Close"></button>
-                        </div>
-                        <div class="modal-body">
-                            <!-- Arama Çubuğu -->
-                            <div class="row mb-3">
-                                <div class="col-md-12">
-                                    <div class="input-group">
-                                        <input type="text" id="urunAramaInput" class="form-control" placeholder="Ürün adında ara...">
-                                        <button class="btn btn-outline-info" onclick="urunListesiniAra()">
-                                            <i class="fas fa-search"></i> Ara
-                                        </button>
-                                    </div>
-                                </div>
-                            </div>
-
-                            <!-- Ürün Listesi -->
-                            <div class="table-responsive">
-                                <table class="table table-striped table-bordered table-hover">
-                                    <thead class="table-info">
-                                        <tr>
-                                            <th>Ürün Adı</th>
-                                            <th width="100">İşlem</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody id="urunListTableBody">
-                                        <!-- Ürünler buraya gelecek -->
-                                    </tbody>
-                                </table>
-                            </div>
-                        </div>
-                        <div class="modal-footer">
-                            <button type="button" class="btn btn-secondary" data-bs-dismiss="modal">Kapat</button>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Liste Modal -->
-            <div class="modal fade" id="listModal" tabindex="-1" aria-labelledby="listModalLabel" aria-hidden="true">
-                <div class="modal-dialog modal-xl">
-                    <div class="modal-content">
-                        <div class="modal-header bg-primary text-white">
-                            <h5 class="modal-title" id="listModalLabel">
-                                <i class="fas fa-list"></i> KAYIT LİSTESİ
-                            </h5>
-                            <button type="button" class="btn-close btn-close-white" data-bs-dismiss="modal" aria-label="Close"></button>
-                        </div>
-                        <div class="modal-body">
-                            <!-- Arama Çubuğu Modal İçin -->
-                            <div class="row mb-3">
-                                <div class="col-md-6">
-                                    <div class="input-group">
-                                        <input type="text" id="modalSearchInput" class="form-control" placeholder="Müşteri, Ürün veya Bıçak Kodu ara...">
-                                        <button class="btn btn-outline-primary" onclick="searchRecordsInModal()">
-                                            <i class="fas fa-search"></i> Ara
-                                        </button>
-                                    </div>
-                                </div>
-                                <div class="col-md-6 text-end">
-                                    <button class="btn btn-success" onclick="loadAllRecords()">
-                                        <i class="fas fa-sync"></i> Tümünü Listele
-                                    </button>
-                                </div>
-                            </div>
-
-                            <!-- Kayıt Listesi -->
-                            <div class="table-responsive">
-                                <table class="table table-striped table-bordered table-hover">
-                                    <thead class="table-dark">
-                                        <tr>
-                                            <th>ID</th>
-                                            <th>Müşteri</th>
-                                            <th>Ürün</th>
-                                            <th>Bıçak Kodu</th>
-                                            <th>Durum</th>
-                                            <th>Tarih</th>
-                                            <th>İşlemler</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody id="modalRecordTableBody">
-                                        <!-- Kayıtlar buraya gelecek -->
-                                    </tbody>
-                                </table>
-                            </div>
-                        </div>
-                        <div class="modal-footer">
-                            <button type="button" class="btn btn-secondary" data-bs-dismiss="modal">Kapat</button>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        let listModal = new bootstrap.Modal(document.getElementById('listModal'));
-        let urunListModal = new bootstrap.Modal(document.getElementById('urunListModal'));
-
-        // OTOMATİK TAMAMLAMA FONKSİYONU
-        function initAutocomplete() {
-            const urunAdiInput = document.getElementById('urun_adi');
-            
-            urunAdiInput.addEventListener('input', function(e) {
-                const value = this.value;
-                if (value.length < 2) return;
-                
-                fetch('/urun-ara?q=' + encodeURIComponent(value))
-                    .then(response => response.json())
-                    .then(urunler => {
-                        showAutocompleteSuggestions(urunler, value);
-                    })
-                    .catch(error => {
-                        console.error('Autocomplete hatası:', error);
-                    });
-            });
-            
-            // Input'tan focus kaybolduğunda önerileri temizle
-            urunAdiInput.addEventListener('blur', function() {
-                setTimeout(() => {
-                    const container = document.getElementById('autocomplete-list');
-                    if (container) {
-                        container.innerHTML = '';
-                    }
-                }, 200);
-            });
-        }
-
-        function showAutocompleteSuggestions(urunler, query) {
-            let container = document.getElementById('autocomplete-list');
-            if (!container) {
-                container = document.createElement('div');
-                container.id = 'autocomplete-list';
-                container.className = 'autocomplete-items';
-                document.getElementById('urun_adi').parentNode.appendChild(container);
-            }
-            
-            container.innerHTML = '';
-            
-            if (urunler.length === 0) {
-                const item = document.createElement('div');
-                item.innerHTML = 'Ürün bulunamadı';
-                container.appendChild(item);
-                return;
-            }
-            
-            urunler.forEach(urun => {
-                const item = document.createElement('div');
-                // Arama terimini vurgula
-                const highlightedUrun = urun.replace(new RegExp(query, 'gi'), match => `<strong>${match}</strong>`);
-                item.innerHTML = highlightedUrun;
-                item.addEventListener('click', function() {
-                    document.getElementById('urun_adi').value = urun;
-                    container.innerHTML = '';
-                    // Seçildiğinde otomatik olarak bilgileri getir
-                    urunBilgisiGetir();
-                });
-                container.appendChild(item);
-            });
-        }
-
-        // ÜRÜN LİSTESİNİ GÖSTER
-        function showUrunListesi() {
-            fetch('/urun-listesi')
-                .then(response => response.json())
-                .then(urunler => {
-                    showUrunListesiModal(urunler);
-                })
-                .catch(error => {
-                    console.error('Ürün listesi yükleme hatası:', error);
-                    alert('Ürün listesi yüklenirken hata oluştu.');
-                });
-        }
-
-        function showUrunListesiModal(urunler) {
-            const tbody = document.getElementById('urunListTableBody');
-            tbody.innerHTML = '';
-            
-            if (urunler.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="2" class="text-center">Ürün bulunamadı.</td></tr>';
-                return;
-            }
-            
-            urunler.forEach(urun => {
-                const row = `<tr>
-                    <td>${urun}</td>
-                    <td>
-                        <button class="btn btn-sm btn-success" onclick="urunSec('${urun.replace(/'/g, "\\'")}')" data-bs-dismiss="modal">
-                            <i class="fas fa-check"></i> Seç
-                        </button>
-                    </td>
-                </tr>`;
-                tbody.innerHTML += row;
-            });
-            
-            urunListModal.show();
-        }
-
-        function urunListesiniAra() {
-            const query = document.getElementById('urunAramaInput').value.toLowerCase();
-            const rows = document.getElementById('urunListTableBody').getElementsByTagName('tr');
-            
-            for (let i = 0; i < rows.length; i++) {
-                const urunAdi = rows[i].getElementsByTagName('td')[0].textContent.toLowerCase();
-                if (urunAdi.includes(query)) {
-                    rows[i].style.display = '';
-                } else {
-                    rows[i].style.display = 'none';
-                }
-            }
-        }
-
-        function urunSec(urunAdi) {
-            document.getElementById('urun_adi').value = urunAdi;
-            // Seçildiğinde otomatik olarak bilgileri getir
-            urunBilgisiGetir();
-        }
-
-        // ÜRÜN BİLGİSİ GETİRME FONKSİYONU
-        function urunBilgisiGetir() {
-            const urunAdi = document.getElementById('urun_adi').value.trim();
-            
-            if (!urunAdi) {
-                alert('Lütfen ürün adı giriniz!');
-                return;
-            }
-            
-            // Loading göster
-            document.getElementById('bicak_kodu').value = 'Aranıyor...';
-            document.getElementById('bicak_olcusu_1').value = 'Aranıyor...';
-            document.getElementById('bicak_olcusu_2').value = 'Aranıyor...';
-            
-            fetch('/urun-bilgi?urun_adi=' + encodeURIComponent(urunAdi))
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Ürün bulunamadı');
-                }
-                return response.json();
-            })
-            .then(data => {
-                if (data.success) {
-                    document.getElementById('bicak_kodu').value = data.bicak_kodu;
-                    document.getElementById('bicak_olcusu_1').value = data.en;
-                    document.getElementById('bicak_olcusu_2').value = data.boy;
-                    
-                    // Formdaki bıçak kodu alanını da güncelle
-                    document.getElementsByName('bicak_kodu')[0].value = data.bicak_kodu;
-                    document.getElementsByName('bicak_olcusu_1')[0].value = data.en;
-                    document.getElementsByName('bicak_olcusu_2')[0].value = data.boy;
-                    
-                    showAlert('Ürün bilgileri başarıyla getirildi!', 'success');
-                } else {
-                    throw new Error(data.message || 'Ürün bulunamadı');
-                }
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                document.getElementById('bicak_kodu').value = 'Bulunamadı';
-                document.getElementById('bicak_olcusu_1').value = '';
-                document.getElementById('bicak_olcusu_2').value = '';
-                
-                // Formdaki bıçak kodu alanını da güncelle
-                document.getElementsByName('bicak_kodu')[0].value = 'Bulunamadı';
-                document.getElementsByName('bicak_olcusu_1')[0].value = '';
-                document.getElementsByName('bicak_olcusu_2')[0].value = '';
-                
-                showAlert(error.message, 'danger');
-            });
-        }
-
-        function showAlert(message, type) {
-            const alertDiv = document.createElement('div');
-            alertDiv.className = `alert alert-${type} alert-dismissible fade show mt-3`;
-            alertDiv.innerHTML = `
-                ${message}
-                <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-            `;
-            
-            // Formun üstüne ekle
-            const form = document.getElementById('uretimForm');
-            form.parentNode.insertBefore(alertDiv, form);
-            
-            // 5 saniye sonra otomatik kaldır
-            setTimeout(() => {
-                if (alertDiv.parentNode) {
-                    alertDiv.parentNode.removeChild(alertDiv);
-                }
-            }, 5000);
-        }
-
-        function showListModal() {
-            loadAllRecords();
-            listModal.show();
-        }
-
-        function loadAllRecords() {
-            fetch('/list')
-            .then(response => response.json())
-            .then(data => {
-                showRecordsInModal(data);
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                alert('Kayıtlar yüklenirken hata oluştu.');
-            });
-        }
-
-        function searchRecordsInModal() {
-            const query = document.getElementById('modalSearchInput').value;
-            if (!query) {
-                loadAllRecords();
-                return;
-            }
-            
-            fetch('/search?q=' + encodeURIComponent(query))
-            .then(response => response.json())
-            .then(data => {
-                showRecordsInModal(data);
-            });
-        }
-
-        function showRecordsInModal(records) {
-            const tbody = document.getElementById('modalRecordTableBody');
-            tbody.innerHTML = '';
-            
-            if (records.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="7" class="text-center">Kayıt bulunamadı.</td></tr>';
-                return;
-            }
-            
-            records.forEach(record => {
-                let statusClass = '';
-                switch(record.siparis_durumu) {
-                    case 'RPT': statusClass = 'bg-warning text-dark'; break;
-                    case 'YENİ': statusClass = 'bg-primary'; break;
-                    default: statusClass = 'bg-secondary';
-                }
-                
-                const row = `<tr>
-                    <td><strong>${record.id}</strong></td>
-                    <td>${record.musteri_adi}</td>
-                    <td>${record.urun_adi}</td>
-                    <td><span class="badge bg-info">${record.bicak_kodu || '-'}</span></td>
-                    <td><span class="badge ${statusClass}">${record.siparis_durumu}</span></td>
-                    <td>${record.tarih}</td>
-                    <td>
-                        <button class="btn btn-sm btn-primary" onclick="loadRecord(${record.id})" data-bs-dismiss="modal">
-                            <i class="fas fa-edit"></i> Yükle
-                        </button>
-                        <button class="btn btn-sm btn-danger" onclick="deleteRecord(${record.id})">
-                            <i class="fas fa-trash"></i> Sil
-                        </button>
-                    </td>
-                </tr>`;
-                tbody.innerHTML += row;
-            });
-        }
-
-        function loadRecord(id) {
-            fetch('/record/' + id)
-            .then(response => response.json())
-            .then(record => {
-                const form = document.getElementById('uretimForm');
-                Object.keys(record).forEach(key => {
-                    if (form.elements[key]) {
-                        form.elements[key].value = record[key] || '';
-                    }
-                });
-                // Hesaplanan ağırlığı göster
-                document.getElementById('karton_agirligi_goster').value = record.karton_agirligi || 'Hesaplanacak';
-                document.getElementById('karton_agirligi').value = record.karton_agirligi || '';
-                
-                // Otomatik bilgileri güncelle
-                document.getElementById('bicak_kodu').value = record.bicak_kodu || '';
-                document.getElementById('bicak_olcusu_1').value = record.bicak_olcusu_1 || '';
-                document.getElementById('bicak_olcusu_2').value = record.bicak_olcusu_2 || '';
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                alert('Kayıt yüklenirken hata oluştu.');
-            });
-        }
-
-        function deleteRecord(id) {
-            if (confirm('Bu kaydı silmek istediğinizden emin misiniz?')) {
-                fetch('/delete/' + id, {method: 'DELETE'})
-                .then(response => response.json())
-                .then(result => {
-                    alert(result.message);
-                    loadAllRecords();
-                })
-                .catch(error => {
-                    console.error('Hata:', error);
-                    alert('Silme işlemi sırasında hata oluştu.');
-                });
-            }
-        }
-
-        function hesaplaAgirlik() {
-            const en = parseFloat(document.getElementById('kagit_olcusu_1').value) || 0;
-            const boy = parseFloat(document.getElementById('kagit_olcusu_2').value) || 0;
-            const gramaj = parseFloat(document.getElementById('gramaj').value) || 0;
-            const tabaka_adedi = parseFloat(document.getElementById('tabaka_adedi').value) || 0;
-            
-            if (en > 0 && boy > 0 && gramaj > 0 && tabaka_adedi > 0) {
-                // DOĞRU FORMÜL: (En × Boy × Gramaj × Tabaka Adedi) / 1.000.000
-                const agirlik_kg = (en * boy * gramaj * tabaka_adedi) / 1000000;
-                const formattedWeight = agirlik_kg.toLocaleString('tr-TR', {
-                    minimumFractionDigits: 2,
-                    maximumFractionDigits: 2
-                }) + ' kg';
-                
-                document.getElementById('karton_agirligi_goster').value = formattedWeight;
-                document.getElementById('karton_agirligi').value = formattedWeight;
-            } else {
-                document.getElementById('karton_agirligi_goster').value = 'Hesaplanacak';
-                document.getElementById('karton_agirligi').value = '';
-            }
-        }
-
-        function saveRecord() {
-            const formData = new FormData(document.getElementById('uretimForm'));
-            const data = Object.fromEntries(formData.entries());
-            
-            // Validasyon
-            if (!data.musteri_adi.trim()) {
-                alert('Müşteri adı zorunludur!');
-                return;
-            }
-            
-            // Ağırlık hesaplamasını yap
-            hesaplaAgirlik();
-            data.karton_agirligi = document.getElementById('karton_agirligi').value;
-            
-            fetch('/save', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify(data)
-            })
-            .then(response => response.json())
-            .then(result => {
-                alert(result.message);
-                if (result.success) clearForm();
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                alert('Kayıt sırasında hata oluştu.');
-            });
-        }
-
-        function saveRecordAsNew() {
-            saveRecord();
-        }
-
-        function searchRecords() {
-            const query = document.getElementById('searchInput').value;
-            if (!query) {
-                alert('Lütfen arama metni giriniz.');
-                return;
-            }
-            
-            fetch('/search?q=' + encodeURIComponent(query))
-            .then(response => response.json())
-            .then(data => {
-                showListModal();
-                showRecordsInModal(data);
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                alert('Arama sırasında hata oluştu.');
-            });
-        }
-
-        function exportToExcel() {
-            window.open('/export/excel', '_blank');
-        }
-
-        function generatePDF() {
-            const formData = new FormData(document.getElementById('uretimForm'));
-            const data = Object.fromEntries(formData.entries());
-            
-            // Ağırlık hesaplamasını yap ve PDF'e gönder
-            hesaplaAgirlik();
-            data.karton_agirligi = document.getElementById('karton_agirligi').value;
-            
-            fetch('/export/pdf', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify(data)
-            })
-            .then(response => response.blob())
-            .then(blob => {
-                const url = window.URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = 'KutuDunyasi_Form.pdf';
-                a.click();
-                window.URL.revokeObjectURL(url);
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                alert('PDF oluşturulurken hata oluştu.');
-            });
-        }
-
-        function printForm() {
-            const formData = new FormData(document.getElementById('uretimForm'));
-            const data = Object.fromEntries(formData.entries());
-            
-            // Ağırlık hesaplamasını yap ve PDF'e gönder
-            hesaplaAgirlik();
-            data.karton_agirligi = document.getElementById('karton_agirligi').value;
-            
-            fetch('/print', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify(data)
-            })
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('PDF oluşturulamadı');
-                }
-                return response.blob();
-            })
-            .then(blob => {
-                const url = window.URL.createObjectURL(blob);
-                const printWindow = window.open(url, '_blank');
-                if (printWindow) {
-                    printWindow.onload = function() {
-                        printWindow.print();
-                    };
-                } else {
-                    alert('Popup engelleyici nedeniyle yazdırma penceresi açılamadı. Lütfen popup engelleyiciyi devre dışı bırakın.');
-                }
-            })
-            .catch(error => {
-                console.error('Hata:', error);
-                alert('PDF oluşturulurken hata oluştu: ' + error.message);
-            });
-        }
-
-        function clearForm() {
-            document.getElementById('uretimForm').reset();
-            document.getElementById('uretimForm').elements['tarih'].value = '{{ bugun }}';
-            document.getElementById('uretimForm').elements['kagit_cinsi'].value = 'Krome';
-            document.getElementById('uretimForm').elements['selefon_1'].value = 'MAT';
-            document.getElementById('uretimForm').elements['selefon_2'].value = 'SEDEF';
-            document.getElementById('uretimForm').elements['varak_yaldiz'].value = 'YOK';
-            document.getElementById('uretimForm').elements['gofre'].value = 'YOK';
-            document.getElementById('uretimForm').elements['yapistirma'].value = 'YOK';
-            document.getElementById('uretimForm').elements['siparis_durumu'].value = 'RPT';
-            document.getElementById('karton_agirligi_goster').value = 'Hesaplanacak';
-            document.getElementById('karton_agirligi').value = '';
-            
-            // Otomatik bilgileri temizle
-            document.getElementById('bicak_kodu').value = '';
-            document.getElementById('bicak_olcusu_1').value = '';
-            document.getElementById('bicak_olcusu_2').value = '';
-            
-            // Autocomplete listesini temizle
-            const container = document.getElementById('autocomplete-list');
-            if (container) {
-                container.innerHTML = '';
-            }
-        }
-
-        // Enter tuşu ile ürün bilgisi getirme
-        document.getElementById('urun_adi').addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                e.preventDefault();
-                urunBilgisiGetir();
-            }
-        });
-
-        // Ürün arama input'unda enter tuşu
-        document.getElementById('urunAramaInput').addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                e.preventDefault();
-                urunListesiniAra();
-            }
-        });
-
-        document.addEventListener('DOMContentLoaded', function() {
-            clearForm();
-            initAutocomplete();
-        });
-    </script>
-</body>
-</html>
-"""
-
+            yanit.cache_control.no_cache = True
+        yanit = yanit.make_conditional(request)
+    else:
+        yanit = send_from_directory(app.static_folder, yol, max_age=max_age)
+        etag, zayif = yanit.get_etag()
+        if etag and not zayif:
+            yanit.set_etag(etag, weak=True)
+    if kalici:
+        yanit.cache_control.immutable = True
+    if yanit.mimetype in SIKISTIRILABILIR_TURLER and yanit.status_code == 200:
+        # CSS/JS dosyaları da sıkıştırma katmanından geçsin. send_file dosyayı
+        # akış olarak verir; gövde belleğe alınmazsa akış dalına düşer,
+        # sıkıştırılmış hali önbelleğe girmez ve Content-Length gönderilmez.
+        yanit.direct_passthrough = False
+        yanit.make_sequence()
+        yanit.sabit_govde = True
+    return yanit
+
+app.view_functions['static'] = statik_dosya
+
+@uretim.route('/sw.js')
+def servis_calisani():
+    """Çevrimdışı mod servis çalışanı; kapsamı tüm uygulama olsun diye kök adresten verilir"""
+    return statik_dosya('js/servis_calisani.js')
 
 # ROUTE'LAR
 # ÜRETİM PLANLAMA ROUTE'LARI - SADELEŞTİRİLMİŞ
-@app.route('/uretim-planlama')
+@uretim.route('/uretim-planlama')
 def uretim_planlama():
     """Üretim Planlama sayfası"""
     try:
-        return render_template('uretim_planlama.html')
+        return sabit_sayfa(render_template('uretim_planlama.html'))
     except Exception as e:
         logger.error(f"Üretim planlama sayfası hatası: {e}")
         return "Sistem geçici olarak hizmet veremiyor", 500
 
-@app.route('/api/simple-production-data')
+@uretim.route('/api/simple-production-data')
 def simple_production_data():
     """Basit üretim verilerini JSON olarak döndür (sadece gerekli alanlar)"""
     try:
+        etiket = uretim_verisi_etiketi()
+        if request.if_none_match.contains_weak(etiket):
+            return surumlu_yanit(Response(status=304), etiket)
+        
         kayitlar = UretimEmri.query.order_by(UretimEmri.id.desc()).limit(100).all()
         
         sonuc = []
@@ -1393,13 +509,77 @@ def simple_production_data():
                 'notlar': kayit.notlar
             })
         
-        return jsonify(sonuc)
+        return surumlu_yanit(jsonify(sonuc), etiket)
     
     except Exception as e:
         logger.error(f"Simple production data hatası: {e}")
         return jsonify({'error': 'Veriler yüklenirken hata oluştu'}), 500
 
-@app.route('/api/get-selected-records', methods=['POST'])
+# KAYIT ARAMA (planlama "Kayıtlardan Seç" penceresi)
+# Sayfalama id üzerinden imleçle yapılır (id < sonraki, id azalan): her sayfa
+# birincil anahtar sırasıyla okunur ve LIMIT dolunca durur, toplam sayım
+# gerekmez. Durum ve tarih aralığı filtreleri indekslidir; metin filtreleri
+# (müşteri/ürün içinde geçen) bu sıralı okuma üzerinde uygulanır.
+KAYIT_ARAMA_ALANLARI = (
+    UretimEmri.id, UretimEmri.musteri_adi, UretimEmri.urun_adi, UretimEmri.tabaka_adedi,
+    UretimEmri.renk_sayisi, UretimEmri.renk_bilgisi, UretimEmri.siparis_durumu,
+    UretimEmri.tarih, UretimEmri.notlar
+)
+
+def tarih_parametresi(ad):
+    """YYYY-MM-DD biçimindeki sorgu parametresini datetime'a çevirir (yoksa None)"""
+    deger = request.args.get(ad, '').strip()
+    return datetime.strptime(deger, '%Y-%m-%d') if deger else None
+
+@uretim.route('/api/production-data/search')
+def search_production_data():
+    """Üretim emirlerinde sayfalı arama; müşteri, ürün, durum ve tarih aralığı filtreleri"""
+    try:
+        adet = max(1, min(request.args.get('adet', 50, type=int), 100))
+        sorgu = select(*KAYIT_ARAMA_ALANLARI).order_by(UretimEmri.id.desc()).limit(adet + 1)
+        
+        aranan = request.args.get('q', '').strip()
+        if aranan:
+            sorgu = sorgu.where(UretimEmri.musteri_adi.contains(aranan, autoescape=True) |
+                                UretimEmri.urun_adi.contains(aranan, autoescape=True))
+        musteri = request.args.get('musteri', '').strip()
+        if musteri:
+            sorgu = sorgu.where(UretimEmri.musteri_adi.contains(musteri, autoescape=True))
+        urun = request.args.get('urun', '').strip()
+        if urun:
+            sorgu = sorgu.where(UretimEmri.urun_adi.contains(urun, autoescape=True))
+        durum = request.args.get('durum', '').strip()
+        if durum:
+            sorgu = sorgu.where(UretimEmri.siparis_durumu == durum)
+        
+        try:
+            baslangic = tarih_parametresi('baslangic')
+            bitis = tarih_parametresi('bitis')
+        except ValueError:
+            return jsonify({'error': 'Tarih YYYY-AA-GG biçiminde olmalı'}), 400
+        if baslangic:
+            sorgu = sorgu.where(UretimEmri.olusturma_tarihi >= baslangic)
+        if bitis:
+            sorgu = sorgu.where(UretimEmri.olusturma_tarihi < bitis + timedelta(days=1))
+        
+        sonraki = request.args.get('sonraki', type=int)
+        if sonraki:
+            sorgu = sorgu.where(UretimEmri.id < sonraki)
+        
+        satirlar = db.session.execute(sorgu).all()
+        devami_var = len(satirlar) > adet
+        satirlar = satirlar[:adet]
+        
+        return jsonify({
+            'kayitlar': [satir._asdict() for satir in satirlar],
+            'sonraki': satirlar[-1].id if devami_var else None
+        })
+    
+    except Exception as e:
+        logger.error(f"Kayıt arama hatası: {e}")
+        return jsonify({'error': 'Kayıtlar aranırken hata oluştu'}), 500
+
+@uretim.route('/api/get-selected-records', methods=['POST'])
 def get_selected_records():
     """Seçilen kayıtları getir"""
     try:
@@ -1433,181 +613,360 @@ def get_selected_records():
         logger.error(f"Get selected records hatası: {e}")
         return jsonify({'error': 'Kayıtlar getirilirken hata oluştu'}), 500
 
-@app.route('/api/save-production-plan', methods=['POST'])
+# ÜRETİM PLANLARI
+# Planlar veritabanında tutulur. Kayıttan eklenen satırlar sadece üretim
+# emri id'sini, sırasını ve kayıttan farklı olan (düzenlenmiş) hücreleri
+# saklar; boş (NULL) hücre değeri yükleme sırasında kayıttan doldurulur.
+# Üretim emri silinirse satır kayıttaki değerleri kopyalayıp bağımsız kalır
+# (kutu_dunyasi/veritabani.py: plan_satirlarini_ayir).
+def plan_kayitlari(satirlar):
+    """Satırların bağlı olduğu üretim emirlerini tek IN sorgusuyla {id: kayıt} olarak getirir"""
+    ids = {satir.uretim_emri_id for satir in satirlar if satir.uretim_emri_id}
+    return {kayit.id: kayit for kayit in UretimEmri.query.filter(UretimEmri.id.in_(ids)).all()} if ids else {}
+
+def plan_olustur(plan_adi, satirlar, olusturma_tarihi=None):
+    """
+    Planlama tablosu satırlarından UretimPlani oluşturur (commit etmez).
+    Satırda gönderilmeyen veya kayıttaki değerle aynı olan hücreler saklanmaz.
+    """
+    ids = {int(satir['id']) for satir in satirlar if str(satir.get('id', '')).isdigit()}
+    kayitlar = {kayit.id: kayit for kayit in UretimEmri.query.filter(UretimEmri.id.in_(ids)).all()} if ids else {}
+    
+    plan = UretimPlani(plan_adi=plan_adi, olusturma_tarihi=olusturma_tarihi or datetime.now(), satir_sayisi=len(satirlar))
+    for sira, satir in enumerate(satirlar):
+        kayit = kayitlar.get(int(satir['id'])) if str(satir.get('id', '')).isdigit() else None
+        hucreler = {}
+        for plan_alani, kayit_alani in PLAN_ALANLARI.items():
+            deger = str(satir.get(plan_alani) or '')
+            if kayit:
+                if plan_alani in satir and deger != (getattr(kayit, kayit_alani) or ''):
+                    hucreler[plan_alani] = deger
+            elif deger:
+                hucreler[plan_alani] = deger
+        plan.satirlar.append(UretimPlaniSatiri(sira=sira, uretim_emri_id=kayit.id if kayit else None, **hucreler))
+    db.session.add(plan)
+    return plan
+
+def plan_satiri_sozlugu(satir, kayit):
+    """Plan satırını kayıttaki değerlerle doldurup planlama tablosunun biçimine çevirir"""
+    sonuc = {'degisen': []}
+    for plan_alani, kayit_alani in PLAN_ALANLARI.items():
+        deger = getattr(satir, plan_alani)
+        if deger is None:
+            deger = (getattr(kayit, kayit_alani) or '') if kayit else ''
+        elif kayit:
+            sonuc['degisen'].append(plan_alani)
+        sonuc[plan_alani] = deger
+    if kayit:
+        sonuc['id'] = kayit.id
+    return sonuc
+
+def plan_ozeti(plan):
+    """Plan listesinde gösterilen özet bilgiler"""
+    return {
+        'id': plan.id,
+        'plan_adi': plan.plan_adi,
+        'tarih': plan.olusturma_tarihi.strftime("%d.%m.%Y %H:%M:%S") if plan.olusturma_tarihi else '',
+        'satir_sayisi': plan.satir_sayisi
+    }
+
+@uretim.route('/api/save-production-plan', methods=['POST'])
 def save_production_plan():
     """Üretim planını kaydet"""
     try:
         data = request.json
-        plan_adi = data.get('plan_adi', '')
-        veriler = data.get('veriler', [])
+        plan_adi = (data.get('plan_adi') or '').strip()
+        satirlar = data.get('satirlar') or data.get('veriler', [])  # veriler: eski tam tablo biçimi
         
-        if not plan_adi or not veriler:
+        if not plan_adi or not satirlar:
             return jsonify({'success': False, 'message': 'Eksik veri!'})
         
-        import json
-        from datetime import datetime
-        
-        plan_data = {
-            'plan_adi': plan_adi,
-            'tarih': datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-            'veriler': veriler
-        }
-        
-        # Klasör yoksa OTOMATİK oluştur
-        import os
-        plan_folder = 'uretim_planlari'
-        
-        # Klasör yoksa oluştur
-        if not os.path.exists(plan_folder):
-            os.makedirs(plan_folder)
-            print(f"Klasör oluşturuldu: {plan_folder}")
-        
-        # Dosya adını oluştur (Türkçe karakterleri düzelt)
-        import re
-        safe_plan_name = re.sub(r'[^\w\s-]', '', plan_adi)
-        safe_plan_name = re.sub(r'[-\s]+', '_', safe_plan_name)
-        
-        filename = f"{plan_folder}/{safe_plan_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        # Dosyaya kaydet
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(plan_data, f, ensure_ascii=False, indent=2)
+        plan = plan_olustur(plan_adi[:200], satirlar)
+        db.session.commit()
         
-        logger.info(f"Üretim planı kaydedildi: {plan_adi}")
+        logger.info(f"Üretim planı kaydedildi: {plan.plan_adi} (ID: {plan.id})")
         return jsonify({
             'success': True, 
             'message': 'Plan kaydedildi!', 
-            'filename': filename
+            'plan_id': plan.id
         })
     
     except Exception as e:
+        db.session.rollback()
         logger.error(f"Save production plan hatası: {e}")
         return jsonify({'success': False, 'message': f'Sistem hatası: {str(e)}'})
-@app.route('/urun-ara')
-def urun_ara():
-    """Ürün adında arama yapar"""
-    try:
-        query = request.args.get('q', '').strip().lower()
-        
-        if not query or len(query) < 2:
-            return jsonify([])
-        
-        tum_urunler = tum_urun_listesi()
-        
-        # Arama yap
-        sonuclar = [urun for urun in tum_urunler if query in urun.lower()]
-        
-        # İlk 10 sonucu döndür
-        return jsonify(sonuclar[:10])
-        
-    except Exception as e:
-        logger.error(f"Ürün arama hatası: {e}")
-        return jsonify([])
 
-@app.route('/urun-listesi')
-def urun_listesi():
-    """Tüm ürün listesini getirir"""
+@uretim.route('/api/production-plans')
+def production_plans():
+    """Kayıtlı planları en yeniden eskiye sayfalı listeler (?sayfa=&adet=&q=)"""
     try:
-        tum_urunler = tum_urun_listesi()
-        return jsonify(tum_urunler)
+        sorgu = select(UretimPlani).order_by(UretimPlani.olusturma_tarihi.desc(), UretimPlani.id.desc())
+        aranan = request.args.get('q', '').strip()
+        if aranan:
+            sorgu = sorgu.where(UretimPlani.plan_adi.contains(aranan, autoescape=True))
+        
+        sayfa = db.paginate(
+            sorgu,
+            page=request.args.get('sayfa', 1, type=int),
+            per_page=request.args.get('adet', app.config['PLAN_SAYFA_BOYUTU'], type=int),
+            max_per_page=100,
+            error_out=False
+        )
+        
+        return jsonify({
+            'planlar': [plan_ozeti(plan) for plan in sayfa.items],
+            'sayfa': sayfa.page,
+            'sayfa_sayisi': sayfa.pages,
+            'toplam': sayfa.total
+        })
+    
     except Exception as e:
-        logger.error(f"Ürün listesi getirme hatası: {e}")
-        return jsonify([])
+        logger.error(f"Plan listeleme hatası: {e}")
+        return jsonify({'error': 'Planlar listelenirken hata oluştu'}), 500
 
-@app.route('/urun-bilgi')
-def urun_bilgi():
-    """Ürün adına göre bıçak kodu ve ebatlarını getirir"""
+@uretim.route('/api/production-plans/<int:plan_id>')
+def production_plan(plan_id):
+    """Kayıtlı planı satırlarıyla birlikte döndürür"""
     try:
-        urun_adi = request.args.get('urun_adi', '').strip()
-        
-        if not urun_adi:
-            return jsonify({'success': False, 'message': 'Ürün adı gerekli'})
+        plan = db.session.get(UretimPlani, plan_id)
+        if not plan:
+            return jsonify({'error': 'Plan bulunamadı'}), 404
         
-        bilgiler = urun_bilgisi_getir(urun_adi)
+        satirlar = plan.satirlar
+        kayitlar = plan_kayitlari(satirlar)
         
-        if bilgiler:
-            return jsonify({
-                'success': True,
-                'bicak_kodu': bilgiler['bicak_kodu'],
-                'en': bilgiler['en'],
-                'boy': bilgiler['boy'],
-                'urun_adi': bilgiler.get('urun_adi', urun_adi)
-            })
-        else:
-            return jsonify({
-                'success': False, 
-                'message': 'Ürün katalogda bulunamadı'
-            })
-            
+        sonuc = plan_ozeti(plan)
+        sonuc['veriler'] = [plan_satiri_sozlugu(satir, kayitlar.get(satir.uretim_emri_id)) for satir in satirlar]
+        return jsonify(sonuc)
+    
     except Exception as e:
-        logger.error(f"Ürün bilgisi getirme hatası: {e}")
-        return jsonify({
-            'success': False, 
-            'message': f'Sistem hatası: {str(e)}'
-        })
+        logger.error(f"Plan getirme hatası: {e}")
+        return jsonify({'error': 'Plan getirilirken hata oluştu'}), 500
+
+@app.cli.command('planlari-ice-aktar')
+def planlari_ice_aktar():
+    """Eski JSON plan dosyalarını (URETIM_PLANLARI_DIZINI) veritabanına bir kez aktarır"""
+    init_database()
+    plan_folder = app.config['URETIM_PLANLARI_DIZINI']
+    if not os.path.isdir(plan_folder):
+        print(f"Plan klasörü bulunamadı: {plan_folder}")
+        return
+    
+    aktarilan = atlanan = 0
+    for dosya_adi in sorted(os.listdir(plan_folder)):
+        if not dosya_adi.endswith('.json'):
+            continue
+        yol = os.path.join(plan_folder, dosya_adi)
+        try:
+            with open(yol, encoding='utf-8') as f:
+                plan_data = json.load(f)
+            
+            try:
+                tarih = datetime.strptime(plan_data.get('tarih', ''), "%d.%m.%Y %H:%M:%S")
+            except ValueError:
+                tarih = datetime.fromtimestamp(os.path.getmtime(yol)).replace(microsecond=0)
+            plan_adi = (plan_data.get('plan_adi') or os.path.splitext(dosya_adi)[0])[:200]
+            
+            # Tekrar çalıştırılırsa aynı plan ikinci kez eklenmez
+            if UretimPlani.query.filter_by(plan_adi=plan_adi, olusturma_tarihi=tarih).first():
+                atlanan += 1
+                continue
+            
+            plan_olustur(plan_adi, plan_data.get('veriler', []), tarih)
+            db.session.commit()
+            aktarilan += 1
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Plan dosyası aktarılamadı ({dosya_adi}): {e}")
+    
+    logger.info(f"Plan aktarımı tamamlandı: {aktarilan} aktarıldı, {atlanan} zaten vardı")
+    print(f"✅ {aktarilan} plan aktarıldı, {atlanan} plan zaten vardı")
+
+# ESKİ VERİTABANI AKTARIMI
+# Masaüstü uygulamasının kutu_dunyasi_uretim.db dosyasındaki uretim_emirleri
+# tablosu (TEXT sütunlar, "dd.mm.yyyy HH:MM" metin tarihler) UretimEmri'ye
+# aktarılır. Kaynak id sırasıyla partiler halinde okunur; her parti tek
+# executemany INSERT ile ve kaldığı yer (VeriAktarimi) aynı transaction'da
+# yazılır. Komut yarıda kesilirse son tamamlanan partiden devam eder; tekrar
+# çalıştırıldığında sadece o zamandan beri eklenen satırları alır. Aynı
+# içerikli satırlar (kaynakta veya hedefte zaten olan) içerik özetiyle
+# elenir. Toplu INSERT ORM flush'ından geçmediği için veri sürümü elle artırılır.
+AKTARIM_ALANLARI = [ad for ad in UretimEmri.__table__.columns.keys() if ad != 'id']
+ESKI_TARIH_BICIMLERI = ('%d.%m.%Y %H:%M', '%d.%m.%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%d.%m.%Y')
+
+@functools.lru_cache(maxsize=65536)
+def eski_tarihi_coz(*degerler):
+    """Eski tablodaki metin tarihi datetime'a çevirir; ilk çözülebilen değer kullanılır"""
+    for deger in degerler:
+        for bicim in ESKI_TARIH_BICIMLERI:
+            try:
+                return datetime.strptime((deger or '').strip(), bicim)
+            except ValueError:
+                continue
+    return None
+
+def icerik_ozeti(degerler):
+    """AKTARIM_ALANLARI sırasındaki değerlerin özeti (tekrar eden kayıtları elemek için)"""
+    metin = '\x1f'.join('' if deger is None else str(deger) for deger in degerler)
+    return hashlib.sha1(metin.encode('utf-8')).digest()
+
+def eski_satiri_donustur(satir, eslenen):
+    """Eski tablodan eslenen sütunlarla okunan satırı UretimEmri alanlarına eşler (eksik sütunlar boş kalır)"""
+    kayit = dict.fromkeys(AKTARIM_ALANLARI, '')
+    kayit.update(zip(eslenen, satir))
+    kayit['musteri_adi'] = (kayit['musteri_adi'] or '').strip()
+    kayit['olusturma_tarihi'] = eski_tarihi_coz(kayit['olusturma_tarihi'] or None, kayit['tarih'] or None)
+    return kayit
+
+@app.cli.command('eski-veritabanini-aktar')
+@click.option('--kaynak', default=None, help='Eski veritabanı dosyası (varsayılan: ESKI_VERITABANI)')
+@click.option('--parti', type=int, default=None, help='Bir transaction\'da yazılan satır sayısı')
+@click.option('--bastan', is_flag=True, help='Kayıtlı ilerlemeyi yok sayıp baştan tara (tekrarlar yine elenir)')
+def eski_veritabanini_aktar(kaynak, parti, bastan):
+    """Eski kutu_dunyasi_uretim.db üretim emirlerini kaldığı yerden devam ederek aktarır"""
+    kaynak = os.path.abspath(kaynak or app.config['ESKI_VERITABANI'])
+    parti = parti or app.config['AKTARIM_PARTI_BOYUTU']
+    if not os.path.exists(kaynak):
+        print(f"Eski veritabanı bulunamadı: {kaynak}")
+        return
+    init_database()
     
-@app.route('/')
+    # Eski uygulama çalışmaya devam edebilsin diye kaynak salt okunur açılır
+    eski = sqlite3.connect(f"file:{kaynak}?mode=ro", uri=True)
+    try:
+        sutunlar = {satir[1] for satir in eski.execute("PRAGMA table_info(uretim_emirleri)")}
+        if not sutunlar:
+            print(f"uretim_emirleri tablosu bulunamadı: {kaynak}")
+            return
+        eslenen = [alan for alan in AKTARIM_ALANLARI if alan in sutunlar]
+        sorgu = f"SELECT id, {', '.join(eslenen)} FROM uretim_emirleri WHERE id > ? ORDER BY id LIMIT ?"
+        
+        durum = db.session.get(VeriAktarimi, kaynak)
+        if durum is None:
+            durum = VeriAktarimi(kaynak=kaynak, son_id=0, aktarilan=0, atlanan=0)
+            db.session.add(durum)
+        elif bastan:
+            durum.son_id = 0
+        baslangic_id = durum.son_id
+        
+        # Hedefte zaten olan kayıtların özetleri (önceki aktarımlar ve elle girilenler)
+        ozetler = set()
+        for satir in db.session.execute(select(*[UretimEmri.__table__.c[alan] for alan in AKTARIM_ALANLARI])).yield_per(5000):
+            ozetler.add(icerik_ozeti(satir))
+        
+        toplam = eski.execute("SELECT COUNT(*) FROM uretim_emirleri WHERE id > ?", (baslangic_id,)).fetchone()[0]
+        print(f"📦 {kaynak}: {toplam} satır aktarılacak (id > {baslangic_id}, parti {parti})")
+        
+        okunan = aktarilan = atlanan = tarihsiz = 0
+        baslangic = time.perf_counter()
+        while True:
+            satirlar = eski.execute(sorgu, (durum.son_id, parti)).fetchall()
+            if not satirlar:
+                break
+            
+            yeni_kayitlar = []
+            for satir in satirlar:
+                kayit = eski_satiri_donustur(satir[1:], eslenen)
+                ozet = icerik_ozeti(kayit[alan] for alan in AKTARIM_ALANLARI)
+                if ozet in ozetler:
+                    atlanan += 1
+                    continue
+                ozetler.add(ozet)
+                tarihsiz += kayit['olusturma_tarihi'] is None
+                yeni_kayitlar.append(kayit)
+            
+            try:
+                if yeni_kayitlar:
+                    db.session.execute(insert(UretimEmri.__table__), yeni_kayitlar)
+                    db.session.execute(update(VeriSurumu).values(deger=VeriSurumu.deger + 1))
+                durum.son_id = satirlar[-1][0]
+                durum.aktarilan += len(yeni_kayitlar)
+                durum.atlanan += len(satirlar) - len(yeni_kayitlar)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Eski veritabanı aktarımı durdu (id > {durum.son_id}): {e}")
+                print(f"❌ Aktarım durdu, tekrar çalıştırıldığında id > {durum.son_id} satırlarından devam eder: {e}")
+                return
+            
+            okunan += len(satirlar)
+            aktarilan += len(yeni_kayitlar)
+            sure = time.perf_counter() - baslangic
+            print(f"  {okunan}/{toplam} okundu, {aktarilan} aktarıldı, {atlanan} tekrar "
+                  f"({okunan / sure:.0f} satır/sn, son id {durum.son_id})")
+    finally:
+        eski.close()
+    
+    logger.info(f"Eski veritabanı aktarımı tamamlandı: {aktarilan} aktarıldı, {atlanan} tekrar atlandı")
+    print(f"✅ {aktarilan} kayıt aktarıldı, {atlanan} tekrar eden kayıt atlandı")
+    if tarihsiz:
+        print(f"⚠️  {tarihsiz} kaydın oluşturma tarihi çözülemedi (boş bırakıldı)")
+
+@uretim.route('/')
 def index():
     """Ana sayfa - sadece ürün takip butonu"""
     try:
-        return ANA_SAYFA_TEMPLATE
+        return sabit_sayfa(render_template('ana_sayfa.html'))
     except Exception as e:
         logger.error(f"Ana sayfa hatası: {e}")
         return "Sistem geçici olarak hizmet veremiyor", 500
 
-@app.route('/urun-takip')
+@uretim.route('/urun-takip')
 def urun_takip():
     """Ürün Takip Formu sayfası"""
     try:
-        bugun = datetime.now().strftime("%d.%m.%Y")
-        return URUN_TAKIP_TEMPLATE.replace("{{ bugun }}", bugun)
+        return sabit_sayfa(render_template('urun_takip.html'))
     except Exception as e:
         logger.error(f"Ürün takip formu hatası: {e}")
         return "Sistem geçici olarak hizmet veremiyor", 500
 
-@app.route('/save', methods=['POST'])
+def kayit_formundan_olustur(data):
+    """Ürün takip formundan gelen alanlarla yeni (henüz eklenmemiş) üretim emri oluşturur"""
+    # Tarih kontrolü
+    tarih = data.get('tarih', '')
+    if not tarih:
+        tarih = datetime.now().strftime("%d.%m.%Y")
+    
+    return UretimEmri(
+        musteri_adi=data.get('musteri_adi', '').strip(),
+        urun_adi=data.get('urun_adi', ''),
+        usiparis_miktari=data.get('usiparis_miktari', ''),
+        tabaka_adedi=data.get('tabaka_adedi', ''),
+        kagit_cinsi=data.get('kagit_cinsi', ''),
+        gramaj=data.get('gramaj', ''),
+        kagit_olcusu_1=data.get('kagit_olcusu_1', ''),
+        kagit_olcusu_2=data.get('kagit_olcusu_2', ''),
+        bicak_kodu=data.get('bicak_kodu', ''),
+        bicak_olcusu_1=data.get('bicak_olcusu_1', ''),
+        bicak_olcusu_2=data.get('bicak_olcusu_2', ''),
+        renk_sayisi=data.get('renk_sayisi', ''),
+        renk_bilgisi=data.get('renk_bilgisi', ''),
+        verim=data.get('verim', ''),
+        selefon_1=data.get('selefon_1', ''),
+        selefon_2=data.get('selefon_2', ''),
+        varak_yaldiz=data.get('varak_yaldiz', ''),
+        gofre=data.get('gofre', ''),
+        yapistirma=data.get('yapistirma', ''),
+        paketleme=data.get('paketleme', ''),
+        siparis_durumu=data.get('siparis_durumu', ''),
+        notlar=data.get('notlar', ''),
+        baski_adedi=data.get('baski_adedi', ''),
+        selefon_adedi=data.get('selefon_adedi', ''),
+        kesim_adedi=data.get('kesim_adedi', ''),
+        karton_agirligi=data.get('karton_agirligi', 'Hesaplanamadı'),
+        tarih=tarih
+    )
+
+@uretim.route('/save', methods=['POST'])
 def save_record():
     try:
         data = request.json
-        print(f"Gelen veri: {data}")  # Debug
+        ornekli_debug("Gelen veri: %s", data)
         
         if not data.get('musteri_adi', '').strip():
             return jsonify({'success': False, 'message': 'Müşteri adı zorunludur!'})
         
-        # Tarih kontrolü
-        tarih = data.get('tarih', '')
-        if not tarih:
-            tarih = datetime.now().strftime("%d.%m.%Y")
-        
-        yeni_kayit = UretimEmri(
-            musteri_adi=data.get('musteri_adi', '').strip(),
-            urun_adi=data.get('urun_adi', ''),
-            usiparis_miktari=data.get('usiparis_miktari', ''),
-            tabaka_adedi=data.get('tabaka_adedi', ''),
-            kagit_cinsi=data.get('kagit_cinsi', ''),
-            gramaj=data.get('gramaj', ''),
-            kagit_olcusu_1=data.get('kagit_olcusu_1', ''),
-            kagit_olcusu_2=data.get('kagit_olcusu_2', ''),
-            bicak_kodu=data.get('bicak_kodu', ''),
-            bicak_olcusu_1=data.get('bicak_olcusu_1', ''),
-            bicak_olcusu_2=data.get('bicak_olcusu_2', ''),
-            renk_sayisi=data.get('renk_sayisi', ''),
-            renk_bilgisi=data.get('renk_bilgisi', ''),
-            verim=data.get('verim', ''),
-            selefon_1=data.get('selefon_1', ''),
-            selefon_2=data.get('selefon_2', ''),
-            varak_yaldiz=data.get('varak_yaldiz', ''),
-            gofre=data.get('gofre', ''),
-            yapistirma=data.get('yapistirma', ''),
-            paketleme=data.get('paketleme', ''),
-            siparis_durumu=data.get('siparis_durumu', ''),
-            notlar=data.get('notlar', ''),
-            baski_adedi=data.get('baski_adedi', ''),
-            selefon_adedi=data.get('selefon_adedi', ''),
-            kesim_adedi=data.get('kesim_adedi', ''),
-            karton_agirligi=data.get('karton_agirligi', 'Hesaplanamadı'),
-            tarih=tarih
-        )
+        yeni_kayit = kayit_formundan_olustur(data)
         
         db.session.add(yeni_kayit)
         db.session.commit()
@@ -1617,11 +976,10 @@ def save_record():
     
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Kayıt hatası: {e}")
-        print(f"Kayıt hatası detayı: {traceback.format_exc()}")  # Debug
+        logger.error(f"Kayıt hatası: {e}", exc_info=True)
         return jsonify({'success': False, 'message': f'Sistem hatası: {str(e)}'})
 
-@app.route('/search')
+@uretim.route('/search')
 def search_records():
     try:
         query = request.args.get('q', '')
@@ -1648,9 +1006,13 @@ def search_records():
         logger.error(f"Arama hatası: {e}")
         return jsonify({'error': 'Arama sırasında hata oluştu'}), 500
 
-@app.route('/list')
+@uretim.route('/list')
 def list_records():
     try:
+        etiket = uretim_verisi_etiketi()
+        if request.if_none_match.contains_weak(etiket):
+            return surumlu_yanit(Response(status=304), etiket)
+        
         kayitlar = UretimEmri.query.order_by(UretimEmri.id.desc()).all()
         
         sonuc = []
@@ -1664,13 +1026,13 @@ def list_records():
                 'tarih': kayit.tarih
             })
         
-        return jsonify(sonuc)
+        return surumlu_yanit(jsonify(sonuc), etiket)
     
     except Exception as e:
         logger.error(f"Listeleme hatası: {e}")
         return jsonify({'error': 'Listeleme sırasında hata oluştu'}), 500
 
-@app.route('/record/<int:id>')
+@uretim.route('/record/<int:id>')
 def get_record(id):
     try:
         kayit = UretimEmri.query.get_or_404(id)
@@ -1709,7 +1071,7 @@ def get_record(id):
         logger.error(f"Kayıt getirme hatası: {e}")
         return jsonify({'error': 'Kayıt getirilirken hata oluştu'}), 500
 
-@app.route('/delete/<int:id>', methods=['DELETE'])
+@uretim.route('/delete/<int:id>', methods=['DELETE'])
 def delete_record(id):
     try:
         kayit = UretimEmri.query.get_or_404(id)
@@ -1725,47 +1087,51 @@ def delete_record(id):
         logger.error(f"Silme hatası: {e}")
         return jsonify({'success': False, 'message': f'Silme hatası: {str(e)}'})
 
-@app.route('/export/excel')
+def uretim_excel_yaz(hedef):
+    """Tüm üretim kayıtlarını Excel olarak hedefe (dosya yolu veya BytesIO) yazar"""
+    import pandas as pd
+    kayitlar = UretimEmri.query.all()
+    
+    data = []
+    for kayit in kayitlar:
+        data.append({
+            'ID': kayit.id,
+            'Müşteri Adı': kayit.musteri_adi,
+            'Ürün Adı': kayit.urun_adi,
+            'Üretim/Sipariş Miktarı': kayit.usiparis_miktari,
+            'Tabaka Adedi': kayit.tabaka_adedi,
+            'Kağıt Cinsi': kayit.kagit_cinsi,
+            'Gramaj': kayit.gramaj,
+            'Kağıt Ölçüsü': f"{kayit.kagit_olcusu_1} x {kayit.kagit_olcusu_2}",
+            'Bıçak Kodu': kayit.bicak_kodu,
+            'Bıçak Ölçüsü': f"{kayit.bicak_olcusu_1} x {kayit.bicak_olcusu_2} mm",
+            'Renk Sayısı': kayit.renk_sayisi,
+            'Renk Bilgisi': kayit.renk_bilgisi,
+            'Verim': kayit.verim,
+            'Selefon': f"{kayit.selefon_1} x {kayit.selefon_2}",
+            'Varak Yaldız': kayit.varak_yaldiz,
+            'Gofre': kayit.gofre,
+            'Yapıştırma': kayit.yapistirma,
+            'Paketleme': kayit.paketleme,
+            'Sipariş Durumu': kayit.siparis_durumu,
+            'Notlar': kayit.notlar,
+            'Baskı Adedi': kayit.baski_adedi,
+            'Selefon Adedi': kayit.selefon_adedi,
+            'Kesim Adedi': kayit.kesim_adedi,
+            'Karton Ağırlığı': kayit.karton_agirligi,
+            'Tarih': kayit.tarih
+        })
+    
+    df = pd.DataFrame(data)
+    
+    with pd.ExcelWriter(hedef, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='KutuDunyasi_Uretim')
+
+@uretim.route('/export/excel')
 def export_excel():
     try:
-        kayitlar = UretimEmri.query.all()
-        
-        data = []
-        for kayit in kayitlar:
-            data.append({
-                'ID': kayit.id,
-                'Müşteri Adı': kayit.musteri_adi,
-                'Ürün Adı': kayit.urun_adi,
-                'Üretim/Sipariş Miktarı': kayit.usiparis_miktari,
-                'Tabaka Adedi': kayit.tabaka_adedi,
-                'Kağıt Cinsi': kayit.kagit_cinsi,
-                'Gramaj': kayit.gramaj,
-                'Kağıt Ölçüsü': f"{kayit.kagit_olcusu_1} x {kayit.kagit_olcusu_2}",
-                'Bıçak Kodu': kayit.bicak_kodu,
-                'Bıçak Ölçüsü': f"{kayit.bicak_olcusu_1} x {kayit.bicak_olcusu_2} mm",
-                'Renk Sayısı': kayit.renk_sayisi,
-                'Renk Bilgisi': kayit.renk_bilgisi,
-                'Verim': kayit.verim,
-                'Selefon': f"{kayit.selefon_1} x {kayit.selefon_2}",
-                'Varak Yaldız': kayit.varak_yaldiz,
-                'Gofre': kayit.gofre,
-                'Yapıştırma': kayit.yapistirma,
-                'Paketleme': kayit.paketleme,
-                'Sipariş Durumu': kayit.siparis_durumu,
-                'Notlar': kayit.notlar,
-                'Baskı Adedi': kayit.baski_adedi,
-                'Selefon Adedi': kayit.selefon_adedi,
-                'Kesim Adedi': kayit.kesim_adedi,
-                'Karton Ağırlığı': kayit.karton_agirligi,
-                'Tarih': kayit.tarih
-            })
-        
-        df = pd.DataFrame(data)
-        
         output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='KutuDunyasi_Uretim')
-        
+        uretim_excel_yaz(output)
         output.seek(0)
         
         return send_file(
@@ -1782,10 +1148,14 @@ def export_excel():
 
 
 
-@app.route('/api/production-data')
+@uretim.route('/api/production-data')
 def production_data():
     """Üretim verilerini JSON olarak döndür"""
     try:
+        etiket = uretim_verisi_etiketi()
+        if request.if_none_match.contains_weak(etiket):
+            return surumlu_yanit(Response(status=304), etiket)
+        
         kayitlar = UretimEmri.query.order_by(UretimEmri.id.desc()).all()
         
         sonuc = []
@@ -1822,13 +1192,54 @@ def production_data():
                 'olusturma_tarihi': kayit.olusturma_tarihi.strftime("%Y-%m-%d %H:%M:%S") if kayit.olusturma_tarihi else ''
             })
         
-        return jsonify(sonuc)
+        return surumlu_yanit(jsonify(sonuc), etiket)
     
     except Exception as e:
         logger.error(f"Production data hatası: {e}")
         return jsonify({'error': 'Veriler yüklenirken hata oluştu'}), 500
 
-@app.route('/api/production-add', methods=['POST'])
+def uretim_emri_olustur(data):
+    """İstemciden gelen alanlarla yeni (henüz eklenmemiş) üretim emri oluşturur"""
+    # Tarih formatını düzelt (YYYY-MM-DD -> DD.MM.YYYY)
+    tarih = data.get('tarih', '')
+    if tarih:
+        try:
+            tarih_obj = datetime.strptime(tarih, "%Y-%m-%d")
+            tarih = tarih_obj.strftime("%d.%m.%Y")
+        except:
+            tarih = datetime.now().strftime("%d.%m.%Y")
+    
+    return UretimEmri(
+        musteri_adi=data.get('musteri_adi', '').strip(),
+        urun_adi=data.get('urun_adi', ''),
+        usiparis_miktari=data.get('usiparis_miktari', ''),
+        tabaka_adedi=data.get('tabaka_adedi', ''),
+        kagit_cinsi=data.get('kagit_cinsi', ''),
+        gramaj=data.get('gramaj', ''),
+        kagit_olcusu_1=data.get('kagit_olcusu_1', ''),
+        kagit_olcusu_2=data.get('kagit_olcusu_2', ''),
+        bicak_kodu=data.get('bicak_kodu', ''),
+        bicak_olcusu_1=data.get('bicak_olcusu_1', ''),
+        bicak_olcusu_2=data.get('bicak_olcusu_2', ''),
+        renk_sayisi=data.get('renk_sayisi', ''),
+        renk_bilgisi=data.get('renk_bilgisi', ''),
+        verim=data.get('verim', ''),
+        selefon_1=data.get('selefon_1', ''),
+        selefon_2=data.get('selefon_2', ''),
+        varak_yaldiz=data.get('varak_yaldiz', 'YOK'),
+        gofre=data.get('gofre', 'YOK'),
+        yapistirma=data.get('yapistirma', 'YOK'),
+        paketleme=data.get('paketleme', ''),
+        siparis_durumu=data.get('siparis_durumu', 'YENİ'),
+        notlar=data.get('notlar', ''),
+        baski_adedi=data.get('baski_adedi', ''),
+        selefon_adedi=data.get('selefon_adedi', ''),
+        kesim_adedi=data.get('kesim_adedi', ''),
+        karton_agirligi=data.get('karton_agirligi', ''),
+        tarih=tarih
+    )
+
+@uretim.route('/api/production-add', methods=['POST'])
 def production_add():
     """Yeni üretim kaydı ekle"""
     try:
@@ -1837,44 +1248,7 @@ def production_add():
         if not data.get('musteri_adi', '').strip():
             return jsonify({'success': False, 'message': 'Müşteri adı zorunludur!'})
         
-        # Tarih formatını düzelt (YYYY-MM-DD -> DD.MM.YYYY)
-        tarih = data.get('tarih', '')
-        if tarih:
-            try:
-                tarih_obj = datetime.strptime(tarih, "%Y-%m-%d")
-                tarih = tarih_obj.strftime("%d.%m.%Y")
-            except:
-                tarih = datetime.now().strftime("%d.%m.%Y")
-        
-        yeni_kayit = UretimEmri(
-            musteri_adi=data.get('musteri_adi', '').strip(),
-            urun_adi=data.get('urun_adi', ''),
-            usiparis_miktari=data.get('usiparis_miktari', ''),
-            tabaka_adedi=data.get('tabaka_adedi', ''),
-            kagit_cinsi=data.get('kagit_cinsi', ''),
-            gramaj=data.get('gramaj', ''),
-            kagit_olcusu_1=data.get('kagit_olcusu_1', ''),
-            kagit_olcusu_2=data.get('kagit_olcusu_2', ''),
-            bicak_kodu=data.get('bicak_kodu', ''),
-            bicak_olcusu_1=data.get('bicak_olcusu_1', ''),
-            bicak_olcusu_2=data.get('bicak_olcusu_2', ''),
-            renk_sayisi=data.get('renk_sayisi', ''),
-            renk_bilgisi=data.get('renk_bilgisi', ''),
-            verim=data.get('verim', ''),
-            selefon_1=data.get('selefon_1', ''),
-            selefon_2=data.get('selefon_2', ''),
-            varak_yaldiz=data.get('varak_yaldiz', 'YOK'),
-            gofre=data.get('gofre', 'YOK'),
-            yapistirma=data.get('yapistirma', 'YOK'),
-            paketleme=data.get('paketleme', ''),
-            siparis_durumu=data.get('siparis_durumu', 'YENİ'),
-            notlar=data.get('notlar', ''),
-            baski_adedi=data.get('baski_adedi', ''),
-            selefon_adedi=data.get('selefon_adedi', ''),
-            kesim_adedi=data.get('kesim_adedi', ''),
-            karton_agirligi=data.get('karton_agirligi', ''),
-            tarih=tarih
-        )
+        yeni_kayit = uretim_emri_olustur(data)
         
         db.session.add(yeni_kayit)
         db.session.commit()
@@ -1887,7 +1261,25 @@ def production_add():
         logger.error(f"Üretim kaydı ekleme hatası: {e}")
         return jsonify({'success': False, 'message': f'Sistem hatası: {str(e)}'})
 
-@app.route('/api/production-update', methods=['POST'])
+# production-update ile güncellenebilen alanlar (tarih ayrıca YYYY-MM-DD olarak gelir)
+GUNCELLENEBILIR_ALANLAR = ('musteri_adi', 'urun_adi', 'usiparis_miktari', 'siparis_durumu', 'notlar')
+
+def uretim_emri_guncelle(kayit, data):
+    """production-update alanlarını kayda uygular"""
+    # Tarih formatını düzelt
+    tarih = data.get('tarih', '')
+    if tarih:
+        try:
+            tarih_obj = datetime.strptime(tarih, "%Y-%m-%d")
+            kayit.tarih = tarih_obj.strftime("%d.%m.%Y")
+        except:
+            pass
+    
+    # Diğer alanları güncelle
+    for alan in GUNCELLENEBILIR_ALANLAR:
+        setattr(kayit, alan, data.get(alan, getattr(kayit, alan)))
+
+@uretim.route('/api/production-update', methods=['POST'])
 def production_update():
     """Üretim kaydını güncelle"""
     try:
@@ -1901,21 +1293,7 @@ def production_update():
         if not kayit:
             return jsonify({'success': False, 'message': 'Kayıt bulunamadı!'})
         
-        # Tarih formatını düzelt
-        tarih = data.get('tarih', '')
-        if tarih:
-            try:
-                tarih_obj = datetime.strptime(tarih, "%Y-%m-%d")
-                kayit.tarih = tarih_obj.strftime("%d.%m.%Y")
-            except:
-                pass
-        
-        # Diğer alanları güncelle
-        kayit.musteri_adi = data.get('musteri_adi', kayit.musteri_adi)
-        kayit.urun_adi = data.get('urun_adi', kayit.urun_adi)
-        kayit.usiparis_miktari = data.get('usiparis_miktari', kayit.usiparis_miktari)
-        kayit.siparis_durumu = data.get('siparis_durumu', kayit.siparis_durumu)
-        kayit.notlar = data.get('notlar', kayit.notlar)
+        uretim_emri_guncelle(kayit, data)
         
         db.session.commit()
         
@@ -1927,7 +1305,7 @@ def production_update():
         logger.error(f"Üretim kaydı güncelleme hatası: {e}")
         return jsonify({'success': False, 'message': f'Sistem hatası: {str(e)}'})
 
-@app.route('/api/production-update-cell', methods=['POST'])
+@uretim.route('/api/production-update-cell', methods=['POST'])
 def production_update_cell():
     """Tek bir hücreyi güncelle"""
     try:
@@ -1957,7 +1335,7 @@ def production_update_cell():
         logger.error(f"Hücre güncelleme hatası: {e}")
         return jsonify({'success': False, 'message': f'Sistem hatası: {str(e)}'})
 
-@app.route('/api/production-delete/<int:id>', methods=['DELETE'])
+@uretim.route('/api/production-delete/<int:id>', methods=['DELETE'])
 def production_delete(id):
     """Tek bir üretim kaydını sil"""
     try:
@@ -1974,7 +1352,7 @@ def production_delete(id):
         logger.error(f"Üretim kaydı silme hatası: {e}")
         return jsonify({'success': False, 'message': f'Silme hatası: {str(e)}'})
 
-@app.route('/api/production-delete-batch', methods=['POST'])
+@uretim.route('/api/production-delete-batch', methods=['POST'])
 def production_delete_batch():
     """Toplu kayıt silme"""
     try:
@@ -2001,64 +1379,200 @@ def production_delete_batch():
         logger.error(f"Toplu silme hatası: {e}")
         return jsonify({'success': False, 'message': f'Silme hatası: {str(e)}'})
 
-@app.route('/api/production-export-excel')
-def production_export_excel():
-    """Üretim verilerini Excel olarak dışa aktar"""
+# ÇEVRİMDIŞI SENKRONİZASYON
+# Atölye tabletlerindeki servis çalışanı (static/js/servis_calisani.js) ağ
+# yokken yapılan yazmaları kuyrukta tutar, bağlantı gelince buraya sırayla ve
+# partiler halinde gönderir. Her işlem kendi savepoint'inde uygulanır:
+# - Aynı anahtarla tekrar gelen işlem yeniden uygulanmaz, kayıtlı sonucu döner
+#   (yanıtı kaybolan parti güvenle yeniden gönderilebilir).
+# - İstemcinin değiştirmeden önce gördüğü değer ('eski') sunucudakiyle
+#   uyuşmuyorsa alan başka biri tarafından değiştirilmiştir; işlem uygulanmaz,
+#   'cakisma' ve güncel değerler döner. 'eski' yoksa son yazan kazanır.
+# - Çevrimdışı eklenen kayıtlar negatif geçici id taşır; aynı partide bu id'ye
+#   gelen işlemler gerçek kayda uygulanır, gerçek id yanıtta döner.
+SENKRON_ALANLARI = frozenset(UretimEmri.__table__.columns.keys()) - {'id', 'olusturma_tarihi'}
+
+def senkron_degeri(deger):
+    """Karşılaştırma için alan değeri (None ve boş metin aynı sayılır)"""
+    return '' if deger is None else str(deger)
+
+def cakisan_alanlar(kayit, yeni, eski):
+    """İstemci değeri okuduktan sonra başkasınca değiştirilmiş alanları güncel değerleriyle döndürür"""
+    cakisanlar = {}
+    for alan, deger in yeni.items():
+        if alan not in eski:
+            continue
+        mevcut = senkron_degeri(getattr(kayit, alan))
+        if mevcut != senkron_degeri(eski[alan]) and mevcut != senkron_degeri(deger):
+            cakisanlar[alan] = getattr(kayit, alan)
+    return cakisanlar
+
+def senkron_islemi_uygula(islem, gecici_idler):
+    """Kuyruktaki tek işlemi uygular, sonucunu döndürür"""
+    tur = islem.get('tur')
+    
+    if tur in ('ekle', 'kaydet'):
+        alanlar = islem.get('alanlar') or {}
+        if not str(alanlar.get('musteri_adi') or '').strip():
+            return {'durum': 'gecersiz', 'mesaj': 'Müşteri adı zorunludur!'}
+        # 'kaydet' ürün takip formundan (/save), 'ekle' planlama tablosundan gelir
+        kayit = kayit_formundan_olustur(alanlar) if tur == 'kaydet' else uretim_emri_olustur(alanlar)
+        db.session.add(kayit)
+        db.session.flush()
+        if islem.get('gecici_id'):
+            gecici_idler[islem['gecici_id']] = kayit.id
+        return {'durum': 'tamam', 'id': kayit.id, 'gecici_id': islem.get('gecici_id')}
+    
     try:
-        kayitlar = UretimEmri.query.order_by(UretimEmri.id.desc()).all()
-        
-        data = []
-        for kayit in kayitlar:
-            data.append({
-                'ID': kayit.id,
-                'Tarih': kayit.tarih,
-                'Müşteri Adı': kayit.musteri_adi,
-                'Ürün Adı': kayit.urun_adi,
-                'Miktar': kayit.usiparis_miktari,
-                'Bıçak Kodu': kayit.bicak_kodu,
-                'Bıçak Ölçüsü': f"{kayit.bicak_olcusu_1 or ''} x {kayit.bicak_olcusu_2 or ''}",
-                'Renk Sayısı': kayit.renk_sayisi,
-                'Renk Bilgisi': kayit.renk_bilgisi,
-                'Durum': kayit.siparis_durumu,
-                'Kağıt Cinsi': kayit.kagit_cinsi,
-                'Gramaj': kayit.gramaj,
-                'Kağıt Ölçüsü': f"{kayit.kagit_olcusu_1 or ''} x {kayit.kagit_olcusu_2 or ''}",
-                'Selefon': f"{kayit.selefon_1 or ''} x {kayit.selefon_2 or ''}",
-                'Varak Yaldız': kayit.varak_yaldiz,
-                'Gofre': kayit.gofre,
-                'Yapıştırma': kayit.yapistirma,
-                'Paketleme': kayit.paketleme,
-                'Baskı Adedi': kayit.baski_adedi,
-                'Selefon Adedi': kayit.selefon_adedi,
-                'Kesim Adedi': kayit.kesim_adedi,
-                'Karton Ağırlığı': kayit.karton_agirligi,
-                'Verim': kayit.verim,
-                'Notlar': kayit.notlar,
-                'Oluşturma Tarihi': kayit.olusturma_tarihi.strftime("%d.%m.%Y %H:%M") if kayit.olusturma_tarihi else ''
-            })
-        
-        df = pd.DataFrame(data)
+        kayit_id = int(islem.get('id'))
+    except (TypeError, ValueError):
+        kayit_id = None
+    if kayit_id is not None and kayit_id < 0:
+        kayit_id = gecici_idler.get(kayit_id)
+    kayit = db.session.get(UretimEmri, kayit_id) if kayit_id is not None else None
+    
+    if tur == 'sil':
+        # Zaten silinmiş kayıt için de işlem tamamlanmış sayılır
+        if kayit:
+            db.session.delete(kayit)
+        return {'durum': 'tamam', 'id': kayit_id}
+    if tur not in ('hucre', 'guncelle'):
+        return {'durum': 'gecersiz', 'mesaj': 'Bilinmeyen işlem türü!'}
+    if not kayit:
+        return {'durum': 'bulunamadi', 'id': kayit_id}
+    
+    if tur == 'hucre':
+        if islem.get('alan') not in SENKRON_ALANLARI:
+            return {'durum': 'gecersiz', 'id': kayit_id, 'mesaj': 'Geçersiz alan!'}
+        yeni = {islem['alan']: islem.get('deger')}
+    else:
+        alanlar = islem.get('alanlar') or {}
+        yeni = {alan: alanlar[alan] for alan in GUNCELLENEBILIR_ALANLAR if alan in alanlar}
+    
+    cakisanlar = cakisan_alanlar(kayit, yeni, islem.get('eski') or {})
+    if cakisanlar:
+        return {'durum': 'cakisma', 'id': kayit_id, 'mevcut': cakisanlar}
+    
+    if tur == 'hucre':
+        setattr(kayit, islem['alan'], islem.get('deger'))
+    else:
+        uretim_emri_guncelle(kayit, islem.get('alanlar') or {})
+    return {'durum': 'tamam', 'id': kayit_id}
+
+@uretim.route('/api/production-sync', methods=['POST'])
+def production_sync():
+    """Çevrimdışı kuyruktaki yazmaları sırayla uygular, her işlemin sonucunu döndürür"""
+    try:
+        islemler = (request.get_json(silent=True) or {}).get('islemler')
+        if not isinstance(islemler, list) or not all(isinstance(islem, dict) for islem in islemler):
+            return jsonify({'error': 'islemler listesi gerekli'}), 400
+        if len(islemler) > app.config['SENKRON_PARTI_LIMITI']:
+            return jsonify({'error': f"Bir partide en fazla {app.config['SENKRON_PARTI_LIMITI']} işlem gönderilebilir"}), 400
+        
+        anahtarlar = [str(islem.get('anahtar', ''))[:64] for islem in islemler]
+        uygulananlar = {
+            senkron.anahtar: json.loads(senkron.sonuc)
+            for senkron in SenkronIslemi.query.filter(SenkronIslemi.anahtar.in_(set(anahtarlar)))
+        }
         
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Üretim Planlama')
+        gecici_idler = {}
+        sonuclar = []
+        for anahtar, islem in zip(anahtarlar, islemler):
+            if not anahtar:
+                sonuclar.append({'anahtar': None, 'durum': 'gecersiz', 'mesaj': 'İşlem anahtarı gerekli!'})
+                continue
             
-            # Sayfa formatını ayarla
-            worksheet = writer.sheets['Üretim Planlama']
+            sonuc = uygulananlar.get(anahtar)
+            if sonuc is None:
+                try:
+                    with db.session.begin_nested():
+                        sonuc = senkron_islemi_uygula(islem, gecici_idler)
+                        db.session.add(SenkronIslemi(anahtar=anahtar, sonuc=json.dumps(sonuc, ensure_ascii=False)))
+                    uygulananlar[anahtar] = sonuc
+                except Exception as e:
+                    # Kaydedilmez; aynı işlem sonraki gönderimde yeniden denenir
+                    logger.error(f"Senkronizasyon işlemi hatası ({anahtar}): {e}")
+                    sonuc = {'durum': 'hata', 'mesaj': 'İşlem uygulanamadı'}
+            elif sonuc.get('gecici_id') and sonuc.get('id'):
+                gecici_idler[sonuc['gecici_id']] = sonuc['id']
             
-            # Kolon genişliklerini ayarla
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+            sonuclar.append(dict(sonuc, anahtar=anahtar))
         
+        sinir = datetime.now() - timedelta(days=app.config['SENKRON_SAKLAMA_GUNU'])
+        SenkronIslemi.query.filter(SenkronIslemi.olusturma_tarihi < sinir).delete(synchronize_session=False)
+        db.session.commit()
+        
+        durumlar = [sonuc['durum'] for sonuc in sonuclar]
+        logger.info(f"Senkronizasyon: {len(durumlar)} işlem, {durumlar.count('cakisma')} çakışma")
+        return jsonify({'sonuclar': sonuclar})
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Senkronizasyon hatası: {e}")
+        return jsonify({'error': 'Senkronizasyon sırasında hata oluştu'}), 500
+
+def planlama_excel_yaz(hedef):
+    """Üretim planlama verilerini Excel olarak hedefe (dosya yolu veya BytesIO) yazar"""
+    import pandas as pd
+    kayitlar = UretimEmri.query.order_by(UretimEmri.id.desc()).all()
+    
+    data = []
+    for kayit in kayitlar:
+        data.append({
+            'ID': kayit.id,
+            'Tarih': kayit.tarih,
+            'Müşteri Adı': kayit.musteri_adi,
+            'Ürün Adı': kayit.urun_adi,
+            'Miktar': kayit.usiparis_miktari,
+            'Bıçak Kodu': kayit.bicak_kodu,
+            'Bıçak Ölçüsü': f"{kayit.bicak_olcusu_1 or ''} x {kayit.bicak_olcusu_2 or ''}",
+            'Renk Sayısı': kayit.renk_sayisi,
+            'Renk Bilgisi': kayit.renk_bilgisi,
+            'Durum': kayit.siparis_durumu,
+            'Kağıt Cinsi': kayit.kagit_cinsi,
+            'Gramaj': kayit.gramaj,
+            'Kağıt Ölçüsü': f"{kayit.kagit_olcusu_1 or ''} x {kayit.kagit_olcusu_2 or ''}",
+            'Selefon': f"{kayit.selefon_1 or ''} x {kayit.selefon_2 or ''}",
+            'Varak Yaldız': kayit.varak_yaldiz,
+            'Gofre': kayit.gofre,
+            'Yapıştırma': kayit.yapistirma,
+            'Paketleme': kayit.paketleme,
+            'Baskı Adedi': kayit.baski_adedi,
+            'Selefon Adedi': kayit.selefon_adedi,
+            'Kesim Adedi': kayit.kesim_adedi,
+            'Karton Ağırlığı': kayit.karton_agirligi,
+            'Verim': kayit.verim,
+            'Notlar': kayit.notlar,
+            'Oluşturma Tarihi': kayit.olusturma_tarihi.strftime("%d.%m.%Y %H:%M") if kayit.olusturma_tarihi else ''
+        })
+    
+    df = pd.DataFrame(data)
+    
+    with pd.ExcelWriter(hedef, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Üretim Planlama')
+        
+        # Sayfa formatını ayarla
+        worksheet = writer.sheets['Üretim Planlama']
+        
+        # Kolon genişliklerini ayarla
+        for column in worksheet.columns:
+            max_length = 0
+            column_letter = column[0].column_letter
+            for cell in column:
+                try:
+                    if len(str(cell.value)) > max_length:
+                        max_length = len(str(cell.value))
+                except:
+                    pass
+            adjusted_width = min(max_length + 2, 50)
+            worksheet.column_dimensions[column_letter].width = adjusted_width
+
+@uretim.route('/api/production-export-excel')
+def production_export_excel():
+    """Üretim verilerini Excel olarak dışa aktar"""
+    try:
+        output = BytesIO()
+        planlama_excel_yaz(output)
         output.seek(0)
         
         return send_file(
@@ -2072,311 +1586,556 @@ def production_export_excel():
         logger.error(f"Üretim Excel export hatası: {e}")
         return jsonify({'error': 'Excel export sırasında hata oluştu'}), 500
 
-# PDF FONKSİYONLARI
-def turkce_duzelt(metin):
-    if not metin:
-        return ""
-    # Türkçe karakterleri İngilizce karşılıklarıyla değiştir
-    cevirme_tablosu = {
-        'ı': 'i', 'İ': 'I', 'ğ': 'g', 'Ğ': 'G',
-        'ü': 'u', 'Ü': 'U', 'ş': 's', 'Ş': 'S',
-        'ö': 'o', 'Ö': 'O', 'ç': 'c', 'Ç': 'C'
+# DIŞA AKTARMA İŞ KUYRUĞU
+# Büyük Excel dosyaları istek thread'inde değil, sınırlı bir işçi havuzunda
+# geçici dizine yazılır. İş durumları dizindeki JSON dosyalarında tutulur,
+# böylece hangi süreç sorulursa sorulsun aynı cevabı verir.
+DISA_AKTARMA_TURLERI = {
+    'excel': (uretim_excel_yaz, 'KutuDunyasi_Uretim'),
+    'uretim-excel': (planlama_excel_yaz, 'Uretim_Planlama'),
+}
+
+_disa_aktarma_havuzu = None
+_disa_aktarma_kilidi = threading.Lock()
+# Bekleyen iş sınırı semaforları (dışa aktarma ve PDF kuyruğu) import sırasında
+# değil ilk kullanımda oluşturulur; create_app(ayarlar) ile verilen sınırlar geçerli olur.
+_yer_tutucular = {}
+_yer_tutucu_kilidi = threading.Lock()
+
+def yer_tutucu(ayar):
+    """Sınırı verilen ayardan okunan semaforu döndürür (ilk çağrıda oluşturur)"""
+    with _yer_tutucu_kilidi:
+        if ayar not in _yer_tutucular:
+            _yer_tutucular[ayar] = threading.BoundedSemaphore(app.config[ayar])
+        return _yer_tutucular[ayar]
+
+def disa_aktarma_havuzu():
+    """İşçi havuzunu ilk kullanımda oluşturur"""
+    global _disa_aktarma_havuzu
+    with _disa_aktarma_kilidi:
+        if _disa_aktarma_havuzu is None:
+            _disa_aktarma_havuzu = ThreadPoolExecutor(
+                max_workers=app.config['DISA_AKTARMA_ISCI_SAYISI'],
+                thread_name_prefix='disa-aktarma'
+            )
+        return _disa_aktarma_havuzu
+
+def _is_yolu(is_id):
+    return os.path.join(app.config['DISA_AKTARMA_DIZINI'], f"{is_id}.json")
+
+def _cikti_yolu(tur, surum):
+    # Veritabanı kimliği de ada girer; başka bir veritabanının aynı sürümdeki dosyası kullanılmaz
+    return os.path.join(app.config['DISA_AKTARMA_DIZINI'], f"{tur}_{veri_kimligi_getir()}_{surum}.xlsx")
+
+def is_kaydet(is_bilgisi):
+    """İş bilgisini atomik olarak diske yazar"""
+    yol = _is_yolu(is_bilgisi['id'])
+    gecici = f"{yol}.{threading.get_ident()}.tmp"
+    with open(gecici, 'w', encoding='utf-8') as f:
+        json.dump(is_bilgisi, f, ensure_ascii=False)
+    os.replace(gecici, yol)
+
+def is_getir(is_id):
+    """İş bilgisini diskten okur, yoksa None döndürür"""
+    try:
+        uuid.UUID(hex=is_id)
+        with open(_is_yolu(is_id), encoding='utf-8') as f:
+            return json.load(f)
+    except (ValueError, OSError):
+        return None
+
+def disa_aktarma_calistir(is_id, tur):
+    """İşçi thread'inde Excel dosyasını üretir"""
+    yazici, _ = DISA_AKTARMA_TURLERI[tur]
+    is_bilgisi = is_getir(is_id)
+    try:
+        if is_bilgisi is None:
+            # İş kaydı bu arada silinmiş veya okunamıyor
+            raise LookupError('İş kaydı bulunamadı')
+        is_bilgisi['durum'] = 'calisiyor'
+        is_kaydet(is_bilgisi)
+        
+        with app.app_context():
+            surum = veri_surumu_getir()
+            cikti = _cikti_yolu(tur, surum)
+            if not os.path.exists(cikti):
+                gecici = _cikti_yolu(tur, f"{surum}.{is_id}.tmp")
+                yazici(gecici)
+                os.replace(gecici, cikti)
+                eski_ciktilari_temizle(tur, surum)
+        
+        is_bilgisi.update(durum='tamamlandi', surum=surum, dosya=os.path.basename(cikti),
+                          bitis=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        is_kaydet(is_bilgisi)
+        logger.info(f"Dışa aktarma tamamlandı: {tur} (iş {is_id}, sürüm {surum})")
+    
+    except Exception as e:
+        logger.error(f"Dışa aktarma hatası: {tur} (iş {is_id}): {e}")
+        if is_bilgisi is not None:
+            is_bilgisi.update(durum='hata', hata=str(e))
+            is_kaydet(is_bilgisi)
+    
+    finally:
+        yer_tutucu('DISA_AKTARMA_KUYRUK_LIMITI').release()
+
+def eski_ciktilari_temizle(tur, surum):
+    """
+    Aynı türün bu veritabanına ait, verilen sürümden eski dosyalarını ve bir
+    günden eski iş kayıtlarını siler. Daha yeni sürümün dosyası (aynı anda
+    çalışan başka bir işin çıktısı) bırakılır.
+    """
+    dizin = app.config['DISA_AKTARMA_DIZINI']
+    onek = f"{tur}_{veri_kimligi_getir()}_"
+    simdi = datetime.now().timestamp()
+    for dosya in os.listdir(dizin):
+        yol = os.path.join(dizin, dosya)
+        try:
+            dosya_surumu = dosya[len(onek):-len('.xlsx')]
+            if (dosya.startswith(onek) and dosya.endswith('.xlsx')
+                    and dosya_surumu.isdigit() and int(dosya_surumu) < surum):
+                os.remove(yol)
+            elif dosya.endswith('.json') and simdi - os.path.getmtime(yol) > 24 * 60 * 60:
+                os.remove(yol)
+        except OSError:
+            pass
+
+def _is_yaniti(is_bilgisi):
+    sonuc = {
+        'success': is_bilgisi['durum'] != 'hata',
+        'is_id': is_bilgisi['id'],
+        'tur': is_bilgisi['tur'],
+        'durum': is_bilgisi['durum'],
+        'durum_url': f"/api/export-jobs/{is_bilgisi['id']}"
     }
-    for tr, en in cevirme_tablosu.items():
-        metin = str(metin).replace(tr, en)
-    return metin
+    if is_bilgisi['durum'] == 'tamamlandi':
+        sonuc['indirme_url'] = f"/api/export-jobs/{is_bilgisi['id']}/download"
+    if is_bilgisi.get('hata'):
+        sonuc['message'] = is_bilgisi['hata']
+    return sonuc
+
+@uretim.route('/api/export-jobs', methods=['POST'])
+def export_job_olustur():
+    """Dışa aktarma işini kuyruğa ekler (veri değişmediyse hazır dosyayı kullanır)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        tur = data.get('tur', 'excel')
+        
+        if tur not in DISA_AKTARMA_TURLERI:
+            return jsonify({'success': False, 'message': 'Geçersiz dışa aktarma türü!'}), 400
+        
+        os.makedirs(app.config['DISA_AKTARMA_DIZINI'], exist_ok=True)
+        
+        is_bilgisi = {
+            'id': uuid.uuid4().hex,
+            'tur': tur,
+            'durum': 'bekliyor',
+            'olusturma': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        # Veri değişmediyse daha önce üretilen dosyayı tekrar kullan
+        surum = veri_surumu_getir()
+        if os.path.exists(_cikti_yolu(tur, surum)):
+            is_bilgisi.update(durum='tamamlandi', surum=surum, dosya=os.path.basename(_cikti_yolu(tur, surum)))
+            is_kaydet(is_bilgisi)
+            return jsonify(_is_yaniti(is_bilgisi))
+        
+        # Kuyruk doluysa yeni iş kabul etme
+        if not yer_tutucu('DISA_AKTARMA_KUYRUK_LIMITI').acquire(blocking=False):
+            yanit = jsonify({'success': False, 'message': 'Dışa aktarma kuyruğu dolu, lütfen biraz sonra tekrar deneyin.'})
+            yanit.headers['Retry-After'] = '10'
+            return yanit, 503
+        
+        try:
+            is_kaydet(is_bilgisi)
+            disa_aktarma_havuzu().submit(disa_aktarma_calistir, is_bilgisi['id'], tur)
+        except Exception:
+            yer_tutucu('DISA_AKTARMA_KUYRUK_LIMITI').release()
+            raise
+        
+        logger.info(f"Dışa aktarma işi kuyruğa eklendi: {tur} (iş {is_bilgisi['id']})")
+        return jsonify(_is_yaniti(is_bilgisi)), 202
+    
+    except Exception as e:
+        logger.error(f"Dışa aktarma işi oluşturma hatası: {e}")
+        return jsonify({'success': False, 'message': f'Sistem hatası: {str(e)}'}), 500
+
+@uretim.route('/api/export-jobs/<is_id>')
+def export_job_durumu(is_id):
+    """Dışa aktarma işinin durumunu döndürür"""
+    is_bilgisi = is_getir(is_id)
+    if not is_bilgisi:
+        return jsonify({'success': False, 'message': 'İş bulunamadı!'}), 404
+    return jsonify(_is_yaniti(is_bilgisi))
+
+@uretim.route('/api/export-jobs/<is_id>/download')
+def export_job_indir(is_id):
+    """Tamamlanan dışa aktarma dosyasını indirir"""
+    try:
+        is_bilgisi = is_getir(is_id)
+        if not is_bilgisi:
+            return jsonify({'success': False, 'message': 'İş bulunamadı!'}), 404
+        
+        if is_bilgisi['durum'] != 'tamamlandi':
+            return jsonify(_is_yaniti(is_bilgisi)), 409
+        
+        cikti = os.path.join(app.config['DISA_AKTARMA_DIZINI'], is_bilgisi['dosya'])
+        if not os.path.exists(cikti):
+            return jsonify({'success': False, 'message': 'Dosya artık mevcut değil, lütfen yeniden oluşturun.'}), 410
+        
+        _, dosya_oneki = DISA_AKTARMA_TURLERI[is_bilgisi['tur']]
+        return send_file(
+            cikti,
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            as_attachment=True,
+            download_name=f'{dosya_oneki}_{datetime.now().strftime("%Y%m%d_%H%M")}.xlsx'
+        )
+    
+    except Exception as e:
+        logger.error(f"Dışa aktarma indirme hatası: {e}")
+        return jsonify({'error': 'Dosya indirilirken hata oluştu'}), 500
+
+# PDF İŞLEM HAVUZU
+# reportlab render'ı saf Python ve CPU yoğun; web sürecinde yapılınca GIL
+# yüzünden diğer istekleri de yavaşlatıyor. Render işleri fontları ve
+# stilleri önceden yüklenmiş kalıcı bir işlem havuzunda yapılır. Bekleyen
+# iş sayısı sınırlıdır; sınır dolunca istek 503 + Retry-After ile reddedilir.
+class PdfKuyruguDolu(Exception):
+    """PDF işlem havuzunun kuyruğu dolu"""
+
+_pdf_havuzu = None
+_pdf_havuzu_kilidi = threading.Lock()
+
+def pdf_havuzu():
+    """PDF işlem havuzunu ilk kullanımda oluşturur (bozulduysa yeniden kurar)"""
+    global _pdf_havuzu
+    with _pdf_havuzu_kilidi:
+        if _pdf_havuzu is not None and getattr(_pdf_havuzu, '_broken', False):
+            logger.error("PDF işlem havuzu bozuldu, yeniden oluşturuluyor")
+            _pdf_havuzu.shutdown(wait=False, cancel_futures=True)
+            _pdf_havuzu = None
+        if _pdf_havuzu is None:
+            from pdf_formu import pdf_iscisi_hazirla
+            _pdf_havuzu = ProcessPoolExecutor(
+                max_workers=app.config['PDF_ISLEM_SAYISI'],
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=pdf_iscisi_hazirla
+            )
+        return _pdf_havuzu
+
+def pdf_havuzunu_isit():
+    """Tüm işçi süreçlerini başlatır ve ilk render'ı yaptırır (sunucu açılışında çağrılır)"""
+    if not app.config['PDF_ISLEM_SAYISI']:
+        return
+    try:
+        from pdf_formu import pdf_iscisi_kimligi
+        havuz = pdf_havuzu()
+        pidler = set(havuz.map(pdf_iscisi_kimligi, range(app.config['PDF_ISLEM_SAYISI'])))
+        logger.info(f"PDF işlem havuzu hazır: {len(pidler)} süreç")
+    except Exception as e:
+        logger.error(f"PDF işlem havuzu ısıtma hatası: {e}")
+
+def pdf_havuzunu_kapat():
+    """İşçi süreçlerini kapatır (WSGI işçisi kapanırken çağrılır)"""
+    global _pdf_havuzu
+    with _pdf_havuzu_kilidi:
+        if _pdf_havuzu is not None:
+            _pdf_havuzu.shutdown(wait=True, cancel_futures=True)
+            _pdf_havuzu = None
+
+def pdf_isi_gonder(fonksiyon, *args):
+    """Render işini havuza gönderir; kuyruk doluysa PdfKuyruguDolu fırlatır"""
+    if not yer_tutucu('PDF_KUYRUK_LIMITI').acquire(blocking=False):
+        raise PdfKuyruguDolu()
+    try:
+        gelecek = pdf_havuzu().submit(fonksiyon, *args)
+    except Exception:
+        yer_tutucu('PDF_KUYRUK_LIMITI').release()
+        raise
+    gelecek.add_done_callback(lambda _: yer_tutucu('PDF_KUYRUK_LIMITI').release())
+    return gelecek
+
+def pdf_render(fonksiyon, *args):
+    """Render işini havuzda çalıştırıp sonucu bekler (havuz kapalıysa aynı thread'de çalıştırır)"""
+    if not app.config['PDF_ISLEM_SAYISI']:
+        # Havuz yokken de aynı anda üretilen PDF sayısı kuyruk sınırını aşmaz
+        if not yer_tutucu('PDF_KUYRUK_LIMITI').acquire(blocking=False):
+            raise PdfKuyruguDolu()
+        try:
+            return fonksiyon(*args)
+        finally:
+            yer_tutucu('PDF_KUYRUK_LIMITI').release()
+    return pdf_isi_gonder(fonksiyon, *args).result(timeout=app.config['PDF_ZAMAN_ASIMI'])
+
+def pdf_kuyrugu_dolu_yaniti():
+    yanit = jsonify({'error': 'PDF sunucusu meşgul, lütfen birkaç saniye sonra tekrar deneyin.'})
+    yanit.headers['Retry-After'] = str(app.config['PDF_RETRY_AFTER'])
+    return yanit, 503
+
+# PDF ÖNBELLEĞİ
+# Aynı formun tekrar basımları (yeniden baskı, her makineye bir kopya)
+# form verisi + şablon sürümü özetiyle anahtarlanan LRU önbellekten verilir.
+# Bellek sınırı aşılınca en eski PDF'ler (dizin ayarlıysa) diske taşınır.
+_pdf_onbellegi = OrderedDict()
+_pdf_onbellek_boyutu = 0
+_pdf_onbellek_kilidi = threading.Lock()
+
+def _pdf_disk_yolu(anahtar):
+    return os.path.join(app.config['PDF_ONBELLEK_DIZINI'], f"{anahtar}.pdf")
+
+def pdf_onbellekten_al(anahtar):
+    """Önbellekteki PDF'i döndürür, yoksa None"""
+    with _pdf_onbellek_kilidi:
+        pdf = _pdf_onbellegi.get(anahtar)
+        if pdf is not None:
+            _pdf_onbellegi.move_to_end(anahtar)
+            return pdf
+    
+    if not app.config['PDF_ONBELLEK_DIZINI']:
+        return None
+    
+    try:
+        with open(_pdf_disk_yolu(anahtar), 'rb') as f:
+            pdf = f.read()
+    except OSError:
+        return None
+    
+    pdf_onbellege_ekle(anahtar, pdf)
+    return pdf
+
+def pdf_onbellege_ekle(anahtar, pdf):
+    """PDF'i önbelleğe ekler, sınır aşılırsa en eski kayıtları çıkarır"""
+    global _pdf_onbellek_boyutu
+    tasinacaklar = []
+    with _pdf_onbellek_kilidi:
+        eski = _pdf_onbellegi.pop(anahtar, None)
+        if eski is not None:
+            _pdf_onbellek_boyutu -= len(eski)
+        _pdf_onbellegi[anahtar] = pdf
+        _pdf_onbellek_boyutu += len(pdf)
+        
+        while _pdf_onbellek_boyutu > app.config['PDF_ONBELLEK_MAX_BAYT'] and len(_pdf_onbellegi) > 1:
+            eski_anahtar, eski_pdf = _pdf_onbellegi.popitem(last=False)
+            _pdf_onbellek_boyutu -= len(eski_pdf)
+            tasinacaklar.append((eski_anahtar, eski_pdf))
+    
+    if tasinacaklar and app.config['PDF_ONBELLEK_DIZINI']:
+        pdf_diske_tasi(tasinacaklar)
 
-def t(metin):
-    return turkce_duzelt(metin)
+def pdf_diske_tasi(kayitlar):
+    """Bellekten çıkan PDF'leri diske yazar ve disk sınırını korur"""
+    dizin = app.config['PDF_ONBELLEK_DIZINI']
+    try:
+        os.makedirs(dizin, exist_ok=True)
+        for anahtar, pdf in kayitlar:
+            yol = _pdf_disk_yolu(anahtar)
+            gecici = f"{yol}.{threading.get_ident()}.tmp"
+            with open(gecici, 'wb') as f:
+                f.write(pdf)
+            os.replace(gecici, yol)
+        
+        # Disk sınırı aşıldıysa en eski dosyaları sil
+        dosyalar = [os.path.join(dizin, ad) for ad in os.listdir(dizin) if ad.endswith('.pdf')]
+        dosyalar.sort(key=os.path.getmtime)
+        toplam = sum(os.path.getsize(yol) for yol in dosyalar)
+        while dosyalar and toplam > app.config['PDF_ONBELLEK_DISK_MAX_BAYT']:
+            yol = dosyalar.pop(0)
+            toplam -= os.path.getsize(yol)
+            os.remove(yol)
+    
+    except OSError as e:
+        logger.error(f"PDF önbelleği disk yazma hatası: {e}")
+
+def form_pdf_getir(data):
+    """Form PDF'ini önbellekten getirir ya da üretip önbelleğe ekler; (pdf, önbellekten_mi) döndürür"""
+    from pdf_formu import form_anahtari, form_pdf_olustur
+    anahtar = form_anahtari(data)
+    pdf = pdf_onbellekten_al(anahtar)
+    if pdf is not None:
+        return pdf, True
+    
+    pdf = pdf_render(form_pdf_olustur, data)
+    pdf_onbellege_ekle(anahtar, pdf)
+    return pdf, False
 
-@app.route('/export/pdf', methods=['POST'])
+# PDF FONKSİYONLARI
+@uretim.route('/export/pdf', methods=['POST'])
 def export_pdf():
     try:
         return generate_pdf_document(request.json, download=True)
+    except PdfKuyruguDolu:
+        return pdf_kuyrugu_dolu_yaniti()
     except Exception as e:
         logger.error(f"PDF export hatası: {e}")
         return jsonify({'error': 'PDF oluşturulurken hata oluştu'}), 500
 
-@app.route('/print', methods=['POST'])
+@uretim.route('/print', methods=['POST'])
 def print_form():
     try:
         return generate_pdf_document(request.json, download=False)
+    except PdfKuyruguDolu:
+        return pdf_kuyrugu_dolu_yaniti()
     except Exception as e:
         logger.error(f"Yazdırma hatası: {e}")
         return jsonify({'error': 'Yazdırma sırasında hata oluştu'}), 500
 
 def generate_pdf_document(data, download=True):
-    """PDF oluşturma fonksiyonu - TABLO ÜSTE YAKIN"""
+    """PDF oluşturma fonksiyonu - şablon pdf_formu modülünde bir kez hazırlanır, tekrar basımlar önbellekten gelir"""
     try:
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=5*mm,
-            leftMargin=5*mm,
-            topMargin=1*mm,    # ÜST MARGIN AZALTILDI (2mm → 1mm)
-            bottomMargin=2*mm
-        )
-        story = []
-        styles = getSampleStyleSheet()
-        
-        # LOGO ALANI - DAHA KÜÇÜK ve DAHA AZ YER KAPLAYACAK
-        logo_path = 'logo.jpg'
-        
-        try:
-            if os.path.exists(logo_path):
-                logo = Image(logo_path, width=40*mm, height=15*mm)  # DAHA KÜÇÜK LOGO
-                logo.hAlign = 'CENTER'
-                story.append(logo)
-                story.append(Spacer(1, 0.5*mm))  # DAHA AZ BOŞLUK
-        except:
-            pass
-        
-        # ANA BAŞLIK - DAHA AZ BOŞLUK
-        baslik_stili = ParagraphStyle(
-            'AnaBaslik',
-            parent=styles['Heading1'],
-            fontSize=14,
-            spaceAfter=0.5*mm,  # AZALTILDI (1 → 0.5mm)
-            alignment=1,
-            textColor=colors.HexColor('#2C3E50'),
-            fontName='Helvetica-Bold'
-        )
-        
-        baslik = Paragraph("URETIM FORMU", baslik_stili)
-        story.append(baslik)
-        
-        # TARİH - DAHA AZ BOŞLUK
-        tarih_stili = ParagraphStyle(
-            'Tarih',
-            parent=styles['Normal'],
-            fontSize=11,
-            alignment=2,
-            spaceAfter=0.5*mm,  # AZALTILDI
-            textColor=colors.HexColor('#7F8C8D'),
-            fontName='Helvetica-Bold'
-        )
-        tarih = Paragraph(f"<b>Tarih:</b> {data.get('tarih', '')}", tarih_stili)
-        story.append(tarih)
-        
-        story.append(Spacer(1, 0.5*mm))  # TABLO ÖNCESİ BOŞLUK AZALTILDI
-        
-        # TABLO VERİLERİ
-        tum_veriler = []
-        
-        # Başlık stilleri
-        baslik_stili_buyuk = ParagraphStyle(
-            'BaslikBuyuk',
-            parent=styles['Heading2'],
-            fontSize=13,
-            fontName='Helvetica-Bold'
-        )
-        
-        normal_stili_buyuk = ParagraphStyle(
-            'NormalBuyuk',
-            parent=styles['Normal'],
-            fontSize=13,
-            fontName='Helvetica-Bold'
-        )
-        
-        kirmizi_yazi_stili = ParagraphStyle(
-            'KirmiziYazi',
-            parent=styles['Normal'],
-            fontSize=13,
-            textColor=colors.red,
-            fontName='Helvetica-Bold'
-        )
-        
-        # MÜŞTERİ BİLGİLERİ - MAVİ
-        tum_veriler.append([Paragraph("<b>MUSTERI BILGILERI</b>", baslik_stili_buyuk), ""])
-        tum_veriler.append([Paragraph("<b>Musteri Adi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('musteri_adi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Urun Adi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('urun_adi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Uretim/Siparis Mik.</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('usiparis_miktari', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Tabaka Adedi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('tabaka_adedi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Siparis Durumu</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('siparis_durumu', ''))}</b>", normal_stili_buyuk)])
-        
-        # MALZEME BİLGİLERİ - YEŞİL
-        tum_veriler.append([Paragraph("<b>MALZEME BILGILERI</b>", baslik_stili_buyuk), ""])
-        tum_veriler.append([Paragraph("<b>Kagit Cinsi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('kagit_cinsi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Gramaj</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('gramaj', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Kagit Olcusu</b>", normal_stili_buyuk), Paragraph(f"<b>{data.get('kagit_olcusu_1', '')} x {data.get('kagit_olcusu_2', '')}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Kartonun Agirligi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('karton_agirligi', 'Hesaplanamadi'))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Bicak Olcusu</b>", normal_stili_buyuk), Paragraph(f"<b>{data.get('bicak_olcusu_1', '')} x {data.get('bicak_olcusu_2', '')} mm</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Bicak Kodu</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('bicak_kodu', ''))}</b>", normal_stili_buyuk)])
-        
-        # BASKI BİLGİLERİ - MOR
-        tum_veriler.append([Paragraph("<b>BASKI BILGILERI</b>", baslik_stili_buyuk), ""])
-        tum_veriler.append([Paragraph("<b>Renk Sayisi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('renk_sayisi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Renk Bilgisi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('renk_bilgisi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Verim</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('verim', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Selefon</b>", normal_stili_buyuk), Paragraph(f"<b>{data.get('selefon_1', '')} x {data.get('selefon_2', '')}</b>", normal_stili_buyuk)])
-        
-        # FİNİSAJ BİLGİLERİ - TURUNCU
-        tum_veriler.append([Paragraph("<b>FINISAJ BILGILERI</b>", baslik_stili_buyuk), ""])
-        tum_veriler.append([Paragraph("<b>Varak Yaldiz</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('varak_yaldiz', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Gofre</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('gofre', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Yapistirma</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('yapistirma', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Paketleme</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('paketleme', ''))}</b>", normal_stili_buyuk)])
-        
-        # NOTLAR - KIRMIZI
-        tum_veriler.append([Paragraph("<b>NOTLAR</b>", baslik_stili_buyuk), ""])
-        notlar = data.get('notlar', '') or ""
-        
-        notlar_paragraf = Paragraph(f"<b>{t(notlar)}</b>", kirmizi_yazi_stili)
-        tum_veriler.append([Paragraph("<b>Notlar</b>", normal_stili_buyuk), notlar_paragraf])
-        
-        # ÜRETİM BİLGİLERİ - MAVİ
-        tum_veriler.append([Paragraph("<b>URETIM BILGILERI</b>", baslik_stili_buyuk), ""])
-        tum_veriler.append([Paragraph("<b>Baski Adedi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('baski_adedi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Selefon Adedi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('selefon_adedi', ''))}</b>", normal_stili_buyuk)])
-        tum_veriler.append([Paragraph("<b>Kesim Adedi</b>", normal_stili_buyuk), Paragraph(f"<b>{t(data.get('kesim_adedi', ''))}</b>", normal_stili_buyuk)])
-        
-        # SATIR YÜKSEKLİKLERİ
-        satir_yukseklikleri = [
-            30, 22, 22, 22, 22, 22,   # Müşteri
-            30, 22, 22, 22, 22, 22, 22,  # Malzeme
-            30, 22, 22, 22, 22,        # Baskı
-            30, 22, 22, 22, 22,        # Finisaj
-            30, 35,                    # Notlar
-            30, 30, 30, 30,            # Üretim
-        ]
-        
-        # TABLO GENİŞLİKLERİ
-        tablo = Table(tum_veriler, colWidths=[60*mm, 140*mm], rowHeights=satir_yukseklikleri)
-        
-        tablo_style = TableStyle([
-            # Başlık satırları - RENKLER
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
-            ('BACKGROUND', (0, 6), (-1, 6), colors.HexColor('#27AE60')),
-            ('BACKGROUND', (0, 13), (-1, 13), colors.HexColor('#8E44AD')),
-            ('BACKGROUND', (0, 18), (-1, 18), colors.HexColor('#E67E22')),
-            ('BACKGROUND', (0, 23), (-1, 23), colors.HexColor('#E74C3C')),
-            ('BACKGROUND', (0, 25), (-1, 25), colors.HexColor('#3498DB')),
-            
-            # Font ayarları
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 13),
-            
-            # NOTLAR SATIRI İÇİN KIRMIZI YAZI
-            ('TEXTCOLOR', (1, 24), (1, 24), colors.red),
-            
-            # Hizalama
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            
-            # Padding
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            
-            # NOTLAR SATIRI İÇİN DAHA FAZLA PADDING
-            ('BOTTOMPADDING', (0, 24), (-1, 24), 14),
-            ('TOPPADDING', (0, 24), (-1, 24), 14),
-            
-            # ÜRETİM BİLGİLERİ İÇİN DAHA FAZLA PADDING
-            ('BOTTOMPADDING', (0, 26), (-1, 28), 12),
-            ('TOPPADDING', (0, 26), (-1, 28), 12),
-            
-            # BAŞLIK SATIRLARI İÇİN DAHA FAZLA PADDING
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 14),
-            ('TOPPADDING', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 6), (-1, 6), 14),
-            ('TOPPADDING', (0, 6), (-1, 6), 14),
-            ('BOTTOMPADDING', (0, 13), (-1, 13), 14),
-            ('TOPPADDING', (0, 13), (-1, 13), 14),
-            ('BOTTOMPADDING', (0, 18), (-1, 18), 14),
-            ('TOPPADDING', (0, 18), (-1, 18), 14),
-            ('BOTTOMPADDING', (0, 23), (-1, 23), 14),
-            ('TOPPADDING', (0, 23), (-1, 23), 14),
-            ('BOTTOMPADDING', (0, 25), (-1, 25), 14),
-            ('TOPPADDING', (0, 25), (-1, 25), 14),
-            
-            # NORMAL SATIRLAR İÇİN GRID
-            ('GRID', (0, 1), (-1, -1), 0.5, colors.HexColor('#2C3E50')),
-            
-            # BAŞLIK SATIRLARI İÇİN SADECE ALT ÇİZGİ
-            ('LINEBELOW', (0, 0), (-1, 0), 1.0, colors.HexColor('#2C3E50')),
-            ('LINEBELOW', (0, 6), (-1, 6), 1.0, colors.HexColor('#2C3E50')),
-            ('LINEBELOW', (0, 13), (-1, 13), 1.0, colors.HexColor('#2C3E50')),
-            ('LINEBELOW', (0, 18), (-1, 18), 1.0, colors.HexColor('#2C3E50')),
-            ('LINEBELOW', (0, 23), (-1, 23), 1.0, colors.HexColor('#2C3E50')),
-            ('LINEBELOW', (0, 25), (-1, 25), 1.0, colors.HexColor('#2C3E50')),
-            
-            # BAŞLIK SATIRLARININ YAN ÇİZGİLERİNİ KALDIR
-            ('LINEBEFORE', (0, 0), (-1, 0), 0, colors.white),
-            ('LINEAFTER', (0, 0), (-1, 0), 0, colors.white),
-            ('LINEBEFORE', (0, 6), (-1, 6), 0, colors.white),
-            ('LINEAFTER', (0, 6), (-1, 6), 0, colors.white),
-            ('LINEBEFORE', (0, 13), (-1, 13), 0, colors.white),
-            ('LINEAFTER', (0, 13), (-1, 13), 0, colors.white),
-            ('LINEBEFORE', (0, 18), (-1, 18), 0, colors.white),
-            ('LINEAFTER', (0, 18), (-1, 18), 0, colors.white),
-            ('LINEBEFORE', (0, 23), (-1, 23), 0, colors.white),
-            ('LINEAFTER', (0, 23), (-1, 23), 0, colors.white),
-            ('LINEBEFORE', (0, 25), (-1, 25), 0, colors.white),
-            ('LINEAFTER', (0, 25), (-1, 25), 0, colors.white),
-            
-            # BAŞLIK SATIRLARINDA SPAN
-            ('SPAN', (0, 0), (-1, 0)),
-            ('SPAN', (0, 6), (-1, 6)),
-            ('SPAN', (0, 13), (-1, 13)),
-            ('SPAN', (0, 18), (-1, 18)),
-            ('SPAN', (0, 23), (-1, 23)),
-            ('SPAN', (0, 25), (-1, 25)),
-        ])
-        
-        tablo.setStyle(tablo_style)
-        story.append(tablo)
-        
-        # ALT BİLGİ - DAHA AZ BOŞLUK
-        story.append(Spacer(1, 0.5*mm))  # AZALTILDI
-        
-        alt_bilgi_stili = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=6,
-            alignment=1,
-            textColor=colors.HexColor('#7F8C8D'),
-            fontName='Helvetica-Bold'
-        )
-        alt_bilgi = Paragraph(
-            f"Olusturulma: {datetime.now().strftime('%d.%m.%Y %H:%M')} - KUTU DUNYASI",
-            alt_bilgi_stili
-        )
-        story.append(alt_bilgi)
-        
-        # PDF'yi oluştur
-        doc.build(story)
-        buffer.seek(0)
+        pdf, onbellekten = form_pdf_getir(data)
+        buffer = BytesIO(pdf)
 
         if download:
-            return send_file(
+            yanit = send_file(
                 buffer,
                 mimetype='application/pdf',
                 as_attachment=True,
                 download_name=f'KutuDunyasi_Form_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
             )
         else:
-            return send_file(buffer, mimetype='application/pdf')
+            yanit = send_file(buffer, mimetype='application/pdf')
 
+        yanit.headers['X-PDF-Onbellek'] = 'HIT' if onbellekten else 'MISS'
+        return yanit
+
+    except PdfKuyruguDolu:
+        logger.warning("PDF kuyruğu dolu, istek reddedildi")
+        raise
     except Exception as e:
         logger.error(f"PDF oluşturma hatası: {e}")
         raise
 
+# TOPLU PDF - VARDİYA FORMLARI
+# Seçilen üretim emirleri (veya kayıtlı bir plan) tek PDF olarak basılır.
+# Büyük partiler işlem havuzunda parçalar halinde render edilip birleştirilir.
+def kayit_form_verisi(kayit):
+    """Üretim emrini PDF formunun beklediği sözlüğe çevirir"""
+    from pdf_formu import FORM_ALANLARI
+    return {alan: getattr(kayit, alan) or '' for alan in FORM_ALANLARI}
+
+def plan_form_verileri(plan_id):
+    """Kayıtlı planın satırlarını form verisine çevirir; plan yoksa None döndürür"""
+    plan = db.session.get(UretimPlani, plan_id)
+    if not plan:
+        return None
+    
+    satirlar = plan.satirlar
+    kayitlar = plan_kayitlari(satirlar)
+    
+    formlar = []
+    for satir in satirlar:
+        kayit = kayitlar.get(satir.uretim_emri_id)
+        form = kayit_form_verisi(kayit) if kayit else {'tarih': plan.olusturma_tarihi.strftime("%d.%m.%Y")}
+        # Planda düzenlenen hücreler kayıttaki değerin önüne geçer
+        for plan_alani, kayit_alani in PLAN_ALANLARI.items():
+            if getattr(satir, plan_alani) is not None:
+                form[kayit_alani] = getattr(satir, plan_alani)
+        formlar.append(form)
+    return formlar
+
+def toplu_pdf_uret(formlar):
+    """Formları tek PDF'e dönüştürür; büyük partileri işlem havuzuna dağıtıp parçaları birleştirir"""
+    from pdf_formu import toplu_pdf_olustur
+    PdfWriter, PdfReader = pypdf_yukle()
+    parca_boyutu = app.config['TOPLU_PDF_PARCA_BOYUTU']
+    
+    if len(formlar) <= parca_boyutu or PdfWriter is None or app.config['PDF_ISLEM_SAYISI'] < 2:
+        return pdf_render(toplu_pdf_olustur, formlar)
+    
+    parcalar = [formlar[i:i + parca_boyutu] for i in range(0, len(formlar), parca_boyutu)]
+    gelecekler = []
+    try:
+        for parca in parcalar:
+            gelecekler.append(pdf_isi_gonder(toplu_pdf_olustur, parca))
+    except PdfKuyruguDolu:
+        for gelecek in gelecekler:
+            gelecek.cancel()
+        raise
+    
+    writer = PdfWriter()
+    for gelecek in gelecekler:
+        writer.append(PdfReader(BytesIO(gelecek.result(timeout=app.config['PDF_ZAMAN_ASIMI']))))
+    
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+@uretim.route('/print/batch', methods=['POST'])
+def print_batch():
+    """Birden fazla üretim emrini tek PDF olarak yazdır (ids listesi veya plan_id)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        if data.get('plan_id'):
+            formlar = plan_form_verileri(int(data['plan_id']))
+            if formlar is None:
+                return jsonify({'success': False, 'message': 'Plan bulunamadı!'}), 404
+        else:
+            ids = [int(id) for id in data.get('ids', []) if str(id).isdigit()]
+            kayitlar = {kayit.id: kayit for kayit in UretimEmri.query.filter(UretimEmri.id.in_(ids)).all()} if ids else {}
+            formlar = [kayit_form_verisi(kayitlar[id]) for id in ids if id in kayitlar]
+        
+        if not formlar:
+            return jsonify({'success': False, 'message': 'Yazdırılacak kayıt bulunamadı!'}), 400
+        
+        if len(formlar) > app.config['TOPLU_PDF_MAX_FORM']:
+            return jsonify({'success': False, 'message': f"En fazla {app.config['TOPLU_PDF_MAX_FORM']} form birlikte yazdırılabilir!"}), 400
+        
+        buffer = BytesIO(toplu_pdf_uret(formlar))
+        logger.info(f"Toplu PDF oluşturuldu: {len(formlar)} form")
+        
+        if data.get('indir'):
+            return send_file(
+                buffer,
+                mimetype='application/pdf',
+                as_attachment=True,
+                download_name=f'KutuDunyasi_Formlar_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
+            )
+        return send_file(buffer, mimetype='application/pdf')
+    
+    except PdfKuyruguDolu:
+        return pdf_kuyrugu_dolu_yaniti()
+    except Exception as e:
+        logger.error(f"Toplu yazdırma hatası: {e}")
+        return jsonify({'error': 'Toplu yazdırma sırasında hata oluştu'}), 500
+
 # VERİTABANI BAŞLATMA
 def init_database():
     """Veritabanını başlat"""
     try:
         with app.app_context():
             db.create_all()
+            # create_all mevcut tablolara sonradan eklenen indeksleri oluşturmaz
+            for indeks in UretimEmri.__table__.indexes:
+                indeks.create(db.engine, checkfirst=True)
+            # create_all mevcut tablolara sonradan eklenen sütunları da eklemez
+            if 'kimlik' not in {sutun['name'] for sutun in inspect(db.engine).get_columns('veri_surumu')}:
+                db.session.execute(text("ALTER TABLE veri_surumu ADD COLUMN kimlik VARCHAR(32)"))
+            veri_surumu = db.session.get(VeriSurumu, 1)
+            if not veri_surumu:
+                db.session.add(VeriSurumu(id=1, deger=0))
+            elif not veri_surumu.kimlik:
+                veri_surumu.kimlik = uuid.uuid4().hex
+            db.session.commit()
             logger.info("Veritabanı başlatıldı")
             return True
     except Exception as e:
         logger.error(f"Veritabanı başlatma hatası: {e}")
         return False
 
-# UYGULAMA BAŞLATMA
+app.register_blueprint(uretim)
+app.register_blueprint(urun_katalogu)
+
+# UYGULAMA FABRİKASI
+# Üretimde uygulama gunicorn/waitress tarafından wsgi.py üzerinden yüklenir.
+def create_app(ayarlar=None):
+    """Ayarları uygular, veritabanını hazırlar ve WSGI uygulamasını döndürür"""
+    if ayarlar:
+        app.config.update(ayarlar)
+    if not init_database():
+        raise RuntimeError("Veritabanı başlatılamadı!")
+    return app
+
+# UYGULAMA BAŞLATMA (geliştirme sunucusu)
 if __name__ == '__main__':
     try:
         logger.info("KUTU DÜNYASI Web Uygulaması başlatılıyor...")
@@ -2386,6 +2145,9 @@ if __name__ == '__main__':
             logger.error("Veritabanı başlatılamadı!")
             sys.exit(1)
         
+        # PDF işçilerini istek gelmeden hazırla
+        pdf_havuzunu_isit()
+        
         # SENİN IP ADRESİN - 192.168.1.81
         local_ip = "192.168.1.81"
         
@@ -2400,9 +2162,10 @@ if __name__ == '__main__':
         print("   http://192.168.1.81:5000")
         print("")
         
-        # Tüm ağa açık şekilde çalıştır
+        # Tüm ağa açık şekilde çalıştır (debug sadece KUTU_DEBUG=true ile açılır)
+        # Atölye ağında geliştirme sunucusu yerine: gunicorn -c gunicorn.conf.py wsgi:app
         app.run(
-            debug=True,
+            debug=app.debug,
             host='0.0.0.0', 
             port=5000,
             threaded=True
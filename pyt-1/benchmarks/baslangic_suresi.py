@@ -0,0 +1,70 @@
+"""
+Uygulama başlangıç (import) süresi ölçümü.
+
+Kullanım (pyt-1 klasöründen):
+    python benchmarks/baslangic_suresi.py
+    python benchmarks/baslangic_suresi.py --limit 900
+
+`python -X importtime -c "import app"` birkaç kez ayrı süreçte çalıştırılır,
+en iyi toplam süre ve en pahalı modüller yazdırılır. pandas, reportlab,
+openpyxl veya pypdf başlangıçta yüklenirse ya da toplam süre --limit (ms)
+değerini aşarsa çıkış kodu 1 olur.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+PROJE_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Başlangıçta yüklenmemesi gereken ağır modüller (ilk kullanımda yüklenir)
+YASAK_MODULLER = ('pandas', 'reportlab', 'openpyxl', 'pypdf')
+
+
+def import_suresi_olc():
+    """app modülünü yeni bir süreçte import eder; {modül: kümülatif µs} döndürür"""
+    sonuc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=PROJE_DIZINI, capture_output=True, text=True, check=True
+    )
+    sureler = {}
+    for satir in sonuc.stderr.splitlines():
+        if not satir.startswith('import time:') or 'cumulative' in satir:
+            continue
+        _, kumulatif, modul = satir.split(':', 1)[1].split('|')
+        sureler.setdefault(modul.strip(), int(kumulatif))
+    return sureler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Başlangıç import süresi')
+    parser.add_argument('--tekrar', type=int, default=3, help='Ölçüm tekrarı (en iyisi alınır)')
+    parser.add_argument('--ilk', type=int, default=10, help='Listelenecek en pahalı modül sayısı')
+    parser.add_argument('--limit', type=float, help='İzin verilen toplam süre (ms)')
+    args = parser.parse_args()
+
+    olcumler = [import_suresi_olc() for _ in range(args.tekrar)]
+    en_iyi = min(olcumler, key=lambda sureler: sureler.get('app', 0))
+    toplam_ms = en_iyi['app'] / 1000
+
+    print(f"import app: {toplam_ms:.0f} ms (en iyi {args.tekrar} ölçüm)")
+    ust_duzey = sorted(
+        ((modul, sure) for modul, sure in en_iyi.items() if '.' not in modul and modul != 'app'),
+        key=lambda kayit: kayit[1], reverse=True
+    )
+    for modul, sure in ust_duzey[:args.ilk]:
+        print(f"  {modul:<25} {sure / 1000:8.1f} ms")
+
+    basarisiz = False
+    yuklenenler = [modul for modul in YASAK_MODULLER if modul in en_iyi]
+    if yuklenenler:
+        print(f"HATA: başlangıçta yüklenmemesi gereken modüller: {', '.join(yuklenenler)}")
+        basarisiz = True
+    if args.limit is not None and toplam_ms > args.limit:
+        print(f"HATA: başlangıç süresi {toplam_ms:.0f} ms > limit {args.limit:.0f} ms")
+        basarisiz = True
+    sys.exit(1 if basarisiz else 0)
+
+
+if __name__ == '__main__':
+    main()
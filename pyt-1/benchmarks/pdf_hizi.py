@@ -0,0 +1,75 @@
+"""
+PDF üretim hızı mikrobenchmark'ı.
+
+Kullanım (pyt-1 klasöründen):
+    python benchmarks/pdf_hizi.py --adet 200
+
+Örnek bir üretim formunu art arda render eder ve saniyedeki PDF sayısını
+yazdırır. Şablon değişikliklerinden önce ve sonra çalıştırılarak
+karşılaştırma yapılır.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_formu import form_pdf_olustur
+
+ORNEK_FORM = {
+    'tarih': '08.11.2025',
+    'musteri_adi': 'Unaşkı Pastanesi',
+    'urun_adi': '12x12x10 Unaşkı Bıçak',
+    'usiparis_miktari': '5000 adet',
+    'tabaka_adedi': '2500',
+    'siparis_durumu': 'YENİ',
+    'kagit_cinsi': 'Krome',
+    'gramaj': '400',
+    'kagit_olcusu_1': '700',
+    'kagit_olcusu_2': '500',
+    'karton_agirligi': '350,00 kg',
+    'bicak_olcusu_1': '120',
+    'bicak_olcusu_2': '100',
+    'bicak_kodu': 'BK-1024',
+    'renk_sayisi': '2',
+    'renk_bilgisi': 'Turuncu Siyah',
+    'verim': '3',
+    'selefon_1': 'MAT',
+    'selefon_2': 'SEDEF',
+    'varak_yaldiz': 'YOK',
+    'gofre': 'YOK',
+    'yapistirma': 'YOK',
+    'paketleme': '300',
+    'notlar': 'Çok acil, bıçak değişecek',
+    'baski_adedi': '2600',
+    'selefon_adedi': '2550',
+    'kesim_adedi': '2520',
+}
+
+
+def olc(adet):
+    """adet kadar PDF üretir, (saniye, ortalama bayt) döndürür"""
+    toplam_bayt = 0
+    baslangic = time.perf_counter()
+    for _ in range(adet):
+        toplam_bayt += len(form_pdf_olustur(ORNEK_FORM))
+    return time.perf_counter() - baslangic, toplam_bayt // adet
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF üretim hızı ölçümü')
+    parser.add_argument('--adet', type=int, default=200, help='Üretilecek PDF sayısı')
+    parser.add_argument('--isinma', type=int, default=5, help='Ölçüm öncesi ısınma turu')
+    args = parser.parse_args()
+
+    olc(args.isinma)
+    sure, ortalama_bayt = olc(args.adet)
+
+    print(f"{args.adet} PDF, {sure:.2f} sn")
+    print(f"Saniyede PDF : {args.adet / sure:.1f}")
+    print(f"PDF başına   : {sure / args.adet * 1000:.2f} ms, {ortalama_bayt} bayt")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Senaryo bazlı benchmark paketi.
+
+Kullanım (pyt-1 klasöründen):
+    python benchmarks/senaryolar.py --kayit 5000 --katalog 5000 --cikti sonuc.json
+    python benchmarks/senaryolar.py --cikti yeni.json --karsilastir sonuc.json
+    python benchmarks/senaryolar.py --senaryo arama --senaryo liste
+
+Geçici bir dizinde sentetik veritabanı ve katalog üretilir (veri_uret.py),
+uygulama bu dosyalarla yüklenir ve her senaryo Flask test istemcisiyle
+(ağ olmadan) çalıştırılır. Her senaryo için saniyedeki istek ve
+p50/p95/p99 gecikme yazdırılır; --cikti ile sonuçlar JSON olarak kaydedilir
+ve --karsilastir ile önceki bir çalıştırmayla karşılaştırılır.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCHMARK_DIZINI = os.path.dirname(os.path.abspath(__file__))
+PROJE_DIZINI = os.path.dirname(BENCHMARK_DIZINI)
+sys.path.insert(0, PROJE_DIZINI)
+
+from veri_uret import ortami_hazirla, uretim_emri_verisi, MUSTERILER
+
+
+def yuzdelik(sureler, oran):
+    """Sıralı listeden en yakın sıra yöntemiyle yüzdelik"""
+    if not sureler:
+        return 0.0
+    return sureler[min(len(sureler) - 1, int(len(sureler) * oran))]
+
+
+# SENARYOLAR
+# Her senaryo (istemci, rastgele, bağlam) alır ve Flask yanıtı döndürür.
+# Ağır senaryolarda tekrar sayısı en_fazla ile sınırlanır.
+def otomatik_tamamlama(istemci, rastgele, baglam):
+    urun = rastgele.choice(baglam['urun_adlari'])
+    kelime = rastgele.choice(urun.split()[1:])
+    return istemci.get('/urun-ara', query_string={'q': kelime[:4]})
+
+def urun_bilgi(istemci, rastgele, baglam):
+    return istemci.get('/urun-bilgi', query_string={'urun_adi': rastgele.choice(baglam['urun_adlari'])})
+
+def liste(istemci, rastgele, baglam):
+    return istemci.get('/list')
+
+def arama(istemci, rastgele, baglam):
+    return istemci.get('/search', query_string={'q': rastgele.choice(MUSTERILER).split()[0]})
+
+def uretim_excel(istemci, rastgele, baglam):
+    return istemci.get('/export/excel')
+
+def planlama_excel(istemci, rastgele, baglam):
+    return istemci.get('/api/production-export-excel')
+
+def pdf(istemci, rastgele, baglam):
+    form = uretim_emri_verisi(rastgele, baglam['urun_adlari'])
+    form['notlar'] = f"benchmark {rastgele.random()}"  # her istek farklı form: önbellek ıskalanır
+    return istemci.post('/export/pdf', json=form)
+
+def kaydet(istemci, rastgele, baglam):
+    return istemci.post('/save', json=uretim_emri_verisi(rastgele, baglam['urun_adlari']))
+
+# (ad, fonksiyon, en fazla tekrar) - kaydet veriyi değiştirdiği için en sonda
+SENARYOLAR = (
+    ('otomatik_tamamlama', otomatik_tamamlama, None),
+    ('urun_bilgi', urun_bilgi, None),
+    ('liste', liste, None),
+    ('arama', arama, None),
+    ('uretim_excel', uretim_excel, 10),
+    ('planlama_excel', planlama_excel, 10),
+    ('pdf', pdf, None),
+    ('kaydet', kaydet, None),
+)
+
+
+def senaryo_calistir(istemci, fonksiyon, tekrar, isinma, baglam, tohum):
+    rastgele = random.Random(tohum)
+    for _ in range(isinma):
+        fonksiyon(istemci, rastgele, baglam)
+
+    sureler, hatalar = [], 0
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        istek_baslangic = time.perf_counter()
+        yanit = fonksiyon(istemci, rastgele, baglam)
+        yanit.get_data()
+        sureler.append(time.perf_counter() - istek_baslangic)
+        if yanit.status_code != 200:
+            hatalar += 1
+    gecen = time.perf_counter() - baslangic
+
+    sureler.sort()
+    return {
+        'adet': tekrar,
+        'hata': hatalar,
+        'istek_sn': round(tekrar / gecen, 2),
+        'ortalama_ms': round(sum(sureler) / tekrar * 1000, 3),
+        'p50_ms': round(yuzdelik(sureler, 0.50) * 1000, 3),
+        'p95_ms': round(yuzdelik(sureler, 0.95) * 1000, 3),
+        'p99_ms': round(yuzdelik(sureler, 0.99) * 1000, 3),
+    }
+
+
+def git_surumu():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJE_DIZINI,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def karsilastir(onceki, simdiki):
+    print(f"\nKarşılaştırma ({onceki['meta'].get('commit')} -> {simdiki['meta'].get('commit')})")
+    for ad, sonuc in simdiki['senaryolar'].items():
+        eski = onceki['senaryolar'].get(ad)
+        if not eski:
+            continue
+        hiz_degisimi = (sonuc['istek_sn'] / eski['istek_sn'] - 1) * 100 if eski['istek_sn'] else 0
+        print(f"  {ad:<20} istek/sn {eski['istek_sn']:>9.1f} -> {sonuc['istek_sn']:>9.1f} ({hiz_degisimi:+.0f}%)"
+              f"   p95 {eski['p95_ms']:.1f} -> {sonuc['p95_ms']:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Senaryo bazlı benchmark')
+    parser.add_argument('--kayit', type=int, default=5000, help='Veritabanındaki üretim emri sayısı')
+    parser.add_argument('--katalog', type=int, default=5000, help='Katalogdaki ürün sayısı')
+    parser.add_argument('--tekrar', type=int, default=50, help='Senaryo başına istek sayısı')
+    parser.add_argument('--isinma', type=int, default=2, help='Ölçüm öncesi ısınma isteği')
+    parser.add_argument('--tohum', type=int, default=42, help='Rastgele sayı tohumu')
+    parser.add_argument('--senaryo', action='append', help='Sadece verilen senaryo(lar)')
+    parser.add_argument('--dizin', help='Veri dizini (varsayılan: geçici dizin)')
+    parser.add_argument('--cikti', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--karsilastir', help='Karşılaştırılacak önceki JSON sonucu')
+    args = parser.parse_args()
+
+    dizin = args.dizin or tempfile.mkdtemp(prefix='kutu_bench_')
+    urun_adlari = ortami_hazirla(dizin, args.kayit, args.katalog, args.tohum)
+    from app import app
+
+    baglam = {'urun_adlari': urun_adlari}
+    istemci = app.test_client()
+    sonuclar = {}
+    for ad, fonksiyon, en_fazla in SENARYOLAR:
+        if args.senaryo and ad not in args.senaryo:
+            continue
+        tekrar = min(args.tekrar, en_fazla) if en_fazla else args.tekrar
+        sonuc = senaryo_calistir(istemci, fonksiyon, tekrar, args.isinma, baglam, args.tohum)
+        sonuclar[ad] = sonuc
+        print(f"{ad:<20} {sonuc['istek_sn']:>9.1f} istek/sn   p50 {sonuc['p50_ms']:>8.1f} ms   "
+              f"p95 {sonuc['p95_ms']:>8.1f} ms   p99 {sonuc['p99_ms']:>8.1f} ms   ({sonuc['adet']} istek, {sonuc['hata']} hata)")
+
+    rapor = {
+        'meta': {
+            'commit': git_surumu(),
+            'zaman': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu': os.cpu_count(),
+            'kayit': args.kayit,
+            'katalog': args.katalog,
+            'tekrar': args.tekrar,
+            'tohum': args.tohum,
+        },
+        'senaryolar': sonuclar,
+    }
+    if args.cikti:
+        with open(args.cikti, 'w', encoding='utf-8') as f:
+            json.dump(rapor, f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.cikti}")
+    if args.karsilastir:
+        with open(args.karsilastir, encoding='utf-8') as f:
+            karsilastir(json.load(f), rapor)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark'lar için sentetik veri üretici.
+
+Kullanım (pyt-1 klasöründen):
+    python benchmarks/veri_uret.py --dizin /tmp/kutu_bench --kayit 5000 --katalog 5000
+
+Verilen dizine gerçekçi üretim emirleriyle dolu bir SQLite veritabanı
+(bench.db) ve büyük bir ürün kataloğu (urun_katalog.xlsx) yazar. Aynı
+--tohum ile her çalıştırmada aynı veri üretilir.
+"""
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+
+MUSTERILER = (
+    'Unaşkı Pastanesi', 'Güllüoğlu Baklava', 'Şekerci Cafer Erol', 'Hafız Mustafa', 'Koska Helva',
+    'Çiğdem Pastaneleri', 'Özsüt', 'Saray Muhallebicisi', 'Karaköy Güllüoğlu', 'İnci Pastanesi',
+    'Divan Pastaneleri', 'Mado', 'Pelit', 'Kurukahveci Mehmet Efendi', 'Tatlıcı Safa',
+)
+URUN_TURLERI = (
+    'Baklava Kutusu', 'Pasta Kutusu', 'Kurabiye Kutusu', 'Lokum Kutusu', 'Çikolata Kutusu',
+    'Börek Kutusu', 'Posiyon Kutusu', 'Pizza Kutusu', 'Hediye Kutusu', 'Kek Kutusu',
+)
+GRAMAJLAR = ('250 gr', '350 gr', '500 gr', '750 gr', '1 kg', '2 kg')
+KAGIT_CINSLERI = ('Krome', 'Bristol', 'Kraft', 'Amerikan Bristol', 'Oluklu')
+SELEFONLAR = ('MAT', 'PARLAK', 'SEDEF', 'YOK')
+DURUMLAR = ('YENİ', 'TEKRAR', 'DEĞİŞİKLİK')
+RENKLER = ('Turuncu Siyah', 'Kırmızı Altın', 'Lacivert Gümüş', 'Yeşil Beyaz', 'CMYK')
+NOTLAR = ('', '', 'Acil', 'Bıçak değişecek', 'Renk provası gönderilecek', 'Çok acil, hafta sonu teslim')
+
+
+def urun_adi_uret(rastgele, sira):
+    """Katalogdaki ürün adlarına benzer, tekil bir ad üretir"""
+    return f"{sira} {rastgele.choice(GRAMAJLAR)} {rastgele.choice(URUN_TURLERI)} {rastgele.randint(10, 40)}x{rastgele.randint(10, 40)}"
+
+
+def uretim_emri_verisi(rastgele, urun_adlari=None):
+    """/save isteğinin gövdesiyle aynı biçimde bir üretim emri sözlüğü döndürür"""
+    tabaka = rastgele.randint(500, 20000)
+    return {
+        'musteri_adi': rastgele.choice(MUSTERILER),
+        'urun_adi': rastgele.choice(urun_adlari) if urun_adlari else urun_adi_uret(rastgele, rastgele.randint(1, 999)),
+        'usiparis_miktari': f"{tabaka * rastgele.choice((2, 3, 4))} adet",
+        'tabaka_adedi': str(tabaka),
+        'kagit_cinsi': rastgele.choice(KAGIT_CINSLERI),
+        'gramaj': str(rastgele.choice((250, 300, 350, 400))),
+        'kagit_olcusu_1': str(rastgele.randint(500, 1000)),
+        'kagit_olcusu_2': str(rastgele.randint(350, 700)),
+        'bicak_kodu': f"P{rastgele.randint(10000, 99999)}",
+        'bicak_olcusu_1': str(rastgele.randint(100, 700)),
+        'bicak_olcusu_2': str(rastgele.randint(100, 600)),
+        'renk_sayisi': str(rastgele.randint(1, 5)),
+        'renk_bilgisi': rastgele.choice(RENKLER),
+        'verim': str(rastgele.randint(1, 8)),
+        'selefon_1': rastgele.choice(SELEFONLAR),
+        'selefon_2': rastgele.choice(SELEFONLAR),
+        'varak_yaldiz': rastgele.choice(('YOK', 'ALTIN', 'GÜMÜŞ')),
+        'gofre': rastgele.choice(('YOK', 'VAR')),
+        'yapistirma': rastgele.choice(('YOK', 'YAN', 'DİP KİLİT')),
+        'paketleme': str(rastgele.choice((100, 200, 300, 500))),
+        'siparis_durumu': rastgele.choice(DURUMLAR),
+        'notlar': rastgele.choice(NOTLAR),
+        'baski_adedi': str(tabaka + rastgele.randint(0, 200)),
+        'selefon_adedi': str(tabaka + rastgele.randint(0, 100)),
+        'kesim_adedi': str(tabaka + rastgele.randint(0, 50)),
+        'karton_agirligi': f"{tabaka * 0.14:.2f} kg",
+        'tarih': (datetime(2025, 1, 1) + timedelta(days=rastgele.randint(0, 600))).strftime("%d.%m.%Y"),
+    }
+
+
+def katalog_uret(yol, adet, tohum=42):
+    """Uygulamanın okuduğu biçimde ('Ürün Kataloğu' sayfası) sentetik katalog yazar; ürün adlarını döndürür"""
+    import pandas as pd
+
+    rastgele = random.Random(tohum)
+    urun_adlari = [urun_adi_uret(rastgele, sira) for sira in range(1, adet + 1)]
+    df = pd.DataFrame({
+        'Ürün Adı*': urun_adlari,
+        # Gerçek katalogdaki gibi bazı bıçak kodları boş
+        'Bıçak Kodu*': [f"P{rastgele.randint(10000, 99999)}" if rastgele.random() > 0.1 else None for _ in urun_adlari],
+        'Bıçak Ebadı En (mm)*': [round(rastgele.uniform(100, 700), 2) for _ in urun_adlari],
+        'Bıçak Ebadı Boy (mm)*': [round(rastgele.uniform(100, 600), 2) for _ in urun_adlari],
+    })
+    df.to_excel(yol, sheet_name='Ürün Kataloğu', index=False)
+    return urun_adlari
+
+
+def veritabani_doldur(adet, urun_adlari=None, tohum=42):
+    """Uygulama veritabanına toplu INSERT ile sentetik üretim emirleri ekler (uygulama import edilmiş olmalı)"""
+    from sqlalchemy import insert
+    from app import app, db, UretimEmri
+
+    rastgele = random.Random(tohum)
+    baslangic = datetime(2025, 1, 1)
+    satirlar = []
+    for _ in range(adet):
+        satir = uretim_emri_verisi(rastgele, urun_adlari)
+        satir['olusturma_tarihi'] = baslangic + timedelta(minutes=rastgele.randint(0, 600 * 24 * 60))
+        satirlar.append(satir)
+
+    with app.app_context():
+        for i in range(0, len(satirlar), 1000):
+            db.session.execute(insert(UretimEmri), satirlar[i:i + 1000])
+        db.session.commit()
+
+
+def ortami_hazirla(dizin, kayit, katalog, tohum=42):
+    """
+    Dizine katalog ve boş veritabanı hazırlar, uygulamayı bu dosyalarla
+    import edip veritabanını doldurur. Katalogdaki ürün adlarını döndürür.
+    """
+    os.makedirs(dizin, exist_ok=True)
+    db_yolu = os.path.join(dizin, 'bench.db')
+    katalog_yolu = os.path.join(dizin, 'urun_katalog.xlsx')
+    if os.path.exists(db_yolu):
+        os.remove(db_yolu)
+
+    # Ayarlar app import edilmeden önce ortam değişkenleriyle verilir
+    os.environ['KUTU_SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.abspath(db_yolu)}"
+    os.environ['KUTU_URUN_KATALOGU_DOSYASI'] = os.path.abspath(katalog_yolu)
+    os.environ['KUTU_DISA_AKTARMA_DIZINI'] = os.path.abspath(os.path.join(dizin, 'disa_aktarma'))
+    os.environ.setdefault('KUTU_LOG_SEVIYESI', 'WARNING')
+
+    urun_adlari = katalog_uret(katalog_yolu, katalog, tohum)
+    from app import create_app
+    create_app()
+    veritabani_doldur(kayit, urun_adlari, tohum)
+    return urun_adlari
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sentetik benchmark verisi üretir')
+    parser.add_argument('--dizin', default='benchmark_verisi', help='Çıktı dizini')
+    parser.add_argument('--kayit', type=int, default=5000, help='Üretim emri sayısı')
+    parser.add_argument('--katalog', type=int, default=5000, help='Katalogdaki ürün sayısı')
+    parser.add_argument('--tohum', type=int, default=42, help='Rastgele sayı tohumu')
+    args = parser.parse_args()
+
+    ortami_hazirla(args.dizin, args.kayit, args.katalog, args.tohum)
+    print(f"{args.dizin}: {args.kayit} üretim emri (bench.db), {args.katalog} ürün (urun_katalog.xlsx)")
+
+
+if __name__ == '__main__':
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    main()
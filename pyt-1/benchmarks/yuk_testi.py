@@ -0,0 +1,82 @@
+"""
+HTTP yük testi.
+
+Kullanım (pyt-1 klasöründen, sunucu çalışırken):
+    python benchmarks/yuk_testi.py --url http://localhost:5000 --eszamanli 16 --sure 10
+
+Geliştirme sunucusu (python app.py) ve gunicorn (gunicorn -c gunicorn.conf.py
+wsgi:app) ayrı ayrı başlatılıp aynı parametrelerle ölçülür. Her uç nokta için
+saniyedeki istek sayısı ve gecikme yüzdelikleri yazdırılır.
+"""
+import argparse
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+UC_NOKTALAR = ('/urun-ara?q=kutu', '/api/production-data')
+
+
+def yuzdelik(sureler, oran):
+    if not sureler:
+        return 0.0
+    return sureler[min(len(sureler) - 1, int(len(sureler) * oran))]
+
+
+def istemci(adres, yol, bitis, sonuclar, kilit):
+    """Bitiş zamanına kadar aynı bağlantı üzerinden (keep-alive) istek gönderir"""
+    baglanti = http.client.HTTPConnection(adres.hostname, adres.port or 80, timeout=30)
+    sureler, hatalar = [], 0
+    while time.perf_counter() < bitis:
+        baslangic = time.perf_counter()
+        try:
+            baglanti.request('GET', yol)
+            yanit = baglanti.getresponse()
+            yanit.read()
+            if yanit.status != 200:
+                hatalar += 1
+        except (OSError, http.client.HTTPException):
+            hatalar += 1
+            baglanti.close()
+            baglanti = http.client.HTTPConnection(adres.hostname, adres.port or 80, timeout=30)
+            continue
+        sureler.append(time.perf_counter() - baslangic)
+    baglanti.close()
+    with kilit:
+        sonuclar['sureler'].extend(sureler)
+        sonuclar['hatalar'] += hatalar
+
+
+def olc(adres, yol, eszamanli, sure):
+    sonuclar = {'sureler': [], 'hatalar': 0}
+    kilit = threading.Lock()
+    baslangic = time.perf_counter()
+    bitis = baslangic + sure
+    with ThreadPoolExecutor(max_workers=eszamanli) as havuz:
+        for _ in range(eszamanli):
+            havuz.submit(istemci, adres, yol, bitis, sonuclar, kilit)
+    gecen = time.perf_counter() - baslangic
+    sureler = sorted(sonuclar['sureler'])
+    return len(sureler) / gecen, sureler, sonuclar['hatalar']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP yük testi')
+    parser.add_argument('--url', default='http://localhost:5000', help='Sunucu adresi')
+    parser.add_argument('--eszamanli', type=int, default=16, help='Eşzamanlı istemci sayısı')
+    parser.add_argument('--sure', type=float, default=10, help='Uç nokta başına ölçüm süresi (sn)')
+    parser.add_argument('--yol', action='append', help='Ölçülecek yol (birden fazla verilebilir)')
+    args = parser.parse_args()
+
+    adres = urlsplit(args.url)
+    for yol in args.yol or UC_NOKTALAR:
+        istek_hizi, sureler, hatalar = olc(adres, yol, args.eszamanli, args.sure)
+        print(f"{yol}")
+        print(f"  İstek/sn : {istek_hizi:.1f}  ({len(sureler)} istek, {hatalar} hata)")
+        print(f"  Gecikme  : p50 {yuzdelik(sureler, 0.50) * 1000:.1f} ms, "
+              f"p95 {yuzdelik(sureler, 0.95) * 1000:.1f} ms, p99 {yuzdelik(sureler, 0.99) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Gunicorn ayarları.
+
+Kullanım (pyt-1 klasöründen):
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+İşçi sayısı WEB_CONCURRENCY ile değiştirilebilir. Kod güncellemesinden sonra
+master'a HUP sinyali gönderilirse işçiler bekleyen istekleri bitirip
+sırayla yenilenir:  kill -HUP <master pid>
+
+Birden çok işçi aynı kutu_dunyasi.log'a yazdığı için dosyayı uygulama
+döndürmez (KUTU_LOG_DOSYASI=izle); döndürme logrotate ile yapılır, örn.
+/etc/logrotate.d/kutu_dunyasi:
+
+    /srv/kutu_dunyasi/pyt-1/kutu_dunyasi.log {
+        size 10M
+        rotate 5
+        missingok
+        notifempty
+    }
+"""
+import multiprocessing
+import os
+
+bind = '0.0.0.0:5000'
+
+# İşçiler
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = 4
+
+# Uygulama master'da bir kez yüklenir, işçiler fork ile kopyalanır
+preload_app = True
+
+# Zaman aşımları: en uzun istek büyük toplu PDF (PDF_ZAMAN_ASIMI=60 sn) + birleştirme
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Bellek sızıntılarına karşı işçiler belli sayıda istekten sonra sırayla yenilenir
+max_requests = 1000
+max_requests_jitter = 100
+
+# Log dosyasını işçiler döndürmez, sadece yazar (kutu_dunyasi/gunluk.py).
+# Uygulama import edilmeden önce ayarlanmalı; bu dosya wsgi:app'ten önce okunur.
+os.environ.setdefault('KUTU_LOG_DOSYASI', 'izle')
+
+# Her işçinin kendi PDF işlem havuzu var; işçi başına CPU // işçi sayısı kadar,
+# en az 1 süreç açılır. Havuz kapatılmaz: render işçinin GIL'ini tutmaz ve
+# bekleyen iş sınırı (503 + Retry-After) geçerli kalır. Bedeli: işçi sayısı
+# CPU'dan fazlaysa (varsayılan 2*CPU+1) toplam PDF süreci de işçi sayısı kadar
+# olur ve CPU'yu aşar; süreçler çoğunlukla boşta bekler, yük anında işletim
+# sistemi paylaştırır. Büyük toplu PDF'lerin parçalara bölünüp paralel
+# üretilmesi işçi başına en az 2 süreç ister; bunun için WEB_CONCURRENCY
+# düşürülüp KUTU_PDF_ISLEM_SAYISI açıkça verilebilir (örn. 2 işçi x CPU/2).
+os.environ.setdefault('KUTU_PDF_ISLEM_SAYISI', str(max(1, multiprocessing.cpu_count() // workers)))
+
+
+def when_ready(server):
+    """İşçiler fork edilmeden önce pandas/reportlab master'da bir kez yüklenir"""
+    from app import agir_modulleri_yukle
+
+    agir_modulleri_yukle()
+
+
+def post_fork(server, worker):
+    """Master'dan kalan veritabanı bağlantılarını bırakır, işçinin PDF havuzunu ısıtır"""
+    from app import app, db, pdf_havuzunu_isit
+
+    with app.app_context():
+        db.engine.dispose()
+    pdf_havuzunu_isit()
+
+
+def worker_exit(server, worker):
+    """İşçi kapanırken PDF süreçlerini de kapatır"""
+    from app import pdf_havuzunu_kapat
+
+    pdf_havuzunu_kapat()
@@ -0,0 +1,10 @@
+"""
+KUTU DÜNYASI ortak çekirdeği.
+
+Üretim (app.py) ve ürün kataloğu (urunkatologu.py) blueprint'leri aynı
+süreçte çalışır ve şunları bu paketten paylaşır:
+
+    gunluk      - süreç başına log kuyruğu ve kutu_dunyasi.log hedefi
+    veritabani  - db (SQLAlchemy), modeller ve veri sürümü
+    katalog     - Excel ürün kataloğu servisi (tek bellek kopyası)
+"""
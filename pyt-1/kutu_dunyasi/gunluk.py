@@ -0,0 +1,70 @@
+"""
+Süreç genelinde logging kurulumu.
+
+Modül her süreçte ilk import edildiğinde bir kez kurulur; süreçteki tüm
+blueprint'ler kayıtlarını aynı kuyruğa bırakır, kutu_dunyasi.log'a sürecin
+dinleyici thread'i yazar. Dosyayı uygulamanın kendisinin döndürmesi sadece
+tek süreçli sunucularda (waitress, geliştirme sunucusu) güvenlidir; gunicorn
+işçilerinde döndürme dışarıdan (logrotate) yapılır, bkz. KUTU_LOG_DOSYASI.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+from logging.handlers import RotatingFileHandler, WatchedFileHandler, QueueHandler, QueueListener
+
+# LOGGING KURULUMU
+# İstek thread'leri kayıtları sadece bellekteki kuyruğa bırakır; dosyaya
+# yazma ve dosya döndürme (rotation) arka plandaki QueueListener thread'inde
+# yapılır. Böylece disk gecikmesi istek süresine yansımaz.
+# Seviye KUTU_LOG_SEVIYESI ortam değişkeniyle değiştirilebilir (örn. DEBUG).
+# KUTU_LOG_DOSYASI log dosyasının nasıl yazılacağını seçer:
+#   dondur - dosya 10 MB'ı geçince uygulama döndürür (varsayılan; tek süreç)
+#   izle   - dosya sadece yazılır, logrotate gibi harici bir araç döndürür;
+#            dosya taşınınca yeniden açılır (çok süreçli; gunicorn.conf.py)
+#   yok    - sadece stdout
+# Birden çok süreç aynı dosyayı kendisi döndürürse birbirinin dosyasını
+# taşıyıp kayıt kaybettirir; bu yüzden gunicorn'da 'dondur' kullanılmaz.
+# PDF işlem havuzunun (spawn) çocuk süreçleri de bu modülü import eder; onlar
+# log dosyasını açmaz, kayıtlarını doğrudan stdout'a yazar.
+_log_seviyesi = os.environ.get('KUTU_LOG_SEVIYESI', 'INFO').upper()
+_log_dosyasi_modu = os.environ.get('KUTU_LOG_DOSYASI', 'dondur').lower()
+_log_bicimi = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_cocuk_surec = multiprocessing.current_process().name != 'MainProcess'
+_log_hedefleri = (logging.StreamHandler(sys.stdout),)
+if not _cocuk_surec:
+    if _log_dosyasi_modu == 'izle':
+        _log_hedefleri += (WatchedFileHandler('kutu_dunyasi.log'),)
+    elif _log_dosyasi_modu != 'yok':
+        _log_hedefleri += (RotatingFileHandler('kutu_dunyasi.log', maxBytes=10000000, backupCount=5),)
+for _hedef in _log_hedefleri:
+    _hedef.setFormatter(_log_bicimi)
+
+# Mesaj (ve varsa traceback) kuyruğa girmeden biçimlenir; hedefler tarih/seviye ekler
+_kuyruk_handler = QueueHandler(queue.SimpleQueue())
+_kuyruk_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_dinleyici = None
+
+def log_dinleyicisini_baslat():
+    """Kuyruğu boşaltan arka plan thread'ini (yeniden) başlatır"""
+    global _log_dinleyici
+    # fork sonrası çocuk süreçte eski thread yoktur; yeni kuyruk ve dinleyici kurulur
+    _kuyruk_handler.queue = queue.SimpleQueue()
+    _log_dinleyici = QueueListener(_kuyruk_handler.queue, *_log_hedefleri, respect_handler_level=True)
+    _log_dinleyici.start()
+
+def log_dinleyicisini_durdur():
+    """Kuyruktaki kayıtları yazıp dinleyiciyi durdurur"""
+    if _log_dinleyici is not None and _log_dinleyici._thread is not None:
+        _log_dinleyici.stop()
+
+if _cocuk_surec:
+    logging.basicConfig(level=_log_seviyesi, handlers=list(_log_hedefleri))
+else:
+    logging.basicConfig(level=_log_seviyesi, handlers=[_kuyruk_handler])
+    log_dinleyicisini_baslat()
+    atexit.register(log_dinleyicisini_durdur)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=log_dinleyicisini_baslat)
@@ -0,0 +1,200 @@
+"""
+Ürün kataloğu servisi.
+
+urun_katalog.xlsx süreçte tek bir Katalog nesnesi olarak tutulur; hem
+üretim hem ürün kataloğu blueprint'leri aramaları ve ürün bilgilerini
+buradan alır. Ayarlar (URUN_KATALOGU_DOSYASI, KATALOG_INDEKS_LIMITI,
+ONERI_ONBELLEK_ADEDI) çalışan uygulamanın config'inden okunur.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# ÜRÜN KATALOĞU YÜKLEME
+def urun_katalogunu_yukle():
+    """Excel dosyasından ürün kataloğunu yükler"""
+    import pandas as pd
+    try:
+        # Excel dosyasını oku
+        df = pd.read_excel(current_app.config['URUN_KATALOGU_DOSYASI'], sheet_name='Ürün Kataloğu')
+        
+        # Eksik değerleri temizle ve string işlemleri için hazırla
+        df['Ürün Adı*'] = df['Ürün Adı*'].astype(str).str.strip()
+        df['Bıçak Kodu*'] = df['Bıçak Kodu*'].astype(str).str.strip()
+        
+        # NaN değerleri boş string ile değiştir
+        df = df.fillna('')
+        
+        logger.info(f"Ürün kataloğu başarıyla yüklendi. Toplam {len(df)} ürün.")
+        return df
+    except Exception as e:
+        logger.error(f"Ürün kataloğu yükleme hatası: {e}")
+        # Boş bir DataFrame döndür
+        return pd.DataFrame(columns=['Ürün Adı*', 'Bıçak Kodu*', 'Bıçak Ebadı En (mm)*', 'Bıçak Ebadı Boy (mm)*'])
+
+# KATALOG ÖNBELLEĞİ
+# Excel dosyası her aramada yeniden okunmaz; dosyanın mtime/boyutu
+# değişmedikçe bellekteki kopya kullanılır. Sürüm, dosya içeriğinin
+# özetidir ve istemci tarafı ürün indeksinin (/urun-indeksi) anahtarıdır.
+class Katalog:
+    __slots__ = ('anahtar', 'surum', 'tablo', 'urunler', 'kucuk_harfli', 'indeks_json')
+
+    def __init__(self, anahtar, surum, tablo):
+        self.anahtar = anahtar
+        self.surum = surum
+        self.tablo = tablo
+        urunler = {urun.strip() for urun in tablo['Ürün Adı*'].dropna() if urun.strip()}
+        self.urunler = tuple(sorted(urunler))
+        self.kucuk_harfli = tuple((urun.lower(), urun) for urun in self.urunler)
+        indeks = self.urunler if len(self.urunler) <= current_app.config['KATALOG_INDEKS_LIMITI'] else None
+        self.indeks_json = json.dumps({'surum': surum, 'urunler': indeks}, ensure_ascii=False).encode('utf-8')
+
+_katalog = None
+_katalog_kilidi = threading.Lock()
+
+def katalog_dosya_anahtari():
+    try:
+        durum = os.stat(current_app.config['URUN_KATALOGU_DOSYASI'])
+    except OSError:
+        return None
+    return (durum.st_mtime_ns, durum.st_size)
+
+def katalog_getir():
+    """Güncel kataloğu döndürür; dosya değiştiyse yeniden yükler"""
+    global _katalog
+    anahtar = katalog_dosya_anahtari()
+    katalog = _katalog
+    if katalog is not None and katalog.anahtar == anahtar:
+        return katalog
+    with _katalog_kilidi:
+        if _katalog is not None and _katalog.anahtar == anahtar:
+            return _katalog
+        ozet = hashlib.sha1()
+        try:
+            with open(current_app.config['URUN_KATALOGU_DOSYASI'], 'rb') as dosya:
+                for parca in iter(lambda: dosya.read(1024 * 1024), b''):
+                    ozet.update(parca)
+        except OSError:
+            pass
+        _katalog = Katalog(anahtar, ozet.hexdigest()[:12], urun_katalogunu_yukle())
+        return _katalog
+
+def urun_ara_katalogda(sorgu, limit=10):
+    """Başı sorguyla eşleşen ürünler önce, sonra adında geçenler (ikisi de alfabetik)"""
+    basta, icinde = [], []
+    for kucuk, urun in katalog_getir().kucuk_harfli:
+        konum = kucuk.find(sorgu)
+        if konum == 0:
+            basta.append(urun)
+            if len(basta) == limit:
+                break
+        elif konum > 0 and len(icinde) < limit:
+            icinde.append(urun)
+    return (basta + icinde)[:limit]
+
+# ÖNERİ ÖNBELLEĞİ
+# /urun-ara sonuçları (normalize edilmiş sorgu -> ilk 10 ürün) katalog
+# sürümüyle anahtarlanan sınırlı bir LRU'da tutulur; "kut", "kap" gibi sık
+# yazılan başlangıçlar bellekten döner. Katalog değişince eski sürümün
+# kayıtları kullanılmaz ve zamanla LRU'dan düşer. İsabet/ıskalama sayıları
+# /metrics'te raporlanır.
+_oneri_onbellegi = OrderedDict()
+_oneri_kilidi = threading.Lock()
+_oneri_sayaclari = {'isabet': 0, 'iskalama': 0}
+
+def oneri_sorgusu(sorgu):
+    """Önbellek anahtarı için sorguyu normalize eder"""
+    return sorgu.strip().lower()
+
+def urun_onerileri(sorgu):
+    """Normalize edilmiş sorgu için ilk 10 ürün; önbellekten ya da katalogdan"""
+    anahtar = (katalog_getir().surum, sorgu)
+    with _oneri_kilidi:
+        sonuc = _oneri_onbellegi.get(anahtar)
+        if sonuc is not None:
+            _oneri_onbellegi.move_to_end(anahtar)
+            _oneri_sayaclari['isabet'] += 1
+            return sonuc
+        _oneri_sayaclari['iskalama'] += 1
+    sonuc = tuple(urun_ara_katalogda(sorgu))
+    with _oneri_kilidi:
+        _oneri_onbellegi[anahtar] = sonuc
+        while len(_oneri_onbellegi) > current_app.config['ONERI_ONBELLEK_ADEDI']:
+            _oneri_onbellegi.popitem(last=False)
+    return sonuc
+
+def oneri_onbellegi_metrikleri():
+    """Öneri önbelleği metriklerini Prometheus metin satırları olarak döndürür"""
+    with _oneri_kilidi:
+        isabet, iskalama = _oneri_sayaclari['isabet'], _oneri_sayaclari['iskalama']
+        kayit = len(_oneri_onbellegi)
+    toplam = isabet + iskalama
+    return [
+        '# HELP kutu_oneri_onbellegi_toplam Ürün önerisi önbelleği sorgu sayısı',
+        '# TYPE kutu_oneri_onbellegi_toplam counter',
+        f'kutu_oneri_onbellegi_toplam{{sonuc="isabet"}} {isabet}',
+        f'kutu_oneri_onbellegi_toplam{{sonuc="iskalama"}} {iskalama}',
+        '# HELP kutu_oneri_onbellegi_isabet_orani Süreç başından beri isabet oranı',
+        '# TYPE kutu_oneri_onbellegi_isabet_orani gauge',
+        f'kutu_oneri_onbellegi_isabet_orani {isabet / toplam if toplam else 0:.4f}',
+        '# HELP kutu_oneri_onbellegi_kayit Önbellekteki sorgu sayısı',
+        '# TYPE kutu_oneri_onbellegi_kayit gauge',
+        f'kutu_oneri_onbellegi_kayit {kayit}',
+    ]
+
+# TÜM ÜRÜN LİSTESİNİ GETİR
+def tum_urun_listesi():
+    """Tüm ürün listesini getirir"""
+    try:
+        return list(katalog_getir().urunler)
+    except Exception as e:
+        logger.error(f"Ürün listesi getirme hatası: {e}")
+        return []
+
+# ÜRÜN BİLGİSİ GETİRME FONKSİYONU
+def urun_bilgisi_getir(urun_adi):
+    """
+    Ürün adına göre bıçak kodu ve ebatlarını getirir
+    """
+    import pandas as pd
+    try:
+        urun_katalogu = katalog_getir().tablo
+        
+        if urun_katalogu.empty:
+            return None
+            
+        urun_adi_aranan = urun_adi.strip()
+        
+        # Tam eşleşme ara
+        bulunan_urun = urun_katalogu[urun_katalogu['Ürün Adı*'] == urun_adi_aranan]
+        
+        if not bulunan_urun.empty:
+            urun_bilgisi = bulunan_urun.iloc[0]
+            
+            bicak_kodu = urun_bilgisi['Bıçak Kodu*']
+            en = urun_bilgisi['Bıçak Ebadı En (mm)*']
+            boy = urun_bilgisi['Bıçak Ebadı Boy (mm)*']
+            
+            # Bıçak kodu boşsa uygun mesaj döndür
+            if pd.isna(bicak_kodu) or bicak_kodu == 'nan' or bicak_kodu == '':
+                bicak_kodu = "Bıçak Kodu Bulunamadı"
+            
+            return {
+                'bicak_kodu': bicak_kodu,
+                'en': en,
+                'boy': boy,
+                'urun_adi': urun_adi_aranan  # Tam ürün adını da döndür
+            }
+        else:
+            return None
+            
+    except Exception as e:
+        logger.error(f"Ürün bilgisi getirme hatası: {e}")
+        return None
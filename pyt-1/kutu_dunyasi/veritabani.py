@@ -0,0 +1,161 @@
+"""
+Ortak veri katmanı: tek SQLAlchemy nesnesi ve modeller.
+
+db burada uygulamaya bağlanmadan oluşturulur; süreçteki Flask uygulaması
+app.py'de db.init_app(app) ile bağlar. Böylece kutu_dunyasi_web.db'ye tek
+bir engine (ve tek bağlantı havuzu) üzerinden yazılır.
+"""
+import uuid
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, select, update
+
+db = SQLAlchemy()
+
+# Veritabanı Modeli - Üretim Emri
+class UretimEmri(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    musteri_adi = db.Column(db.String(200), nullable=False)
+    urun_adi = db.Column(db.String(200))
+    usiparis_miktari = db.Column(db.String(50))
+    tabaka_adedi = db.Column(db.String(50))
+    kagit_cinsi = db.Column(db.String(100))
+    gramaj = db.Column(db.String(50))
+    kagit_olcusu_1 = db.Column(db.String(50))
+    kagit_olcusu_2 = db.Column(db.String(50))
+    bicak_kodu = db.Column(db.String(100))
+    bicak_olcusu_1 = db.Column(db.String(50))
+    bicak_olcusu_2 = db.Column(db.String(50))
+    renk_sayisi = db.Column(db.String(50))
+    renk_bilgisi = db.Column(db.String(100))
+    verim = db.Column(db.String(50))
+    selefon_1 = db.Column(db.String(50))
+    selefon_2 = db.Column(db.String(50))
+    varak_yaldiz = db.Column(db.String(50))
+    gofre = db.Column(db.String(50))
+    yapistirma = db.Column(db.String(50))
+    paketleme = db.Column(db.String(100))
+    siparis_durumu = db.Column(db.String(50), index=True)
+    notlar = db.Column(db.Text)
+    baski_adedi = db.Column(db.String(50))
+    selefon_adedi = db.Column(db.String(50))
+    kesim_adedi = db.Column(db.String(50))
+    karton_agirligi = db.Column(db.String(50))
+    tarih = db.Column(db.String(50))
+    olusturma_tarihi = db.Column(db.DateTime, default=datetime.now, index=True)
+
+# Veritabanı Modeli - Veri Sürümü
+class VeriSurumu(db.Model):
+    """Üretim emirleri her değiştiğinde artan sayaç (dışa aktarma dosyalarının tekrar kullanımı için)"""
+    id = db.Column(db.Integer, primary_key=True)
+    deger = db.Column(db.Integer, nullable=False, default=0)
+    # Veritabanı oluşturulurken bir kez üretilir; aynı sürüm numarasına ulaşan
+    # başka (veya silinip yeniden oluşturulmuş) bir veritabanından ayırt eder
+    kimlik = db.Column(db.String(32), default=lambda: uuid.uuid4().hex)
+
+# Veritabanı Modeli - Üretim Planı
+class UretimPlani(db.Model):
+    """Planlama tablosundan kaydedilen plan (listeleme için ad ve tarih indeksli)"""
+    id = db.Column(db.Integer, primary_key=True)
+    plan_adi = db.Column(db.String(200), nullable=False, index=True)
+    olusturma_tarihi = db.Column(db.DateTime, default=datetime.now, index=True)
+    satir_sayisi = db.Column(db.Integer, nullable=False, default=0)
+    satirlar = db.relationship('UretimPlaniSatiri', backref='plan', order_by='UretimPlaniSatiri.sira',
+                               cascade='all, delete-orphan')
+
+# Veritabanı Modeli - Üretim Planı Satırı
+class UretimPlaniSatiri(db.Model):
+    """Plandaki bir satır; kayıttan eklendiyse üretim emrine bağlıdır"""
+    id = db.Column(db.Integer, primary_key=True)
+    plan_id = db.Column(db.Integer, db.ForeignKey('uretim_plani.id'), nullable=False, index=True)
+    sira = db.Column(db.Integer, nullable=False)
+    uretim_emri_id = db.Column(db.Integer, db.ForeignKey('uretim_emri.id', ondelete='SET NULL'), index=True)
+    musteri_adi = db.Column(db.String(200))
+    urun_adi = db.Column(db.String(200))
+    tabaka_adedi = db.Column(db.String(50))
+    renk = db.Column(db.String(100))
+    notlar = db.Column(db.Text)
+
+# Planlama tablosu hücreleri ve karşılık gelen üretim emri alanları
+PLAN_ALANLARI = {
+    'musteri_adi': 'musteri_adi',
+    'urun_adi': 'urun_adi',
+    'tabaka_adedi': 'tabaka_adedi',
+    'renk': 'renk_sayisi',
+    'notlar': 'notlar',
+}
+
+# Veritabanı Modeli - Veri Aktarımı
+class VeriAktarimi(db.Model):
+    """Eski veritabanından aktarımın kaldığı yer (yarıda kalırsa buradan devam edilir)"""
+    kaynak = db.Column(db.String(500), primary_key=True)
+    son_id = db.Column(db.Integer, nullable=False, default=0)
+    aktarilan = db.Column(db.Integer, nullable=False, default=0)
+    atlanan = db.Column(db.Integer, nullable=False, default=0)
+    guncelleme_tarihi = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+# Veritabanı Modeli - Senkronizasyon İşlemi
+class SenkronIslemi(db.Model):
+    """Çevrimdışı kuyruktan uygulanan işlemin sonucu (aynı işlem tekrar gelirse yeniden uygulanmaz)"""
+    anahtar = db.Column(db.String(64), primary_key=True)
+    sonuc = db.Column(db.Text, nullable=False)
+    olusturma_tarihi = db.Column(db.DateTime, default=datetime.now, index=True)
+
+# Veritabanı Modeli - Sipariş Formu
+class SiparisFormu(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    teklif_siparis_no = db.Column(db.String(100))
+    musteri_firma_adi = db.Column(db.String(200))
+    firma_yetkilisi = db.Column(db.String(100))
+    grafik_durumu = db.Column(db.String(100))
+    telefon_mail = db.Column(db.String(200))
+    odeme_sekli = db.Column(db.String(100))
+    teslim_tarihi = db.Column(db.String(50))
+    teslim_adresi = db.Column(db.Text)
+    
+    # Sıvamalı ürün bilgileri
+    ic_kisim_kac_adet = db.Column(db.String(50))
+    ic_kisim_urun_adi_cinsi = db.Column(db.String(200))
+    ic_kisim_kutu_olcusu = db.Column(db.String(100))
+    ic_kisim_karton_gramaji = db.Column(db.String(100))
+    ic_kisim_renk_sayisi = db.Column(db.String(50))
+    
+    dis_kisim_ici_bos = db.Column(db.String(50))
+    dis_kisim_sedef = db.Column(db.String(50))
+    dis_kisim_selefon_metallize = db.Column(db.String(50))
+    dis_kisim_ice_baski = db.Column(db.String(50))
+    
+    olusturma_tarihi = db.Column(db.DateTime, default=datetime.now)
+
+@event.listens_for(db.session, 'before_flush')
+def veri_surumunu_artir(session, flush_context, instances):
+    """Üretim emirlerine dokunan her flush'ta veri sürümünü aynı transaction içinde artırır"""
+    degisenler = list(session.new) + list(session.dirty) + list(session.deleted)
+    if any(isinstance(nesne, UretimEmri) for nesne in degisenler):
+        session.connection().execute(update(VeriSurumu).values(deger=VeriSurumu.deger + 1))
+
+@event.listens_for(db.session, 'before_flush')
+def plan_satirlarini_ayir(session, flush_context, instances):
+    """
+    Silinen üretim emrine bağlı plan satırlarının boş hücrelerini kayıttaki
+    değerlerle doldurur ve bağı koparır; kayıtlı plan aynı görünmeye devam eder.
+    """
+    satirlar = UretimPlaniSatiri.__table__
+    for kayit in session.deleted:
+        if isinstance(kayit, UretimEmri):
+            hucreler = {
+                plan_alani: func.coalesce(satirlar.c[plan_alani], getattr(kayit, kayit_alani) or '')
+                for plan_alani, kayit_alani in PLAN_ALANLARI.items()
+            }
+            session.connection().execute(
+                update(satirlar).where(satirlar.c.uretim_emri_id == kayit.id).values(uretim_emri_id=None, **hucreler)
+            )
+
+def veri_surumu_getir():
+    """Güncel veri sürümünü döndürür"""
+    return db.session.execute(select(VeriSurumu.deger)).scalar() or 0
+
+def veri_kimligi_getir():
+    """Veritabanının kalıcı kimliğini döndürür"""
+    return db.session.execute(select(VeriSurumu.kimlik)).scalar()
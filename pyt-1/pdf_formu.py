@@ -0,0 +1,459 @@
+import os
+import json
+import hashlib
+from io import BytesIO
+from xml.sax.saxutils import escape
+from reportlab import rl_config
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.fonts import addMapping
+from reportlab.lib.utils import ImageReader
+
+# ÜRETİM FORMU PDF ŞABLONU
+# Stiller, tablo stili ve satır yükseklikleri modül yüklenirken bir kez
+# oluşturulur; her istekte sadece siparişe ait hücreler üretilir.
+# Bu nesneler paylaşılır, render sırasında değiştirilmemelidir.
+_ornek_stiller = getSampleStyleSheet()
+
+# PDF'ler HTTP üzerinden ikili gönderiliyor; akışların ASCII85 ile metne
+# çevrilmesi gereksiz ve C hızlandırıcısı olmadan render süresinin büyük
+# kısmını alıyor (özellikle logo ve font akışları).
+rl_config.useA85 = 0
+
+# FONTLAR
+# Depodaki DejaVu fontları bir kez kaydedilir; reportlab PDF'e sadece
+# kullanılan glifleri gömer (subsetting). Türkçe karakterler doğrudan basılır.
+_FONT_DIZINI = os.path.dirname(os.path.abspath(__file__))
+
+def _fontlari_kaydet():
+    """DejaVu fontlarını kaydeder; dosyalar yoksa False döndürür"""
+    try:
+        pdfmetrics.registerFont(TTFont('DejaVuSans-Bold', os.path.join(_FONT_DIZINI, 'dejavu-sans.bold.ttf')))
+        pdfmetrics.registerFont(TTFont('DejaVuSansCondensed', os.path.join(_FONT_DIZINI, 'dejavu-sans.condensed.ttf')))
+    except Exception:
+        return False
+    # <b> etiketleri kalın yüze eşlensin
+    for ad in ('DejaVuSans-Bold', 'DejaVuSansCondensed'):
+        addMapping(ad, 0, 0, 'DejaVuSansCondensed')
+        addMapping(ad, 1, 0, 'DejaVuSans-Bold')
+        addMapping(ad, 0, 1, 'DejaVuSansCondensed')
+        addMapping(ad, 1, 1, 'DejaVuSans-Bold')
+    return True
+
+UNICODE_FONT = _fontlari_kaydet()
+KALIN_FONT = 'DejaVuSans-Bold' if UNICODE_FONT else 'Helvetica-Bold'
+
+# Font bulunamazsa Helvetica Türkçe harfleri basamaz; tek geçişte çevrilir
+_TURKCE_CEVIRME_TABLOSU = str.maketrans('ıİğĞüÜşŞöÖçÇ', 'iIgGuUsSoOcC')
+
+def metin(deger):
+    """Değeri Paragraph içine güvenle konacak metne çevirir"""
+    if deger is None:
+        return ""
+    deger = escape(str(deger))
+    if not UNICODE_FONT:
+        deger = deger.translate(_TURKCE_CEVIRME_TABLOSU)
+    return deger
+
+# LOGO
+# Logo modül yüklenirken bir kez bulunur, çözülür ve formdaki 40x15 mm
+# boyutuna (300 dpi) küçültülür. Her render aynı okuyucuyu kullanır;
+# diskten okuma ve büyük JPEG'in PDF'e gömülmesi tekrarlanmaz.
+LOGO_DOSYALARI = ('logo.jpg', 'Logo.jpg', 'logo.png')
+LOGO_GENISLIK = 40*mm
+LOGO_YUKSEKLIK = 15*mm
+LOGO_DPI = 300
+
+class _LogoOkuyucu(ImageReader):
+    """Küçültülmüş JPEG baytlarını tutan, thread'ler arasında paylaşılabilen okuyucu"""
+    def __init__(self, jpeg_baytlari):
+        self._jpeg = jpeg_baytlari
+        super().__init__(BytesIO(jpeg_baytlari))
+        self.getRGBData()  # önbellek anahtarı için ham veri bir kez çözülür
+
+    def jpeg_fh(self):
+        # Her çağrıda bağımsız dosya nesnesi; JPEG yeniden sıkıştırılmadan gömülür
+        return BytesIO(self._jpeg)
+
+def _logo_yukle():
+    """Logoyu bulup hedef çözünürlüğe küçültür; bulunamazsa None döndürür"""
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return None
+
+    for ad in LOGO_DOSYALARI:
+        yol = os.path.join(_FONT_DIZINI, ad)
+        if not os.path.exists(yol):
+            continue
+        try:
+            with PILImage.open(yol) as resim:
+                if resim.mode in ('RGBA', 'LA', 'P'):
+                    resim = resim.convert('RGBA')
+                    zemin = PILImage.new('RGB', resim.size, 'white')
+                    zemin.paste(resim, mask=resim.getchannel('A'))
+                    resim = zemin
+                else:
+                    resim = resim.convert('RGB')
+                boyut = (round(LOGO_GENISLIK / 72 * LOGO_DPI), round(LOGO_YUKSEKLIK / 72 * LOGO_DPI))
+                resim = resim.resize(boyut, PILImage.LANCZOS)
+                cikti = BytesIO()
+                resim.save(cikti, 'JPEG', quality=90)
+            return _LogoOkuyucu(cikti.getvalue())
+        except Exception:
+            continue
+    return None
+
+LOGO_OKUYUCU = _logo_yukle()
+
+class _LogoResmi(Image):
+    """Önceden yüklenmiş okuyucuyu dosya açmadan çizen Image"""
+    def __init__(self, okuyucu):
+        self._img = okuyucu
+        super().__init__(okuyucu.jpeg_fh(), width=LOGO_GENISLIK, height=LOGO_YUKSEKLIK)
+
+# ANA BAŞLIK - DAHA AZ BOŞLUK
+BASLIK_STILI = ParagraphStyle(
+    'AnaBaslik',
+    parent=_ornek_stiller['Heading1'],
+    fontSize=14,
+    spaceAfter=0.5*mm,  # AZALTILDI (1 → 0.5mm)
+    alignment=1,
+    textColor=colors.HexColor('#2C3E50'),
+    fontName=KALIN_FONT
+)
+
+# TARİH - DAHA AZ BOŞLUK
+TARIH_STILI = ParagraphStyle(
+    'Tarih',
+    parent=_ornek_stiller['Normal'],
+    fontSize=11,
+    alignment=2,
+    spaceAfter=0.5*mm,  # AZALTILDI
+    textColor=colors.HexColor('#7F8C8D'),
+    fontName=KALIN_FONT
+)
+
+# Başlık stilleri
+BASLIK_STILI_BUYUK = ParagraphStyle(
+    'BaslikBuyuk',
+    parent=_ornek_stiller['Heading2'],
+    fontSize=13,
+    fontName=KALIN_FONT
+)
+
+NORMAL_STILI_BUYUK = ParagraphStyle(
+    'NormalBuyuk',
+    parent=_ornek_stiller['Normal'],
+    fontSize=13,
+    fontName=KALIN_FONT
+)
+
+KIRMIZI_YAZI_STILI = ParagraphStyle(
+    'KirmiziYazi',
+    parent=_ornek_stiller['Normal'],
+    fontSize=13,
+    textColor=colors.red,
+    fontName=KALIN_FONT
+)
+
+ALT_BILGI_STILI = ParagraphStyle(
+    'Footer',
+    parent=_ornek_stiller['Normal'],
+    fontSize=6,
+    alignment=1,
+    textColor=colors.HexColor('#7F8C8D'),
+    fontName=KALIN_FONT
+)
+
+# SATIR YÜKSEKLİKLERİ
+SATIR_YUKSEKLIKLERI = (
+    30, 22, 22, 22, 22, 22,   # Müşteri
+    30, 22, 22, 22, 22, 22, 22,  # Malzeme
+    30, 22, 22, 22, 22,        # Baskı
+    30, 22, 22, 22, 22,        # Finisaj
+    30, 35,                    # Notlar
+    30, 30, 30, 30,            # Üretim
+)
+
+# TABLO GENİŞLİKLERİ
+KOLON_GENISLIKLERI = (60*mm, 140*mm)
+
+TABLO_STILI = TableStyle([
+    # Başlık satırları - RENKLER
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+    ('BACKGROUND', (0, 6), (-1, 6), colors.HexColor('#27AE60')),
+    ('BACKGROUND', (0, 13), (-1, 13), colors.HexColor('#8E44AD')),
+    ('BACKGROUND', (0, 18), (-1, 18), colors.HexColor('#E67E22')),
+    ('BACKGROUND', (0, 23), (-1, 23), colors.HexColor('#E74C3C')),
+    ('BACKGROUND', (0, 25), (-1, 25), colors.HexColor('#3498DB')),
+
+    # Font ayarları
+    ('FONTNAME', (0, 0), (-1, -1), KALIN_FONT),
+    ('FONTSIZE', (0, 0), (-1, -1), 13),
+
+    # NOTLAR SATIRI İÇİN KIRMIZI YAZI
+    ('TEXTCOLOR', (1, 24), (1, 24), colors.red),
+
+    # Hizalama
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+
+    # Padding
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+
+    # NOTLAR SATIRI İÇİN DAHA FAZLA PADDING
+    ('BOTTOMPADDING', (0, 24), (-1, 24), 14),
+    ('TOPPADDING', (0, 24), (-1, 24), 14),
+
+    # ÜRETİM BİLGİLERİ İÇİN DAHA FAZLA PADDING
+    ('BOTTOMPADDING', (0, 26), (-1, 28), 12),
+    ('TOPPADDING', (0, 26), (-1, 28), 12),
+
+    # BAŞLIK SATIRLARI İÇİN DAHA FAZLA PADDING
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 14),
+    ('TOPPADDING', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 6), (-1, 6), 14),
+    ('TOPPADDING', (0, 6), (-1, 6), 14),
+    ('BOTTOMPADDING', (0, 13), (-1, 13), 14),
+    ('TOPPADDING', (0, 13), (-1, 13), 14),
+    ('BOTTOMPADDING', (0, 18), (-1, 18), 14),
+    ('TOPPADDING', (0, 18), (-1, 18), 14),
+    ('BOTTOMPADDING', (0, 23), (-1, 23), 14),
+    ('TOPPADDING', (0, 23), (-1, 23), 14),
+    ('BOTTOMPADDING', (0, 25), (-1, 25), 14),
+    ('TOPPADDING', (0, 25), (-1, 25), 14),
+
+    # NORMAL SATIRLAR İÇİN GRID
+    ('GRID', (0, 1), (-1, -1), 0.5, colors.HexColor('#2C3E50')),
+
+    # BAŞLIK SATIRLARI İÇİN SADECE ALT ÇİZGİ
+    ('LINEBELOW', (0, 0), (-1, 0), 1.0, colors.HexColor('#2C3E50')),
+    ('LINEBELOW', (0, 6), (-1, 6), 1.0, colors.HexColor('#2C3E50')),
+    ('LINEBELOW', (0, 13), (-1, 13), 1.0, colors.HexColor('#2C3E50')),
+    ('LINEBELOW', (0, 18), (-1, 18), 1.0, colors.HexColor('#2C3E50')),
+    ('LINEBELOW', (0, 23), (-1, 23), 1.0, colors.HexColor('#2C3E50')),
+    ('LINEBELOW', (0, 25), (-1, 25), 1.0, colors.HexColor('#2C3E50')),
+
+    # BAŞLIK SATIRLARININ YAN ÇİZGİLERİNİ KALDIR
+    ('LINEBEFORE', (0, 0), (-1, 0), 0, colors.white),
+    ('LINEAFTER', (0, 0), (-1, 0), 0, colors.white),
+    ('LINEBEFORE', (0, 6), (-1, 6), 0, colors.white),
+    ('LINEAFTER', (0, 6), (-1, 6), 0, colors.white),
+    ('LINEBEFORE', (0, 13), (-1, 13), 0, colors.white),
+    ('LINEAFTER', (0, 13), (-1, 13), 0, colors.white),
+    ('LINEBEFORE', (0, 18), (-1, 18), 0, colors.white),
+    ('LINEAFTER', (0, 18), (-1, 18), 0, colors.white),
+    ('LINEBEFORE', (0, 23), (-1, 23), 0, colors.white),
+    ('LINEAFTER', (0, 23), (-1, 23), 0, colors.white),
+    ('LINEBEFORE', (0, 25), (-1, 25), 0, colors.white),
+    ('LINEAFTER', (0, 25), (-1, 25), 0, colors.white),
+
+    # BAŞLIK SATIRLARINDA SPAN
+    ('SPAN', (0, 0), (-1, 0)),
+    ('SPAN', (0, 6), (-1, 6)),
+    ('SPAN', (0, 13), (-1, 13)),
+    ('SPAN', (0, 18), (-1, 18)),
+    ('SPAN', (0, 23), (-1, 23)),
+    ('SPAN', (0, 25), (-1, 25)),
+])
+
+# Sabit metinli hücreler (başlıklar ve etiketler) de bir kez oluşturulur
+def _baslik(yazi):
+    return Paragraph(f"<b>{metin(yazi)}</b>", BASLIK_STILI_BUYUK)
+
+def _etiket(yazi):
+    return Paragraph(f"<b>{metin(yazi)}</b>", NORMAL_STILI_BUYUK)
+
+FORM_BASLIGI = Paragraph(metin("ÜRETİM FORMU"), BASLIK_STILI)
+
+BOLUM_BASLIKLARI = {
+    'musteri': _baslik("MÜŞTERİ BİLGİLERİ"),
+    'malzeme': _baslik("MALZEME BİLGİLERİ"),
+    'baski': _baslik("BASKI BİLGİLERİ"),
+    'finisaj': _baslik("FİNİSAJ BİLGİLERİ"),
+    'notlar': _baslik("NOTLAR"),
+    'uretim': _baslik("ÜRETİM BİLGİLERİ"),
+}
+
+ETIKETLER = {ad: _etiket(yazi) for ad, yazi in (
+    ('musteri_adi', "Müşteri Adı"),
+    ('urun_adi', "Ürün Adı"),
+    ('usiparis_miktari', "Üretim/Sipariş Mik."),
+    ('tabaka_adedi', "Tabaka Adedi"),
+    ('siparis_durumu', "Sipariş Durumu"),
+    ('kagit_cinsi', "Kağıt Cinsi"),
+    ('gramaj', "Gramaj"),
+    ('kagit_olcusu', "Kağıt Ölçüsü"),
+    ('karton_agirligi', "Kartonun Ağırlığı"),
+    ('bicak_olcusu', "Bıçak Ölçüsü"),
+    ('bicak_kodu', "Bıçak Kodu"),
+    ('renk_sayisi', "Renk Sayısı"),
+    ('renk_bilgisi', "Renk Bilgisi"),
+    ('verim', "Verim"),
+    ('selefon', "Selefon"),
+    ('varak_yaldiz', "Varak Yaldız"),
+    ('gofre', "Gofre"),
+    ('yapistirma', "Yapıştırma"),
+    ('paketleme', "Paketleme"),
+    ('notlar', "Notlar"),
+    ('baski_adedi', "Baskı Adedi"),
+    ('selefon_adedi', "Selefon Adedi"),
+    ('kesim_adedi', "Kesim Adedi"),
+)}
+
+# Şablonun görünümünü değiştiren her düzenlemede artırılmalı;
+# PDF önbelleğindeki eski çıktılar bu sayede kullanılmaz.
+SABLON_SURUMU = 4
+
+# Formda kullanılan alanlar (önbellek anahtarı sadece bunlardan üretilir)
+FORM_ALANLARI = (
+    'tarih', 'musteri_adi', 'urun_adi', 'usiparis_miktari', 'tabaka_adedi',
+    'siparis_durumu', 'kagit_cinsi', 'gramaj', 'kagit_olcusu_1', 'kagit_olcusu_2',
+    'karton_agirligi', 'bicak_olcusu_1', 'bicak_olcusu_2', 'bicak_kodu',
+    'renk_sayisi', 'renk_bilgisi', 'verim', 'selefon_1', 'selefon_2',
+    'varak_yaldiz', 'gofre', 'yapistirma', 'paketleme', 'notlar',
+    'baski_adedi', 'selefon_adedi', 'kesim_adedi',
+)
+
+def form_anahtari(data):
+    """
+    Form verisinin ve şablon sürümünün özetini döndürür.
+    Çıktı sadece bu alanlara bağlıdır (alt bilgide üretim anı değil formun
+    tarihi yazar); aynı formun tekrar basımlarında ilk üretilen PDF kullanılır.
+    """
+    normal = {alan: data[alan] for alan in FORM_ALANLARI if alan in data}
+    ozet_metni = json.dumps([SABLON_SURUMU, normal], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(ozet_metni.encode('utf-8')).hexdigest()
+
+# PDF FONKSİYONLARI
+def _yeni_belge(buffer):
+    return SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=5*mm,
+        leftMargin=5*mm,
+        topMargin=1*mm,    # ÜST MARGIN AZALTILDI (2mm → 1mm)
+        bottomMargin=2*mm
+    )
+
+def form_hikayesi(data):
+    """Tek bir üretim formunun sayfa içeriğini (flowable listesi) döndürür - TABLO ÜSTE YAKIN"""
+    story = []
+
+    # LOGO ALANI - DAHA KÜÇÜK ve DAHA AZ YER KAPLAYACAK
+    if LOGO_OKUYUCU is not None:
+        logo = _LogoResmi(LOGO_OKUYUCU)
+        logo.hAlign = 'CENTER'
+        story.append(logo)
+        story.append(Spacer(1, 0.5*mm))  # DAHA AZ BOŞLUK
+
+    story.append(FORM_BASLIGI)
+    story.append(Paragraph(f"<b>Tarih:</b> {metin(data.get('tarih', ''))}", TARIH_STILI))
+
+    story.append(Spacer(1, 0.5*mm))  # TABLO ÖNCESİ BOŞLUK AZALTILDI
+
+    # TABLO VERİLERİ
+    def deger(yazi):
+        return Paragraph(f"<b>{yazi}</b>", NORMAL_STILI_BUYUK)
+
+    def bolum(ad):
+        return [BOLUM_BASLIKLARI[ad], ""]
+
+    def satir(alan, varsayilan=''):
+        return [ETIKETLER[alan], deger(metin(data.get(alan, varsayilan)))]
+
+    notlar = data.get('notlar', '') or ""
+
+    tum_veriler = [
+        # MÜŞTERİ BİLGİLERİ - MAVİ
+        bolum('musteri'),
+        satir('musteri_adi'),
+        satir('urun_adi'),
+        satir('usiparis_miktari'),
+        satir('tabaka_adedi'),
+        satir('siparis_durumu'),
+
+        # MALZEME BİLGİLERİ - YEŞİL
+        bolum('malzeme'),
+        satir('kagit_cinsi'),
+        satir('gramaj'),
+        [ETIKETLER['kagit_olcusu'], deger(f"{metin(data.get('kagit_olcusu_1', ''))} x {metin(data.get('kagit_olcusu_2', ''))}")],
+        satir('karton_agirligi', 'Hesaplanamadı'),
+        [ETIKETLER['bicak_olcusu'], deger(f"{metin(data.get('bicak_olcusu_1', ''))} x {metin(data.get('bicak_olcusu_2', ''))} mm")],
+        satir('bicak_kodu'),
+
+        # BASKI BİLGİLERİ - MOR
+        bolum('baski'),
+        satir('renk_sayisi'),
+        satir('renk_bilgisi'),
+        satir('verim'),
+        [ETIKETLER['selefon'], deger(f"{metin(data.get('selefon_1', ''))} x {metin(data.get('selefon_2', ''))}")],
+
+        # FİNİSAJ BİLGİLERİ - TURUNCU
+        bolum('finisaj'),
+        satir('varak_yaldiz'),
+        satir('gofre'),
+        satir('yapistirma'),
+        satir('paketleme'),
+
+        # NOTLAR - KIRMIZI
+        bolum('notlar'),
+        [ETIKETLER['notlar'], Paragraph(f"<b>{metin(notlar)}</b>", KIRMIZI_YAZI_STILI)],
+
+        # ÜRETİM BİLGİLERİ - MAVİ
+        bolum('uretim'),
+        satir('baski_adedi'),
+        satir('selefon_adedi'),
+        satir('kesim_adedi'),
+    ]
+
+    tablo = Table(tum_veriler, colWidths=KOLON_GENISLIKLERI, rowHeights=SATIR_YUKSEKLIKLERI)
+    tablo.setStyle(TABLO_STILI)
+    story.append(tablo)
+
+    # ALT BİLGİ - DAHA AZ BOŞLUK
+    story.append(Spacer(1, 0.5*mm))  # AZALTILDI
+    # Üretim anı yerine formun kendi tarihi yazılır; önbellekten gelen kopya da doğru kalır
+    form_tarihi = data.get('tarih', '')
+    story.append(Paragraph(
+        metin(f"Form tarihi: {form_tarihi} - KUTU DÜNYASI" if form_tarihi else "KUTU DÜNYASI"),
+        ALT_BILGI_STILI
+    ))
+
+    return story
+
+def form_pdf_olustur(data):
+    """Üretim formunu PDF olarak oluşturur ve byte olarak döndürür"""
+    buffer = BytesIO()
+    _yeni_belge(buffer).build(form_hikayesi(data))
+    return buffer.getvalue()
+
+def toplu_pdf_olustur(formlar):
+    """Birden fazla formu her biri ayrı sayfada olacak şekilde tek bir doc.build ile PDF'e dönüştürür"""
+    story = []
+    for sira, data in enumerate(formlar):
+        if sira:
+            story.append(PageBreak())
+        story.extend(form_hikayesi(data))
+
+    buffer = BytesIO()
+    _yeni_belge(buffer).build(story)
+    return buffer.getvalue()
+
+# İŞLEM HAVUZU YARDIMCILARI
+def pdf_iscisi_hazirla():
+    """İşlem havuzu süreci açılırken bir form render ederek fontları ve önbellekleri ısıtır"""
+    form_pdf_olustur({})
+
+def pdf_iscisi_kimligi(_=None):
+    """Isıtma sırasında her sürecin ayağa kalktığını doğrulamak için süreç kimliğini döndürür"""
+    return os.getpid()
@@ -0,0 +1,52 @@
+// ÇEVRİMDIŞI MOD
+// Servis çalışanını (/sw.js) kaydeder, bağlantı geri gelince kuyruktaki
+// değişikliklerin gönderilmesini ister ve senkronizasyon sorunlarını gösterir.
+// Servis çalışanları sadece HTTPS (veya localhost) üzerinde çalışır.
+(function() {
+    if (!('serviceWorker' in navigator)) {
+        return;
+    }
+    if (!window.isSecureContext) {
+        console.warn('Çevrimdışı mod kapalı: servis çalışanı için sayfa HTTPS üzerinden açılmalı.');
+        return;
+    }
+
+    function senkronize() {
+        navigator.serviceWorker.ready.then(kayit => {
+            if (kayit.active) {
+                kayit.active.postMessage({tur: 'senkronize'});
+            }
+        });
+    }
+
+    function sorunMesaji(sonuc) {
+        if (sonuc.durum === 'cakisma') {
+            const degerler = Object.entries(sonuc.mevcut || {})
+                .map(([alan, deger]) => `${alan}: ${deger === null ? '' : deger}`)
+                .join(', ');
+            return `Kayıt ${sonuc.id}: başka biri tarafından değiştirilmiş, değişikliğiniz uygulanmadı (güncel: ${degerler})`;
+        }
+        if (sonuc.durum === 'bulunamadi') {
+            return `Kayıt ${sonuc.id}: silinmiş, değişikliğiniz uygulanmadı`;
+        }
+        return `Kayıt ${sonuc.id || ''}: ${sonuc.mesaj || 'değişiklik uygulanamadı'}`;
+    }
+
+    navigator.serviceWorker.register('/sw.js')
+        .catch(error => console.error('Servis çalışanı kaydedilemedi:', error));
+
+    navigator.serviceWorker.addEventListener('message', olay => {
+        const mesaj = olay.data || {};
+        if (mesaj.tur === 'senkron-sorunlari') {
+            alert('Çevrimdışı yapılan bazı değişiklikler uygulanamadı:\n\n' +
+                  mesaj.sonuclar.map(sorunMesaji).join('\n'));
+        }
+        // Veri gösteren sayfalar listeyi yeniden yüklemek için bu olayı dinleyebilir
+        window.dispatchEvent(new CustomEvent('kutu-senkron', {detail: mesaj}));
+    });
+
+    window.addEventListener('online', senkronize);
+    if (navigator.onLine) {
+        senkronize();
+    }
+})();
@@ -0,0 +1,115 @@
+// KATALOG İNDEKSİ
+// Ürün adları katalog sürümüyle (Excel dosyasının özeti) birlikte IndexedDB'de
+// saklanır. Sayfa açılışında sadece sürüm doğrulanır (değişmediyse 304 gelir)
+// ve otomatik tamamlama tarayıcıda yapılır. IndexedDB yoksa liste sadece
+// bellekte tutulur; katalog sunucu sınırından büyükse ya da indeks
+// alınamazsa null döner ve çağıran /urun-ara'ya düşer.
+const KatalogIndeksi = (function() {
+    const DB_ADI = 'kutu-dunyasi';
+    const DEPO = 'katalog';
+    const ANAHTAR = 'urun-indeksi';
+    let yukleme = null;
+
+    function dbAc() {
+        return new Promise((resolve, reject) => {
+            if (!window.indexedDB) {
+                reject(new Error('IndexedDB desteklenmiyor'));
+                return;
+            }
+            const istek = indexedDB.open(DB_ADI, 1);
+            istek.onupgradeneeded = () => istek.result.createObjectStore(DEPO);
+            istek.onsuccess = () => resolve(istek.result);
+            istek.onerror = () => reject(istek.error);
+        });
+    }
+
+    function depoIslemi(db, mod, islem) {
+        return new Promise((resolve, reject) => {
+            const istek = islem(db.transaction(DEPO, mod).objectStore(DEPO));
+            istek.onsuccess = () => resolve(istek.result);
+            istek.onerror = () => reject(istek.error);
+        });
+    }
+
+    function hazirla(urunler) {
+        return urunler.map(urun => [urun, urun.toLowerCase()]);
+    }
+
+    async function yukle() {
+        let db = null;
+        let kayit = null;
+        try {
+            db = await dbAc();
+            kayit = await depoIslemi(db, 'readonly', depo => depo.get(ANAHTAR));
+        } catch (error) {
+            console.warn('Katalog indeksi önbelleği kullanılamıyor:', error);
+        }
+
+        let yanit;
+        try {
+            yanit = await fetch('/urun-indeksi', {
+                cache: 'no-store',
+                headers: kayit ? {'If-None-Match': 'W/"' + kayit.surum + '"'} : {}
+            });
+        } catch (error) {
+            // Sunucuya ulaşılamıyorsa eldeki sürümle devam edilir
+            return kayit ? hazirla(kayit.urunler) : null;
+        }
+        if (yanit.status === 304 && kayit) {
+            return hazirla(kayit.urunler);
+        }
+        if (!yanit.ok) {
+            return kayit ? hazirla(kayit.urunler) : null;
+        }
+
+        const veri = await yanit.json();
+        if (!veri.urunler) {
+            return null;
+        }
+        if (db) {
+            depoIslemi(db, 'readwrite', depo => depo.put({surum: veri.surum, urunler: veri.urunler}, ANAHTAR))
+                .catch(error => console.warn('Katalog indeksi kaydedilemedi:', error));
+        }
+        return hazirla(veri.urunler);
+    }
+
+    function indeks() {
+        if (!yukleme) {
+            yukleme = yukle().catch(error => {
+                console.error('Katalog indeksi yükleme hatası:', error);
+                return null;
+            });
+        }
+        return yukleme;
+    }
+
+    // Sunucudaki /urun-ara ile aynı sıralama: önce başı eşleşenler, sonra adında geçenler
+    async function ara(sorgu, limit = 10) {
+        const urunler = await indeks();
+        if (!urunler) {
+            return null;
+        }
+        const aranan = sorgu.trim().toLowerCase();
+        const basta = [];
+        const icinde = [];
+        for (const [urun, kucuk] of urunler) {
+            const konum = kucuk.indexOf(aranan);
+            if (konum === 0) {
+                basta.push(urun);
+                if (basta.length === limit) {
+                    break;
+                }
+            } else if (konum > 0 && icinde.length < limit) {
+                icinde.push(urun);
+            }
+        }
+        return basta.concat(icinde).slice(0, limit);
+    }
+
+    async function tumu() {
+        const urunler = await indeks();
+        return urunler ? urunler.map(([urun]) => urun) : null;
+    }
+
+    return {indeks, ara, tumu};
+})();
@@ -0,0 +1,511 @@
+// ÇEVRİMDIŞI MOD SERVİS ÇALIŞANI
+// /sw.js adresinden verilir (kapsamı tüm uygulama). Baskı salonundaki
+// tabletlerde Wi-Fi koptuğunda:
+// - Sayfa kabukları ağdan alınır, ağ yoksa önbellekten açılır; içerik özetli
+//   statik dosyalar önbellekten verilir.
+// - Üretim emri listeleri IndexedDB'deki son kopyadan anında döner ve arka
+//   planda ETag ile doğrulanır (değişmediyse sunucu 304 döner).
+// - Ürün takip formunun arama ve kayıt yükleme istekleri ağ yoksa bu
+//   kopyalardan (ve daha önce açılmış kayıtların önbelleğinden) cevaplanır.
+// - Yazmalar (hücre/kayıt güncelleme, ekleme, form kaydı, silme) ağ yoksa kuyruğa alınır,
+//   yerel kopyaya uygulanmış gibi gösterilir ve bağlantı gelince
+//   /api/production-sync'e partiler halinde sırayla gönderilir. Kuyruk boş
+//   değilken gelen yazmalar da sıra bozulmasın diye kuyruğa eklenir.
+// - Sunucu çakışma bildirirse (alan bu arada başkası tarafından değişmişse)
+//   işlem uygulanmaz, açık sayfalara güncel değerlerle bildirilir.
+const ONBELLEK = 'kutu-dunyasi-v1';
+const SAYFALAR = ['/', '/urun-takip', '/uretim-planlama'];
+const LISTELER = ['/api/production-data', '/api/simple-production-data', '/list'];
+// Tüm alanları taşımayan listelerde bulunan alanlar
+const LISTE_ALANLARI = {
+    '/api/simple-production-data': ['id', 'musteri_adi', 'urun_adi', 'tabaka_adedi', 'renk_sayisi', 'renk_bilgisi', 'notlar'],
+    '/list': ['id', 'musteri_adi', 'urun_adi', 'bicak_kodu', 'siparis_durumu', 'tarih']
+};
+const ARAMA_ALANLARI = ['musteri_adi', 'urun_adi', 'bicak_kodu'];
+const GUNCELLENEBILIR_ALANLAR = ['musteri_adi', 'urun_adi', 'usiparis_miktari', 'siparis_durumu', 'notlar'];
+const DB_ADI = 'kutu-dunyasi-cevrimdisi';
+const PARTI_BOYUTU = 50;
+
+// INDEXEDDB
+// listeler: adres -> {etag, kayitlar} (sunucudan gelen son kopya)
+// kuyruk: sırayla gönderilecek işlemler {sira, islem}
+let dbSozu = null;
+
+function dbAc() {
+    if (!dbSozu) {
+        dbSozu = new Promise((resolve, reject) => {
+            const istek = indexedDB.open(DB_ADI, 1);
+            istek.onupgradeneeded = () => {
+                istek.result.createObjectStore('listeler');
+                istek.result.createObjectStore('kuyruk', {keyPath: 'sira', autoIncrement: true});
+            };
+            istek.onsuccess = () => resolve(istek.result);
+            istek.onerror = () => reject(istek.error);
+        });
+    }
+    return dbSozu;
+}
+
+// islem(depo) bir IDBRequest döndürürse sonucu, transaction tamamlanınca döner
+async function depoIslemi(depoAdi, mod, islem) {
+    const db = await dbAc();
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(depoAdi, mod);
+        const istek = islem(tx.objectStore(depoAdi));
+        tx.oncomplete = () => resolve(istek ? istek.result : undefined);
+        tx.onerror = tx.onabort = () => reject(tx.error);
+    });
+}
+
+const listeGetir = adres => depoIslemi('listeler', 'readonly', depo => depo.get(adres));
+const listeKaydet = (adres, kayit) => depoIslemi('listeler', 'readwrite', depo => depo.put(kayit, adres));
+const kuyrukGetir = () => depoIslemi('kuyruk', 'readonly', depo => depo.getAll());
+const kuyruguSay = () => depoIslemi('kuyruk', 'readonly', depo => depo.count());
+
+function kuyrugaEkle(islemler) {
+    return depoIslemi('kuyruk', 'readwrite', depo => {
+        islemler.forEach(islem => depo.add({islem}));
+    });
+}
+
+// Gönderilen işlemleri siler, kalanlardaki geçici id'leri gerçek id'lerle değiştirir
+function kuyruguGuncelle(gonderilenler, eslesmeler) {
+    return depoIslemi('kuyruk', 'readwrite', depo => {
+        gonderilenler.forEach(sira => depo.delete(sira));
+        if (!eslesmeler.size) {
+            return;
+        }
+        depo.openCursor().onsuccess = olay => {
+            const imlec = olay.target.result;
+            if (!imlec) {
+                return;
+            }
+            const {islem} = imlec.value;
+            if (eslesmeler.has(islem.id)) {
+                islem.id = eslesmeler.get(islem.id);
+                imlec.update(imlec.value);
+            }
+            imlec.continue();
+        };
+    });
+}
+
+// YEREL KOPYA
+function jsonYanit(veri, basliklar = {}, durum = 200) {
+    return new Response(JSON.stringify(veri), {
+        status: durum,
+        headers: Object.assign({'Content-Type': 'application/json'}, basliklar)
+    });
+}
+
+function sunucuTarihi(tarih) {
+    const parcalar = /^(\d{4})-(\d{2})-(\d{2})$/.exec(tarih || '');
+    return parcalar ? `${parcalar[3]}.${parcalar[2]}.${parcalar[1]}` : null;
+}
+
+function bugun() {
+    const tarih = new Date();
+    return [tarih.getDate(), tarih.getMonth() + 1].map(sayi => String(sayi).padStart(2, '0')).join('.') +
+        '.' + tarih.getFullYear();
+}
+
+// Kuyruktaki işlemleri listenin kopyasına uygular (sunucunun yapacağını taklit eder)
+function kuyruguUygula(adres, kayitlar, kuyruk) {
+    const alanlar = LISTE_ALANLARI[adres];
+    let sonuc = kayitlar.map(kayit => Object.assign({}, kayit));
+    for (const {islem} of kuyruk) {
+        const kayit = sonuc.find(k => k.id === islem.id);
+        if (islem.tur === 'ekle' || islem.tur === 'kaydet') {
+            // Form kaydı (/save) tarihi olduğu gibi saklar, boşsa bugünü yazar
+            const tarih = islem.tur === 'kaydet'
+                ? islem.alanlar.tarih || bugun()
+                : sunucuTarihi(islem.alanlar.tarih) || islem.alanlar.tarih || '';
+            const yeni = Object.assign({}, islem.alanlar, {id: islem.gecici_id, tarih, olusturma_tarihi: ''});
+            if (alanlar) {
+                alanlar.forEach(alan => { if (!(alan in yeni)) yeni[alan] = ''; });
+                Object.keys(yeni).forEach(alan => { if (!alanlar.includes(alan)) delete yeni[alan]; });
+            }
+            sonuc.unshift(yeni);
+        } else if (islem.tur === 'sil') {
+            sonuc = sonuc.filter(k => k.id !== islem.id);
+        } else if (kayit && islem.tur === 'hucre') {
+            if (islem.alan in kayit) {
+                kayit[islem.alan] = islem.deger;
+            }
+        } else if (kayit && islem.tur === 'guncelle') {
+            GUNCELLENEBILIR_ALANLAR.forEach(alan => {
+                if (alan in islem.alanlar && alan in kayit) {
+                    kayit[alan] = islem.alanlar[alan];
+                }
+            });
+            const tarih = sunucuTarihi(islem.alanlar.tarih);
+            if (tarih && 'tarih' in kayit) {
+                kayit.tarih = tarih;
+            }
+        }
+    }
+    return sonuc;
+}
+
+async function yerelListe(adres) {
+    const [kopya, kuyruk] = await Promise.all([listeGetir(adres), kuyrukGetir()]);
+    return kopya ? kuyruguUygula(adres, kopya.kayitlar, kuyruk) : null;
+}
+
+// Kuyruğa alınan değişiklik için istemcinin gördüğü değerler (sunucuda çakışma kontrolü)
+async function eskiDegerler(id, alanlar) {
+    for (const adres of LISTELER) {
+        const kayitlar = await yerelListe(adres);
+        const kayit = kayitlar && kayitlar.find(k => k.id === id);
+        if (kayit) {
+            const eski = {};
+            alanlar.filter(alan => alan in kayit).forEach(alan => { eski[alan] = kayit[alan]; });
+            return eski;
+        }
+    }
+    return {};
+}
+
+async function listeyiYenile(adres) {
+    const kopya = await listeGetir(adres);
+    const yanit = await fetch(adres, {
+        cache: 'no-store',
+        headers: kopya ? {'If-None-Match': kopya.etag} : {}
+    });
+    if (yanit.status === 304 || !yanit.ok) {
+        return false;
+    }
+    await listeKaydet(adres, {etag: yanit.headers.get('ETag'), kayitlar: await yanit.json()});
+    return true;
+}
+
+async function listeleriYenile() {
+    for (const adres of LISTELER) {
+        try {
+            if (await listeGetir(adres) && await listeyiYenile(adres)) {
+                sayfalaraBildir({tur: 'veri-guncellendi', adres});
+            }
+        } catch (error) {
+            return;
+        }
+    }
+}
+
+async function listeIstegi(olay, adres) {
+    const kayitlar = await yerelListe(adres);
+    if (!kayitlar) {
+        // İlk açılış: liste ağdan alınır ve saklanır
+        const yanit = await fetch(olay.request);
+        if (yanit.ok && yanit.headers.get('ETag')) {
+            await listeKaydet(adres, {etag: yanit.headers.get('ETag'), kayitlar: await yanit.clone().json()});
+        }
+        return yanit;
+    }
+    olay.waitUntil(listeyiYenile(adres)
+        .then(degisti => {
+            if (degisti) {
+                sayfalaraBildir({tur: 'veri-guncellendi', adres});
+            }
+            return kuyruguSay().then(sayi => sayi && kuyruguGonder());
+        })
+        .catch(() => {}));
+    return jsonYanit(kayitlar, {'X-Yerel-Kopya': '1'});
+}
+
+// Arama ağdan yapılır; ağ yoksa /list kopyasında aranır
+async function aramaIstegi(olay, sorgu) {
+    try {
+        return await fetch(olay.request);
+    } catch (error) {
+        const kayitlar = await yerelListe('/list') || await yerelListe('/api/production-data');
+        if (!kayitlar) {
+            throw error;
+        }
+        const aranan = sorgu.toLocaleLowerCase('tr');
+        const bulunanlar = kayitlar
+            .filter(kayit => ARAMA_ALANLARI.some(alan => String(kayit[alan] || '').toLocaleLowerCase('tr').includes(aranan)))
+            .map(kayit => Object.fromEntries(LISTE_ALANLARI['/list'].map(alan => [alan, kayit[alan] || ''])));
+        return jsonYanit(bulunanlar, {'X-Yerel-Kopya': '1'});
+    }
+}
+
+// Kayıt ağdan alınır ve önbelleğe yazılır; ağ yoksa tam listenin kopyasından
+// veya önbellekten verilir. Kuyruktaki değişiklikler üzerine uygulanır.
+async function kayitIstegi(olay, id) {
+    const onbellek = await caches.open(ONBELLEK);
+    if (id > 0) {
+        try {
+            const yanit = await fetch(olay.request);
+            if (yanit.ok) {
+                await onbellek.put(olay.request, yanit.clone());
+            }
+            return yanit;
+        } catch (error) {
+            // Ağ yok; yerel kopyaya bakılır
+        }
+    }
+    const kopya = await listeGetir('/api/production-data');
+    let kayitlar = kopya ? kopya.kayitlar : [];
+    if (!kayitlar.some(kayit => kayit.id === id)) {
+        const yanit = await onbellek.match(olay.request);
+        kayitlar = yanit ? [Object.assign(await yanit.json(), {id})] : [];
+    }
+    const kayit = kuyruguUygula('/api/production-data', kayitlar, await kuyrukGetir()).find(k => k.id === id);
+    if (!kayit) {
+        return jsonYanit({error: 'Kayıt çevrimdışı kopyada bulunamadı'}, {}, 404);
+    }
+    return jsonYanit(kayit, {'X-Yerel-Kopya': '1'});
+}
+
+// YAZMA KUYRUĞU
+async function kuyrukIslemleri(istek) {
+    const yol = new URL(istek.url).pathname;
+    const yeniAnahtar = () => self.crypto.randomUUID();
+    const silinen = /^\/(?:api\/production-delete|delete)\/(-?\d+)$/.exec(yol);
+    if (istek.method === 'DELETE' && silinen) {
+        return [{anahtar: yeniAnahtar(), tur: 'sil', id: Number(silinen[1])}];
+    }
+    if (istek.method !== 'POST') {
+        return null;
+    }
+    let govde;
+    try {
+        govde = await istek.clone().json();
+    } catch (error) {
+        return null;
+    }
+    if (yol === '/api/production-update-cell') {
+        return [{anahtar: yeniAnahtar(), tur: 'hucre', id: Number(govde.id), alan: govde.field, deger: govde.value,
+                 eski: await eskiDegerler(Number(govde.id), [govde.field])}];
+    }
+    if (yol === '/api/production-update') {
+        return [{anahtar: yeniAnahtar(), tur: 'guncelle', id: Number(govde.id), alanlar: govde,
+                 eski: await eskiDegerler(Number(govde.id), Object.keys(govde))}];
+    }
+    if (yol === '/api/production-add' || yol === '/save') {
+        // Geçici id negatiftir; gerçek id senkronizasyonda sunucudan gelir
+        return [{anahtar: yeniAnahtar(), tur: yol === '/save' ? 'kaydet' : 'ekle',
+                 gecici_id: -(Date.now() * 1000 + Math.floor(Math.random() * 1000)), alanlar: govde}];
+    }
+    if (yol === '/api/production-delete-batch') {
+        return (govde.ids || []).map(id => ({anahtar: yeniAnahtar(), tur: 'sil', id: Number(id)}));
+    }
+    return null;
+}
+
+async function yazmaIstegi(olay) {
+    const islemler = await kuyrukIslemleri(olay.request);
+    if (!islemler) {
+        return fetch(olay.request);
+    }
+    // Geçici (negatif) id'li kayıt henüz sunucuda yoktur; işlem sırasını bekler
+    if (!await kuyruguSay() && !islemler.some(islem => islem.id < 0)) {
+        try {
+            const yanit = await fetch(olay.request.clone());
+            olay.waitUntil(listeleriYenile());
+            return yanit;
+        } catch (error) {
+            // Ağ yok; işlem kuyruğa alınır
+        }
+    }
+    await kuyrugaEkle(islemler);
+    if (self.registration.sync) {
+        self.registration.sync.register('kutu-senkron').catch(() => {});
+    }
+    olay.waitUntil(kuyruguGonder());
+    return jsonYanit({
+        success: true,
+        kuyrukta: true,
+        message: 'Bağlantı yok: değişiklik kaydedildi, bağlantı gelince sunucuya gönderilecek.'
+    });
+}
+
+let gonderim = null;
+
+function kuyruguGonder() {
+    if (!gonderim) {
+        gonderim = partileriGonder().finally(() => { gonderim = null; });
+    }
+    return gonderim;
+}
+
+async function partileriGonder() {
+    let gonderildi = false;
+    for (;;) {
+        const parti = (await kuyrukGetir()).slice(0, PARTI_BOYUTU);
+        if (!parti.length) {
+            break;
+        }
+        let veri;
+        try {
+            const yanit = await fetch('/api/production-sync', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({islemler: parti.map(k => k.islem)})
+            });
+            if (!yanit.ok) {
+                return;
+            }
+            veri = await yanit.json();
+        } catch (error) {
+            // Hâlâ çevrimdışı; kuyruk sonraki denemede gönderilir
+            return;
+        }
+        const eslesmeler = new Map();
+        veri.sonuclar.forEach(sonuc => {
+            if (sonuc.gecici_id && sonuc.id) {
+                eslesmeler.set(sonuc.gecici_id, sonuc.id);
+            }
+        });
+        // Sunucuda hata veren işlemler kaydedilmez; kuyrukta kalır ve sonraki denemede yeniden gönderilir
+        const bekleyenler = new Set(veri.sonuclar.filter(sonuc => sonuc.durum === 'hata').map(sonuc => sonuc.anahtar));
+        const bitenler = parti.filter(k => !bekleyenler.has(k.islem.anahtar));
+        await kuyruguGuncelle(bitenler.map(k => k.sira), eslesmeler);
+        gonderildi = gonderildi || bitenler.length > 0;
+
+        const sorunlar = veri.sonuclar.filter(sonuc => sonuc.durum !== 'tamam' && sonuc.durum !== 'hata');
+        if (sorunlar.length) {
+            sayfalaraBildir({tur: 'senkron-sorunlari', sonuclar: sorunlar});
+        }
+        if (bekleyenler.size) {
+            // Aynı parti hemen yeniden gönderilmez; sonraki tetiklemede (online, sync, yeni yazma) denenir
+            break;
+        }
+    }
+    if (gonderildi) {
+        await listeleriYenile();
+        sayfalaraBildir({tur: 'senkronize-edildi'});
+    }
+}
+
+async function sayfalaraBildir(mesaj) {
+    const sayfalar = await self.clients.matchAll({type: 'window'});
+    sayfalar.forEach(sayfa => sayfa.postMessage(mesaj));
+}
+
+// SAYFA VE STATİK DOSYA ÖNBELLEĞİ
+// Sayfaların ve kullandıkları statik dosyaların (CSS içindeki yazı tipleri
+// dahil) son sürümü önbelleğe alınır; artık kullanılmayan özetli dosyalar silinir.
+async function onbellegiHazirla() {
+    const onbellek = await caches.open(ONBELLEK);
+    const kullanilanlar = new Set();
+    for (const sayfa of SAYFALAR) {
+        const yanit = await fetch(sayfa);
+        if (!yanit.ok) {
+            continue;
+        }
+        await onbellek.put(sayfa, yanit.clone());
+        const html = await yanit.text();
+        for (const [adres] of html.matchAll(/\/static\/[^"'\s)]+/g)) {
+            kullanilanlar.add(new URL(adres, self.location.origin).href);
+        }
+    }
+    for (const adres of [...kullanilanlar]) {
+        let yanit = await onbellek.match(adres);
+        if (!yanit) {
+            yanit = await fetch(adres);
+            if (!yanit.ok) {
+                continue;
+            }
+            await onbellek.put(adres, yanit.clone());
+        }
+        if (adres.endsWith('.css')) {
+            const css = await yanit.text();
+            for (const [, goreli] of css.matchAll(/url\(["']?([^"')?#]+)/g)) {
+                if (!goreli.startsWith('data:')) {
+                    const tam = new URL(goreli, adres).href;
+                    kullanilanlar.add(tam);
+                    if (!await onbellek.match(tam)) {
+                        await onbellek.add(tam);
+                    }
+                }
+            }
+        }
+    }
+    for (const istek of await onbellek.keys()) {
+        if (new URL(istek.url).pathname.startsWith('/static/') && !kullanilanlar.has(istek.url.split(/[?#]/)[0])) {
+            await onbellek.delete(istek);
+        }
+    }
+}
+
+async function sayfaIstegi(istek, yol) {
+    const onbellek = await caches.open(ONBELLEK);
+    try {
+        const yanit = await fetch(istek);
+        if (yanit.ok) {
+            await onbellek.put(yol, yanit.clone());
+        }
+        return yanit;
+    } catch (error) {
+        const kopya = await onbellek.match(yol);
+        if (kopya) {
+            return kopya;
+        }
+        throw error;
+    }
+}
+
+async function statikIstek(istek) {
+    const onbellek = await caches.open(ONBELLEK);
+    const kopya = await onbellek.match(istek, {ignoreSearch: true});
+    if (kopya) {
+        return kopya;
+    }
+    const yanit = await fetch(istek);
+    if (yanit.ok) {
+        await onbellek.put(istek, yanit.clone());
+    }
+    return yanit;
+}
+
+// OLAYLAR
+self.addEventListener('install', olay => {
+    olay.waitUntil(onbellegiHazirla().catch(error => console.warn('Önbellek hazırlanamadı:', error))
+        .then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', olay => {
+    olay.waitUntil(caches.keys()
+        .then(adlar => Promise.all(adlar.filter(ad => ad !== ONBELLEK).map(ad => caches.delete(ad))))
+        .then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', olay => {
+    const istek = olay.request;
+    const adres = new URL(istek.url);
+    if (adres.origin !== self.location.origin) {
+        return;
+    }
+    const kayit = /^\/record\/(-?\d+)$/.exec(adres.pathname);
+    if (istek.method === 'GET') {
+        if (LISTELER.includes(adres.pathname) && !adres.search) {
+            olay.respondWith(listeIstegi(olay, adres.pathname));
+        } else if (adres.pathname === '/search') {
+            olay.respondWith(aramaIstegi(olay, adres.searchParams.get('q') || ''));
+        } else if (kayit) {
+            olay.respondWith(kayitIstegi(olay, Number(kayit[1])));
+        } else if (istek.mode === 'navigate' && SAYFALAR.includes(adres.pathname)) {
+            olay.respondWith(sayfaIstegi(istek, adres.pathname));
+        } else if (adres.pathname.startsWith('/static/')) {
+            olay.respondWith(statikIstek(istek));
+        }
+    } else if ((adres.pathname.startsWith('/api/production-') && adres.pathname !== '/api/production-sync') ||
+               adres.pathname === '/save' || adres.pathname.startsWith('/delete/')) {
+        olay.respondWith(yazmaIstegi(olay));
+    }
+});
+
+self.addEventListener('sync', olay => {
+    if (olay.tag === 'kutu-senkron') {
+        olay.waitUntil(kuyruguGonder());
+    }
+});
+
+self.addEventListener('message', olay => {
+    if (olay.data && olay.data.tur === 'senkronize') {
+        olay.waitUntil(kuyruguGonder()
+            .then(() => onbellegiHazirla())
+            .catch(() => {}));
+    }
+});
@@ -0,0 +1,684 @@
+let kayitListModal = new bootstrap.Modal(document.getElementById('kayitListModal'));
+let planListModal = new bootstrap.Modal(document.getElementById('planListModal'));
+let planSayfasi = 1;
+let selectedRecords = new Set();
+let tableData = [];
+
+// Sayfa yüklendiğinde tabloyu hazırla
+document.addEventListener('DOMContentLoaded', function() {
+    updateCounters();
+});
+
+// KAYITLARDAN SEÇ: sunucuda sayfalı arama, kaydırdıkça sonraki sayfa
+const KAYIT_SAYFA_BOYUTU = 50;
+let kayitAramasi = null;   // {parametreler, sonraki, yukleniyor}
+
+function kayitAramaParametreleri() {
+    const parametreler = new URLSearchParams({adet: KAYIT_SAYFA_BOYUTU});
+    const alanlar = {
+        q: 'modalSearchInput',
+        durum: 'modalDurumFiltre',
+        baslangic: 'modalBaslangicTarihi',
+        bitis: 'modalBitisTarihi'
+    };
+    for (const [ad, elemanId] of Object.entries(alanlar)) {
+        const deger = document.getElementById(elemanId).value.trim();
+        if (deger) parametreler.set(ad, deger);
+    }
+    return parametreler;
+}
+
+function kayitSayfasiYukle() {
+    const arama = kayitAramasi;
+    if (!arama || arama.yukleniyor || arama.sonraki === null) return Promise.resolve();
+
+    arama.yukleniyor = true;
+    const parametreler = new URLSearchParams(arama.parametreler);
+    if (arama.sonraki) parametreler.set('sonraki', arama.sonraki);
+    document.getElementById('kayitListDurumu').textContent = 'Yükleniyor...';
+
+    return fetch('/api/production-data/search?' + parametreler)
+        .then(response => response.json())
+        .then(data => {
+            if (arama !== kayitAramasi) return;  // Bu arada yeni arama başlatıldı
+            if (data.error) throw new Error(data.error);
+            renderKayitListesi(data.kayitlar, arama.sonraki !== undefined);
+            arama.sonraki = data.sonraki;
+            arama.yuklenen += data.kayitlar.length;
+            document.getElementById('kayitListDurumu').textContent =
+                arama.yuklenen + ' kayıt' + (data.sonraki ? ' (devamı için kaydırın)' : '');
+            // Liste kaydırma alanını doldurmadıysa kaydırma olayı gelmez; sonraki sayfa hemen istenir
+            const kaydirma = document.getElementById('kayitListKaydirma');
+            if (data.sonraki && kaydirma.clientHeight > 0 && kaydirma.scrollHeight <= kaydirma.clientHeight) {
+                setTimeout(kayitSayfasiYukle, 0);
+            }
+        })
+        .catch(error => {
+            console.error('Hata:', error);
+            document.getElementById('kayitListDurumu').textContent = '';
+            alert('Kayıtlar yüklenirken hata oluştu.');
+        })
+        .finally(() => {
+            arama.yukleniyor = false;
+        });
+}
+
+function kayitAramasiBaslat() {
+    kayitAramasi = {parametreler: kayitAramaParametreleri(), sonraki: undefined, yuklenen: 0, yukleniyor: false};
+    document.getElementById('kayitListKaydirma').scrollTop = 0;
+    return kayitSayfasiYukle();
+}
+
+function showKayitListesi() {
+    kayitAramasiBaslat();
+    kayitListModal.show();
+}
+
+document.getElementById('kayitListKaydirma').addEventListener('scroll', function() {
+    if (this.scrollTop + this.clientHeight >= this.scrollHeight - 100) {
+        kayitSayfasiYukle();
+    }
+});
+
+document.getElementById('modalSearchInput').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        e.preventDefault();
+        searchInModal();
+    }
+});
+
+function renderKayitListesi(records, ekle) {
+    const tbody = document.getElementById('kayitListTableBody');
+    if (!ekle) {
+        tbody.innerHTML = '';
+        if (records.length === 0) {
+            tbody.innerHTML = '<tr><td colspan="8" class="text-center">Kayıt bulunamadı.</td></tr>';
+            return;
+        }
+    }
+
+    const satirlar = records.map(record => {
+        const isSelected = selectedRecords.has(record.id);
+        const notlarKisa = record.notlar ? (record.notlar.length > 50 ? record.notlar.substring(0, 50) + '...' : record.notlar) : '';
+
+        return `
+            <tr>
+                <td>
+                    <input type="checkbox" class="record-checkbox" value="${record.id}" ${isSelected ? 'checked' : ''} 
+                           onchange="toggleRecordSelection(${record.id})">
+                </td>
+                <td>${record.musteri_adi || ''}</td>
+                <td>${record.urun_adi || ''}</td>
+                <td>${record.tabaka_adedi || ''}</td>
+                <td>${record.renk_sayisi || ''} ${record.renk_bilgisi ? '(' + record.renk_bilgisi + ')' : ''}</td>
+                <td>${record.siparis_durumu || ''}</td>
+                <td>${record.tarih || ''}</td>
+                <td title="${record.notlar || ''}">${notlarKisa}</td>
+            </tr>
+        `;
+    });
+    tbody.insertAdjacentHTML('beforeend', satirlar.join(''));
+}
+
+function toggleRecordSelection(id) {
+    if (selectedRecords.has(id)) {
+        selectedRecords.delete(id);
+    } else {
+        selectedRecords.add(id);
+    }
+}
+
+function selectAllInModal() {
+    const checkboxes = document.querySelectorAll('.record-checkbox');
+    checkboxes.forEach(checkbox => {
+        checkbox.checked = true;
+        selectedRecords.add(parseInt(checkbox.value));
+    });
+}
+
+function deselectAllInModal() {
+    const checkboxes = document.querySelectorAll('.record-checkbox');
+    checkboxes.forEach(checkbox => {
+        checkbox.checked = false;
+    });
+    selectedRecords.clear();
+}
+
+function searchInModal() {
+    kayitAramasiBaslat();
+}
+
+function addSelectedToTable() {
+    if (selectedRecords.size === 0) {
+        alert('Lütfen eklemek için kayıt seçiniz.');
+        return;
+    }
+
+    // Seçilen kayıtları getir
+    const ids = Array.from(selectedRecords);
+
+    fetch('/api/get-selected-records', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({ ids: ids })
+    })
+    .then(response => response.json())
+    .then(records => {
+        // Kayıtları tabloya ekle
+        records.forEach(record => {
+            addRowToTable(record);
+        });
+
+        // Modal'ı kapat ve seçimleri temizle
+        kayitListModal.hide();
+        selectedRecords.clear();
+
+        // Counters'ı güncelle
+        updateCounters();
+
+        alert(`${records.length} kayıt tabloya eklendi.`);
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Kayıtlar eklenirken hata oluştu.');
+    });
+}
+
+// SANAL TABLO
+// Veri tableData dizisinde durur; DOM'da sadece görünen satırlar ve üstte/altta
+// birkaç tampon satır bulunur, kalan yükseklik boşluk satırlarıyla tutulur.
+// Arama her satırın önceden küçük harfe çevrilmiş metni (_arama) üzerinde
+// yapılır, sayaçlar satır eklenip silindikçe ve hücre değiştikçe güncellenir.
+const SANAL_TAMPON = 10;
+const TABLO_ALANLARI = ['musteri_adi', 'urun_adi', 'tabaka_adedi', 'renk', 'notlar'];
+let satirYuksekligi = 0;          // İlk çizilen satırdan ölçülür
+let gorunenSatirlar = null;       // Filtre varsa eşleşen tableData indeksleri, yoksa null
+let aktifArama = '';
+let toplamTabaka = 0;
+let ciziliSatirlar = new Map();   // rowData -> <tr>
+let cizimBekliyor = false;
+let yazdirmaModu = false;
+const ustBosluk = boslukSatiri();
+const altBosluk = boslukSatiri();
+
+function boslukSatiri() {
+    const row = document.createElement('tr');
+    row.className = 'sanal-bosluk';
+    row.innerHTML = '<td colspan="7"></td>';
+    return row;
+}
+
+function tabakaDegeri(deger) {
+    return parseInt(deger) || 0;
+}
+
+// Hücrede gösterilen metin; kayıttan gelen renk bilgisi değiştirilmediği sürece parantez içinde gösterilir
+function hucreMetni(rowData, alan) {
+    if (alan === 'renk' && rowData._renkEtiketi && rowData._orijinal && rowData.renk === rowData._orijinal.renk) {
+        return (rowData.renk + ' ' + rowData._renkEtiketi).trim();
+    }
+    return rowData[alan];
+}
+
+function aramaMetniGuncelle(rowData) {
+    rowData._arama = TABLO_ALANLARI.map(alan => hucreMetni(rowData, alan)).join('\n').toLowerCase();
+}
+
+function satiriTabloyaEkle(rowData) {
+    aramaMetniGuncelle(rowData);
+    tableData.push(rowData);
+    toplamTabaka += tabakaDegeri(rowData.tabaka_adedi);
+    if (gorunenSatirlar && rowData._arama.includes(aktifArama)) {
+        gorunenSatirlar.push(tableData.length - 1);
+    }
+    gridiCizimIste();
+}
+
+function tabloyuSifirla() {
+    tableData = [];
+    toplamTabaka = 0;
+    gorunenSatirlar = aktifArama ? [] : null;
+    ciziliSatirlar.clear();
+    gridiCizimIste();
+}
+
+function gridiCizimIste() {
+    if (!cizimBekliyor) {
+        cizimBekliyor = true;
+        requestAnimationFrame(gridiCiz);
+    }
+}
+
+function satirElemaniOlustur(rowData) {
+    const row = document.createElement('tr');
+    row.innerHTML = `
+        <td></td>
+        <td class="editable-cell" contenteditable="true" data-alan="musteri_adi" onblur="updateCellData(this)"></td>
+        <td class="editable-cell" contenteditable="true" data-alan="urun_adi" onblur="updateCellData(this)"></td>
+        <td class="editable-cell" contenteditable="true" data-alan="tabaka_adedi" onblur="updateCellData(this)"></td>
+        <td class="editable-cell" contenteditable="true" data-alan="renk" onblur="updateCellData(this)"></td>
+        <td class="editable-cell" contenteditable="true" data-alan="notlar" onblur="updateCellData(this)"></td>
+        <td class="action-buttons">
+            <button class="btn btn-sm btn-danger" onclick="deleteRow(this)">
+                <i class="fas fa-trash"></i>
+            </button>
+        </td>
+    `;
+    row._veri = rowData;
+    TABLO_ALANLARI.forEach((alan, i) => {
+        row.cells[i + 1].textContent = hucreMetni(rowData, alan);
+    });
+    return row;
+}
+
+function bilgiSatiri(id, mesaj) {
+    return `
+        <tr id="${id}">
+            <td colspan="7" class="text-center text-muted">
+                <i class="fas fa-inbox fa-2x mb-2"></i><br>
+                ${mesaj}
+            </td>
+        </tr>
+    `;
+}
+
+function gridiCiz() {
+    cizimBekliyor = false;
+    const tbody = document.getElementById('productionTableBody');
+    const kaydirma = document.getElementById('productionTableKaydirma');
+    const adet = gorunenSatirlar ? gorunenSatirlar.length : tableData.length;
+
+    if (adet === 0) {
+        ciziliSatirlar.clear();
+        tbody.innerHTML = tableData.length === 0
+            ? bilgiSatiri('emptyRow', 'Tablo boş. Kayıtlardan seçmek için "Kayıtlardan Seç" butonuna tıklayın.')
+            : bilgiSatiri('noMatchRow', 'Aranan kriterlere uygun kayıt bulunamadı.');
+        return;
+    }
+    if (ustBosluk.parentNode !== tbody) {
+        tbody.replaceChildren(ustBosluk, altBosluk);
+    }
+
+    let ilk = 0;
+    let son = adet;
+    if (!yazdirmaModu) {
+        const yukseklik = satirYuksekligi || 40;
+        ilk = Math.max(0, Math.floor(kaydirma.scrollTop / yukseklik) - SANAL_TAMPON);
+        son = Math.min(adet, ilk + Math.ceil(kaydirma.clientHeight / yukseklik) + 2 * SANAL_TAMPON);
+    }
+
+    // Pencerede kalan satırların elemanları yeniden kullanılır (düzenlenen hücre odağını kaybetmez)
+    const yeniSatirlar = new Map();
+    for (let i = ilk; i < son; i++) {
+        const indeks = gorunenSatirlar ? gorunenSatirlar[i] : i;
+        const rowData = tableData[indeks];
+        const row = ciziliSatirlar.get(rowData) || satirElemaniOlustur(rowData);
+        row.cells[0].textContent = indeks + 1;
+        yeniSatirlar.set(rowData, row);
+    }
+    ciziliSatirlar.forEach((row, rowData) => {
+        if (!yeniSatirlar.has(rowData)) {
+            if (row.contains(document.activeElement)) {
+                updateCellData(document.activeElement);
+            }
+            row.remove();
+        }
+    });
+    let onceki = ustBosluk;
+    yeniSatirlar.forEach(row => {
+        if (onceki.nextSibling !== row) {
+            onceki.after(row);
+        }
+        onceki = row;
+    });
+    ciziliSatirlar = yeniSatirlar;
+
+    if (!satirYuksekligi) {
+        const olculen = onceki.getBoundingClientRect().height;
+        if (olculen > 0) {
+            satirYuksekligi = olculen;
+            gridiCizimIste();
+        }
+    }
+    const yukseklik = satirYuksekligi || 40;
+    ustBosluk.style.height = (ilk * yukseklik) + 'px';
+    altBosluk.style.height = ((adet - son) * yukseklik) + 'px';
+}
+
+document.getElementById('productionTableKaydirma').addEventListener('scroll', gridiCizimIste);
+window.addEventListener('resize', gridiCizimIste);
+window.addEventListener('beforeprint', () => {
+    yazdirmaModu = true;
+    gridiCiz();
+});
+window.addEventListener('afterprint', () => {
+    yazdirmaModu = false;
+    gridiCiz();
+});
+
+function addRowToTable(record, degisen) {
+    const rowData = {
+        id: record.id,
+        musteri_adi: record.musteri_adi || '',
+        urun_adi: record.urun_adi || '',
+        tabaka_adedi: record.tabaka_adedi || '',
+        renk: record.renk_sayisi || '',
+        notlar: record.notlar || ''
+    };
+    // Kayıttan gelen değerler saklanır; plan kaydedilirken sadece değişen hücreler gönderilir
+    rowData._orijinal = Object.assign({}, rowData);
+    rowData._degisen = degisen || [];
+    rowData._renkEtiketi = record.renk_bilgisi ? '(' + record.renk_bilgisi + ')' : '';
+    satiriTabloyaEkle(rowData);
+}
+
+function addEmptyRow() {
+    satiriTabloyaEkle({
+        musteri_adi: '',
+        urun_adi: '',
+        tabaka_adedi: '',
+        renk: '',
+        notlar: ''
+    });
+    updateCounters();
+
+    // Yeni satır tablonun sonunda; görünür hale getir
+    const kaydirma = document.getElementById('productionTableKaydirma');
+    requestAnimationFrame(() => {
+        kaydirma.scrollTop = kaydirma.scrollHeight;
+    });
+}
+
+function updateCellData(cell) {
+    const rowData = cell.parentNode && cell.parentNode._veri;
+    const alan = cell.dataset.alan;
+    if (!rowData || !alan) return;
+
+    const value = cell.textContent.trim();
+    if (value === hucreMetni(rowData, alan)) return;
+
+    if (alan === 'tabaka_adedi') {
+        toplamTabaka += tabakaDegeri(value) - tabakaDegeri(rowData.tabaka_adedi);
+    }
+    rowData[alan] = value;
+    aramaMetniGuncelle(rowData);
+    updateCounters();
+}
+
+function deleteRow(button) {
+    const rowData = button.closest('tr')._veri;
+    const rowIndex = tableData.indexOf(rowData);
+
+    if (rowIndex >= 0 && confirm('Bu satırı silmek istediğinizden emin misiniz?')) {
+        tableData.splice(rowIndex, 1);
+        toplamTabaka -= tabakaDegeri(rowData.tabaka_adedi);
+        if (gorunenSatirlar) {
+            gorunenSatirlar = gorunenSatirlar
+                .filter(indeks => indeks !== rowIndex)
+                .map(indeks => indeks > rowIndex ? indeks - 1 : indeks);
+        }
+        updateCounters();
+    }
+}
+
+function updateCounters() {
+    document.getElementById('totalRows').textContent = tableData.length;
+    document.getElementById('totalTabaka').textContent = toplamTabaka;
+    gridiCizimIste();
+}
+
+function filtrele(query) {
+    if (!query) {
+        gorunenSatirlar = null;
+    } else if (gorunenSatirlar && aktifArama && query.includes(aktifArama)) {
+        // Önceki aramayı daraltan sorguda sadece önceki eşleşmeler taranır
+        gorunenSatirlar = gorunenSatirlar.filter(indeks => tableData[indeks]._arama.includes(query));
+    } else {
+        gorunenSatirlar = [];
+        tableData.forEach((rowData, indeks) => {
+            if (rowData._arama.includes(query)) {
+                gorunenSatirlar.push(indeks);
+            }
+        });
+    }
+    aktifArama = query;
+    document.getElementById('productionTableKaydirma').scrollTop = 0;
+    gridiCizimIste();
+}
+
+function searchRecords() {
+    const query = document.getElementById('searchInput').value.toLowerCase().trim();
+    filtrele(query);
+
+    if (query && gorunenSatirlar.length === 0) {
+        alert('Aranan kriterlere uygun kayıt bulunamadı.');
+    }
+}
+
+// Yazdıkça filtrele (uyarı sadece Ara butonunda)
+document.getElementById('searchInput').addEventListener('input', function() {
+    filtrele(this.value.toLowerCase().trim());
+});
+
+// Plan satırı: kayıttan gelen satırlar için id ve sadece kayıttan farklı hücreler,
+// boş satırlar için dolu hücreler
+const PLAN_HUCRELERI = ['musteri_adi', 'urun_adi', 'tabaka_adedi', 'renk', 'notlar'];
+
+function planSatiri(row) {
+    const satir = {};
+    if (row.id) {
+        satir.id = row.id;
+    }
+    PLAN_HUCRELERI.forEach(alan => {
+        const degisti = row.id
+            ? (row[alan] !== row._orijinal[alan] || row._degisen.includes(alan))
+            : row[alan] !== '';
+        if (degisti) {
+            satir[alan] = row[alan];
+        }
+    });
+    return satir;
+}
+
+function saveProductionPlan() {
+    if (tableData.length === 0) {
+        alert('Kaydedilecek veri bulunamadı.');
+        return;
+    }
+
+    const planAdi = prompt('Plan için bir ad girin:', `Üretim_Plan_${new Date().toLocaleDateString('tr-TR')}`);
+
+    if (!planAdi) return;
+
+    const planData = {
+        plan_adi: planAdi,
+        satirlar: tableData.map(planSatiri)
+    };
+
+    fetch('/api/save-production-plan', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(planData)
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            alert('Plan başarıyla kaydedildi!');
+        } else {
+            alert('Plan kaydedilirken hata oluştu: ' + result.message);
+        }
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Plan kaydedilirken hata oluştu.');
+    });
+}
+
+// Kayıtlı planları sayfa sayfa listele
+function showPlanListesi() {
+    planListModal.show();
+    loadPlanPage(1);
+}
+
+function loadPlanPage(sayfa) {
+    const q = document.getElementById('planSearchInput').value.trim();
+    const params = new URLSearchParams({ sayfa: sayfa, q: q });
+
+    fetch('/api/production-plans?' + params.toString())
+        .then(response => response.json())
+        .then(result => {
+            if (result.error) {
+                throw new Error(result.error);
+            }
+            planSayfasi = result.sayfa;
+
+            const tbody = document.getElementById('planListTableBody');
+            tbody.innerHTML = '';
+
+            if (result.planlar.length === 0) {
+                tbody.innerHTML = '<tr><td colspan="4" class="text-center text-muted">Kayıtlı plan bulunamadı.</td></tr>';
+            }
+
+            result.planlar.forEach(plan => {
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td></td>
+                    <td>${plan.tarih}</td>
+                    <td>${plan.satir_sayisi}</td>
+                    <td><button class="btn btn-sm btn-primary" onclick="loadPlan(${plan.id})">Aç</button></td>
+                `;
+                row.cells[0].textContent = plan.plan_adi;
+                tbody.appendChild(row);
+            });
+
+            document.getElementById('planPageInfo').textContent = `Sayfa ${result.sayfa} / ${Math.max(result.sayfa_sayisi, 1)} (${result.toplam} plan)`;
+            document.getElementById('planPrevBtn').disabled = result.sayfa <= 1;
+            document.getElementById('planNextBtn').disabled = result.sayfa >= result.sayfa_sayisi;
+        })
+        .catch(error => {
+            console.error('Hata:', error);
+            alert('Planlar yüklenirken hata oluştu.');
+        });
+}
+
+// Seçilen planı tabloya yükle (mevcut tablo değiştirilir)
+function loadPlan(planId) {
+    if (tableData.length > 0 && !confirm('Tablodaki veriler plan ile değiştirilecek. Devam edilsin mi?')) {
+        return;
+    }
+
+    fetch(`/api/production-plans/${planId}`)
+        .then(response => response.json())
+        .then(plan => {
+            if (plan.error) {
+                throw new Error(plan.error);
+            }
+
+            tabloyuSifirla();
+
+            plan.veriler.forEach(satir => {
+                addRowToTable({
+                    id: satir.id,
+                    musteri_adi: satir.musteri_adi,
+                    urun_adi: satir.urun_adi,
+                    tabaka_adedi: satir.tabaka_adedi,
+                    renk_sayisi: satir.renk,
+                    notlar: satir.notlar
+                }, satir.degisen);
+            });
+
+            updateCounters();
+            planListModal.hide();
+        })
+        .catch(error => {
+            console.error('Hata:', error);
+            alert('Plan yüklenirken hata oluştu.');
+        });
+}
+
+function exportToExcel() {
+    if (tableData.length === 0) {
+        alert('Excel\'e aktarılacak veri bulunamadı.');
+        return;
+    }
+
+    // Basit bir CSV oluştur
+    let csvContent = "data:text/csv;charset=utf-8,";
+
+    // Başlıklar
+    csvContent += "Sıra,Müşteri Adı,Ürün Adı,Tabaka Adedi,Renk,Notlar\n";
+
+    // Veriler
+    tableData.forEach((row, index) => {
+        const rowData = [
+            index + 1,
+            `"${row.musteri_adi.replace(/"/g, '""')}"`,
+            `"${row.urun_adi.replace(/"/g, '""')}"`,
+            row.tabaka_adedi,
+            `"${row.renk.replace(/"/g, '""')}"`,
+            `"${row.notlar.replace(/"/g, '""')}"`
+        ];
+        csvContent += rowData.join(",") + "\n";
+    });
+
+    // Dosyayı indir
+    const encodedUri = encodeURI(csvContent);
+    const link = document.createElement("a");
+    link.setAttribute("href", encodedUri);
+    link.setAttribute("download", `Uretim_Plan_${new Date().toISOString().slice(0,10)}.csv`);
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+}
+
+function printTable() {
+    window.print();
+}
+
+// Tablodaki kayıtların üretim formlarını tek PDF olarak yazdır
+function printForms() {
+    const ids = tableData.filter(row => row.id).map(row => row.id);
+
+    if (ids.length === 0) {
+        alert('Yazdırılacak kayıt bulunamadı. Formlar sadece kayıtlardan eklenen satırlar için basılabilir.');
+        return;
+    }
+
+    fetch('/print/batch', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({ ids: ids })
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('PDF oluşturulamadı');
+        }
+        return response.blob();
+    })
+    .then(blob => {
+        const url = window.URL.createObjectURL(blob);
+        const printWindow = window.open(url, '_blank');
+        if (printWindow) {
+            printWindow.onload = function() {
+                printWindow.print();
+            };
+        } else {
+            alert('Popup engelleyici nedeniyle yazdırma penceresi açılamadı. Lütfen popup engelleyiciyi devre dışı bırakın.');
+        }
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Formlar yazdırılırken hata oluştu: ' + error.message);
+    });
+}
+
+function clearTable() {
+    if (tableData.length === 0) {
+        return;
+    }
+
+    if (confirm('Tüm tablo verilerini silmek istediğinizden emin misiniz?')) {
+        tabloyuSifirla();
+        updateCounters();
+    }
+}
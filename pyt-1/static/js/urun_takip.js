@@ -0,0 +1,568 @@
+let listModal = new bootstrap.Modal(document.getElementById('listModal'));
+let urunListModal = new bootstrap.Modal(document.getElementById('urunListModal'));
+
+// OTOMATİK TAMAMLAMA FONKSİYONU
+const ARAMA_BEKLEME_MS = 200;
+let aramaZamanlayici = null;
+let aramaDenetleyici = null;
+
+// Sunucu araması: yazma durana kadar beklenir, önceki istek iptal edilir
+function sunucudaAra(value) {
+    return new Promise(resolve => {
+        clearTimeout(aramaZamanlayici);
+        aramaZamanlayici = setTimeout(resolve, ARAMA_BEKLEME_MS);
+    }).then(() => {
+        if (aramaDenetleyici) aramaDenetleyici.abort();
+        aramaDenetleyici = new AbortController();
+        return fetch('/urun-ara?q=' + encodeURIComponent(value), {signal: aramaDenetleyici.signal});
+    }).then(response => response.json());
+}
+
+function initAutocomplete() {
+    const urunAdiInput = document.getElementById('urun_adi');
+    KatalogIndeksi.indeks();  // Ürün indeksini arka planda hazırla
+
+    urunAdiInput.addEventListener('input', function(e) {
+        const value = this.value;
+        if (value.length < 2) {
+            clearTimeout(aramaZamanlayici);
+            return;
+        }
+
+        // Öneriler tarayıcıdaki indeksten; indeks yoksa sunucudan
+        KatalogIndeksi.ara(value)
+            .then(urunler => urunler || sunucudaAra(value))
+            .then(urunler => {
+                if (urunAdiInput.value !== value) return;  // Bu arada yazılmaya devam edildi
+                showAutocompleteSuggestions(urunler, value);
+            })
+            .catch(error => {
+                if (error.name === 'AbortError') return;
+                console.error('Autocomplete hatası:', error);
+            });
+    });
+
+    // Input'tan focus kaybolduğunda önerileri temizle
+    urunAdiInput.addEventListener('blur', function() {
+        setTimeout(() => {
+            const container = document.getElementById('autocomplete-list');
+            if (container) {
+                container.innerHTML = '';
+            }
+        }, 200);
+    });
+}
+
+function showAutocompleteSuggestions(urunler, query) {
+    let container = document.getElementById('autocomplete-list');
+    if (!container) {
+        container = document.createElement('div');
+        container.id = 'autocomplete-list';
+        container.className = 'autocomplete-items';
+        document.getElementById('urun_adi').parentNode.appendChild(container);
+    }
+
+    container.innerHTML = '';
+
+    if (urunler.length === 0) {
+        const item = document.createElement('div');
+        item.innerHTML = 'Ürün bulunamadı';
+        container.appendChild(item);
+        return;
+    }
+
+    urunler.forEach(urun => {
+        const item = document.createElement('div');
+        // Arama terimini vurgula
+        const highlightedUrun = urun.replace(new RegExp(query, 'gi'), match => `<strong>${match}</strong>`);
+        item.innerHTML = highlightedUrun;
+        item.addEventListener('click', function() {
+            document.getElementById('urun_adi').value = urun;
+            container.innerHTML = '';
+            // Seçildiğinde otomatik olarak bilgileri getir
+            urunBilgisiGetir();
+        });
+        container.appendChild(item);
+    });
+}
+
+// ÜRÜN LİSTESİNİ GÖSTER
+function showUrunListesi() {
+    KatalogIndeksi.tumu()
+        .then(urunler => urunler || fetch('/urun-listesi').then(response => response.json()))
+        .then(urunler => {
+            showUrunListesiModal(urunler);
+        })
+        .catch(error => {
+            console.error('Ürün listesi yükleme hatası:', error);
+            alert('Ürün listesi yüklenirken hata oluştu.');
+        });
+}
+
+function showUrunListesiModal(urunler) {
+    const tbody = document.getElementById('urunListTableBody');
+    tbody.innerHTML = '';
+
+    if (urunler.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="2" class="text-center">Ürün bulunamadı.</td></tr>';
+        return;
+    }
+
+    urunler.forEach(urun => {
+        const row = `<tr>
+            <td>${urun}</td>
+            <td>
+                <button class="btn btn-sm btn-success" onclick="urunSec('${urun.replace(/'/g, "\\'")}')" data-bs-dismiss="modal">
+                    <i class="fas fa-check"></i> Seç
+                </button>
+            </td>
+        </tr>`;
+        tbody.innerHTML += row;
+    });
+
+    urunListModal.show();
+}
+
+function urunListesiniAra() {
+    const query = document.getElementById('urunAramaInput').value.toLowerCase();
+    const rows = document.getElementById('urunListTableBody').getElementsByTagName('tr');
+
+    for (let i = 0; i < rows.length; i++) {
+        const urunAdi = rows[i].getElementsByTagName('td')[0].textContent.toLowerCase();
+        if (urunAdi.includes(query)) {
+            rows[i].style.display = '';
+        } else {
+            rows[i].style.display = 'none';
+        }
+    }
+}
+
+function urunSec(urunAdi) {
+    document.getElementById('urun_adi').value = urunAdi;
+    // Seçildiğinde otomatik olarak bilgileri getir
+    urunBilgisiGetir();
+}
+
+// ÜRÜN BİLGİSİ GETİRME FONKSİYONU
+function urunBilgisiGetir() {
+    const urunAdi = document.getElementById('urun_adi').value.trim();
+
+    if (!urunAdi) {
+        alert('Lütfen ürün adı giriniz!');
+        return;
+    }
+
+    // Loading göster
+    document.getElementById('bicak_kodu').value = 'Aranıyor...';
+    document.getElementById('bicak_olcusu_1').value = 'Aranıyor...';
+    document.getElementById('bicak_olcusu_2').value = 'Aranıyor...';
+
+    fetch('/urun-bilgi?urun_adi=' + encodeURIComponent(urunAdi))
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('Ürün bulunamadı');
+        }
+        return response.json();
+    })
+    .then(data => {
+        if (data.success) {
+            document.getElementById('bicak_kodu').value = data.bicak_kodu;
+            document.getElementById('bicak_olcusu_1').value = data.en;
+            document.getElementById('bicak_olcusu_2').value = data.boy;
+
+            // Formdaki bıçak kodu alanını da güncelle
+            document.getElementsByName('bicak_kodu')[0].value = data.bicak_kodu;
+            document.getElementsByName('bicak_olcusu_1')[0].value = data.en;
+            document.getElementsByName('bicak_olcusu_2')[0].value = data.boy;
+
+            showAlert('Ürün bilgileri başarıyla getirildi!', 'success');
+        } else {
+            throw new Error(data.message || 'Ürün bulunamadı');
+        }
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        document.getElementById('bicak_kodu').value = 'Bulunamadı';
+        document.getElementById('bicak_olcusu_1').value = '';
+        document.getElementById('bicak_olcusu_2').value = '';
+
+        // Formdaki bıçak kodu alanını da güncelle
+        document.getElementsByName('bicak_kodu')[0].value = 'Bulunamadı';
+        document.getElementsByName('bicak_olcusu_1')[0].value = '';
+        document.getElementsByName('bicak_olcusu_2')[0].value = '';
+
+        showAlert(error.message, 'danger');
+    });
+}
+
+function showAlert(message, type) {
+    const alertDiv = document.createElement('div');
+    alertDiv.className = `alert alert-${type} alert-dismissible fade show mt-3`;
+    alertDiv.innerHTML = `
+        ${message}
+        <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+    `;
+
+    // Formun üstüne ekle
+    const form = document.getElementById('uretimForm');
+    form.parentNode.insertBefore(alertDiv, form);
+
+    // 5 saniye sonra otomatik kaldır
+    setTimeout(() => {
+        if (alertDiv.parentNode) {
+            alertDiv.parentNode.removeChild(alertDiv);
+        }
+    }, 5000);
+}
+
+function showListModal() {
+    loadAllRecords();
+    listModal.show();
+}
+
+function loadAllRecords() {
+    fetch('/list')
+    .then(response => response.json())
+    .then(data => {
+        showRecordsInModal(data);
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Kayıtlar yüklenirken hata oluştu.');
+    });
+}
+
+function searchRecordsInModal() {
+    const query = document.getElementById('modalSearchInput').value;
+    if (!query) {
+        loadAllRecords();
+        return;
+    }
+
+    fetch('/search?q=' + encodeURIComponent(query))
+    .then(response => response.json())
+    .then(data => {
+        showRecordsInModal(data);
+    });
+}
+
+function showRecordsInModal(records) {
+    const tbody = document.getElementById('modalRecordTableBody');
+    tbody.innerHTML = '';
+
+    if (records.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="7" class="text-center">Kayıt bulunamadı.</td></tr>';
+        return;
+    }
+
+    records.forEach(record => {
+        let statusClass = '';
+        switch(record.siparis_durumu) {
+            case 'RPT': statusClass = 'bg-warning text-dark'; break;
+            case 'YENİ': statusClass = 'bg-primary'; break;
+            default: statusClass = 'bg-secondary';
+        }
+
+        const row = `<tr>
+            <td><strong>${record.id}</strong></td>
+            <td>${record.musteri_adi}</td>
+            <td>${record.urun_adi}</td>
+            <td><span class="badge bg-info">${record.bicak_kodu || '-'}</span></td>
+            <td><span class="badge ${statusClass}">${record.siparis_durumu}</span></td>
+            <td>${record.tarih}</td>
+            <td>
+                <button class="btn btn-sm btn-primary" onclick="loadRecord(${record.id})" data-bs-dismiss="modal">
+                    <i class="fas fa-edit"></i> Yükle
+                </button>
+                <button class="btn btn-sm btn-danger" onclick="deleteRecord(${record.id})">
+                    <i class="fas fa-trash"></i> Sil
+                </button>
+            </td>
+        </tr>`;
+        tbody.innerHTML += row;
+    });
+}
+
+function loadRecord(id) {
+    fetch('/record/' + id)
+    .then(response => {
+        if (!response.ok) throw new Error('Kayıt alınamadı: ' + response.status);
+        return response.json();
+    })
+    .then(record => {
+        const form = document.getElementById('uretimForm');
+        Object.keys(record).forEach(key => {
+            if (form.elements[key]) {
+                form.elements[key].value = record[key] || '';
+            }
+        });
+        // Hesaplanan ağırlığı göster
+        document.getElementById('karton_agirligi_goster').value = record.karton_agirligi || 'Hesaplanacak';
+        document.getElementById('karton_agirligi').value = record.karton_agirligi || '';
+
+        // Otomatik bilgileri güncelle
+        document.getElementById('bicak_kodu').value = record.bicak_kodu || '';
+        document.getElementById('bicak_olcusu_1').value = record.bicak_olcusu_1 || '';
+        document.getElementById('bicak_olcusu_2').value = record.bicak_olcusu_2 || '';
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Kayıt yüklenirken hata oluştu.');
+    });
+}
+
+function deleteRecord(id) {
+    if (confirm('Bu kaydı silmek istediğinizden emin misiniz?')) {
+        fetch('/delete/' + id, {method: 'DELETE'})
+        .then(response => response.json())
+        .then(result => {
+            alert(result.message);
+            loadAllRecords();
+        })
+        .catch(error => {
+            console.error('Hata:', error);
+            alert('Silme işlemi sırasında hata oluştu.');
+        });
+    }
+}
+
+function hesaplaAgirlik() {
+    const en = parseFloat(document.getElementById('kagit_olcusu_1').value) || 0;
+    const boy = parseFloat(document.getElementById('kagit_olcusu_2').value) || 0;
+    const gramaj = parseFloat(document.getElementById('gramaj').value) || 0;
+    const tabaka_adedi = parseFloat(document.getElementById('tabaka_adedi').value) || 0;
+
+    if (en > 0 && boy > 0 && gramaj > 0 && tabaka_adedi > 0) {
+        // DOĞRU FORMÜL: (En × Boy × Gramaj × Tabaka Adedi) / 1.000.000
+        const agirlik_kg = (en * boy * gramaj * tabaka_adedi) / 1000000;
+        const formattedWeight = agirlik_kg.toLocaleString('tr-TR', {
+            minimumFractionDigits: 2,
+            maximumFractionDigits: 2
+        }) + ' kg';
+
+        document.getElementById('karton_agirligi_goster').value = formattedWeight;
+        document.getElementById('karton_agirligi').value = formattedWeight;
+    } else {
+        document.getElementById('karton_agirligi_goster').value = 'Hesaplanacak';
+        document.getElementById('karton_agirligi').value = '';
+    }
+}
+
+function saveRecord() {
+    const formData = new FormData(document.getElementById('uretimForm'));
+    const data = Object.fromEntries(formData.entries());
+
+    // Validasyon
+    if (!data.musteri_adi.trim()) {
+        alert('Müşteri adı zorunludur!');
+        return;
+    }
+
+    // Ağırlık hesaplamasını yap
+    hesaplaAgirlik();
+    data.karton_agirligi = document.getElementById('karton_agirligi').value;
+
+    fetch('/save', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => response.json())
+    .then(result => {
+        alert(result.message);
+        if (result.success) clearForm();
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Kayıt sırasında hata oluştu.');
+    });
+}
+
+function saveRecordAsNew() {
+    saveRecord();
+}
+
+function searchRecords() {
+    const query = document.getElementById('searchInput').value;
+    if (!query) {
+        alert('Lütfen arama metni giriniz.');
+        return;
+    }
+
+    fetch('/search?q=' + encodeURIComponent(query))
+    .then(response => response.json())
+    .then(data => {
+        showListModal();
+        showRecordsInModal(data);
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Arama sırasında hata oluştu.');
+    });
+}
+
+function exportToExcel() {
+    fetch('/api/export-jobs', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({tur: 'excel'})
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (!result.is_id) {
+            throw new Error(result.message || 'Dışa aktarma başlatılamadı');
+        }
+        exportDurumunuBekle(result);
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('Excel export sırasında hata oluştu: ' + error.message);
+    });
+}
+
+// Dışa aktarma işi bitene kadar durumu sorgula, bitince indir
+function exportDurumunuBekle(isBilgisi) {
+    if (isBilgisi.durum === 'tamamlandi') {
+        window.location.href = isBilgisi.indirme_url;
+        return;
+    }
+    if (isBilgisi.durum === 'hata') {
+        alert('Excel export sırasında hata oluştu: ' + (isBilgisi.message || ''));
+        return;
+    }
+    setTimeout(() => {
+        fetch(isBilgisi.durum_url)
+            .then(response => response.json())
+            .then(exportDurumunuBekle)
+            .catch(error => {
+                console.error('Hata:', error);
+                alert('Excel export durumu alınamadı.');
+            });
+    }, 1000);
+}
+
+function generatePDF() {
+    const formData = new FormData(document.getElementById('uretimForm'));
+    const data = Object.fromEntries(formData.entries());
+
+    // Ağırlık hesaplamasını yap ve PDF'e gönder
+    hesaplaAgirlik();
+    data.karton_agirligi = document.getElementById('karton_agirligi').value;
+
+    fetch('/export/pdf', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => response.blob())
+    .then(blob => {
+        const url = window.URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = 'KutuDunyasi_Form.pdf';
+        a.click();
+        window.URL.revokeObjectURL(url);
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('PDF oluşturulurken hata oluştu.');
+    });
+}
+
+function printForm() {
+    const formData = new FormData(document.getElementById('uretimForm'));
+    const data = Object.fromEntries(formData.entries());
+
+    // Ağırlık hesaplamasını yap ve PDF'e gönder
+    hesaplaAgirlik();
+    data.karton_agirligi = document.getElementById('karton_agirligi').value;
+
+    fetch('/print', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('PDF oluşturulamadı');
+        }
+        return response.blob();
+    })
+    .then(blob => {
+        const url = window.URL.createObjectURL(blob);
+        const printWindow = window.open(url, '_blank');
+        if (printWindow) {
+            printWindow.onload = function() {
+                printWindow.print();
+            };
+        } else {
+            alert('Popup engelleyici nedeniyle yazdırma penceresi açılamadı. Lütfen popup engelleyiciyi devre dışı bırakın.');
+        }
+    })
+    .catch(error => {
+        console.error('Hata:', error);
+        alert('PDF oluşturulurken hata oluştu: ' + error.message);
+    });
+}
+
+// Tarih istemcide hesaplanır; sayfa kabuğu güne bağlı kalmaz ve önbelleğe alınabilir
+function bugununTarihi() {
+    const bugun = new Date();
+    return String(bugun.getDate()).padStart(2, '0') + '.' +
+        String(bugun.getMonth() + 1).padStart(2, '0') + '.' + bugun.getFullYear();
+}
+
+function clearForm() {
+    document.getElementById('uretimForm').reset();
+    document.getElementById('uretimForm').elements['tarih'].value = bugununTarihi();
+    document.getElementById('uretimForm').elements['kagit_cinsi'].value = 'Krome';
+    document.getElementById('uretimForm').elements['selefon_1'].value = 'MAT';
+    document.getElementById('uretimForm').elements['selefon_2'].value = 'SEDEF';
+    document.getElementById('uretimForm').elements['varak_yaldiz'].value = 'YOK';
+    document.getElementById('uretimForm').elements['gofre'].value = 'YOK';
+    document.getElementById('uretimForm').elements['yapistirma'].value = 'YOK';
+    document.getElementById('uretimForm').elements['siparis_durumu'].value = 'RPT';
+    document.getElementById('karton_agirligi_goster').value = 'Hesaplanacak';
+    document.getElementById('karton_agirligi').value = '';
+
+    // Otomatik bilgileri temizle
+    document.getElementById('bicak_kodu').value = '';
+    document.getElementById('bicak_olcusu_1').value = '';
+    document.getElementById('bicak_olcusu_2').value = '';
+
+    // Autocomplete listesini temizle
+    const container = document.getElementById('autocomplete-list');
+    if (container) {
+        container.innerHTML = '';
+    }
+}
+
+// Enter tuşu ile ürün bilgisi getirme
+document.getElementById('urun_adi').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        e.preventDefault();
+        urunBilgisiGetir();
+    }
+});
+
+// Ürün arama input'unda enter tuşu
+document.getElementById('urunAramaInput').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        e.preventDefault();
+        urunListesiniAra();
+    }
+});
+
+// Çevrimdışı değişiklikler sunucuya gönderilince (geçici id'ler gerçek id olur) açık listeyi yenile
+window.addEventListener('kutu-senkron', function(e) {
+    const mesaj = e.detail;
+    const listeDegisti = mesaj.tur === 'senkronize-edildi' || (mesaj.tur === 'veri-guncellendi' && mesaj.adres === '/list');
+    if (listeDegisti && document.getElementById('listModal').classList.contains('show')) {
+        searchRecordsInModal();
+    }
+});
+
+document.addEventListener('DOMContentLoaded', function() {
+    clearForm();
+    initAutocomplete();
+});
@@ -0,0 +1,29 @@
+"""
+WSGI giriş noktası.
+
+Linux (gunicorn, çok süreçli):
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Windows (waitress, tek süreç + thread havuzu):
+    python wsgi.py
+"""
+import multiprocessing
+import os
+
+from app import create_app, pdf_havuzunu_isit, logger
+
+# PDF işlem havuzunun (spawn) çocukları ana modülü __mp_main__ olarak yeniden
+# import eder (parent_process() o sırada henüz None, süreç adı ise ayarlıdır);
+# uygulama ve veritabanı hazırlığı sadece ana süreçte yapılır.
+if multiprocessing.current_process().name == 'MainProcess':
+    app = create_app()
+
+if __name__ == '__main__':
+    from waitress import serve
+
+    # waitress tek süreçte çalışır; PDF işçileri istek gelmeden hazırlanır
+    pdf_havuzunu_isit()
+    host = os.environ.get('KUTU_HOST', '0.0.0.0')
+    port = int(os.environ.get('KUTU_PORT', 5000))
+    logger.info(f"waitress başlatılıyor: http://{host}:{port}")
+    serve(app, host=host, port=port, threads=int(os.environ.get('KUTU_THREADS', 8)))